@@ -75,6 +75,9 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "django.template.context_processors.debug",
+                # manhour: current_session_id/navbar_toggle_position,
+                # manning: active_count(뒤에 오므로 우선)과 근무지 선택지
+                "manhour.context_processors.active_session_status",
                 "manning.context_processors.active_session_status",
             ],
         },
@@ -152,13 +155,20 @@ WHITENOISE_MANIFEST_STRICT = False
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
-# Basic in-memory cache for dashboard API data
+# gunicorn 워커들이 함께 쓰는 파일 기반 캐시 (대시보드 API 데이터, 버전 카운터, 락)
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "manning-project-cache",
+        "BACKEND": "manhour.cache_backends.SQLiteCache",
+        "LOCATION": os.getenv("CACHE_SQLITE_PATH", str(BASE_DIR / "cache.sqlite3")),
+        "OPTIONS": {
+            "BUSY_TIMEOUT": 5,
+            "MAX_ENTRIES": 5000,
+        },
     }
 }
+# 테스트는 운영 캐시 파일을 지우지 않도록 전용 러너가 프로세스 메모리 캐시로 바꿈
+# (명령행 인자와 무관하게 테스트 러너를 거치는 모든 실행에 적용)
+TEST_RUNNER = "config.test_runner.IsolatedCacheTestRunner"
 
 
 # 세션 설정
@@ -0,0 +1,24 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+# 운영 SQLiteCache(cache.sqlite3) 대신 쓰는 테스트용 캐시
+TEST_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "manhour-tests",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    }
+}
+
+
+class IsolatedCacheTestRunner(DiscoverRunner):
+    """테스트 동안 CACHES를 프로세스 메모리 캐시로 바꿔 운영 캐시 파일을 건드리지 않습니다."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._cache_override = override_settings(CACHES=TEST_CACHES)
+        self._cache_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cache_override.disable()
+        super().teardown_test_environment(**kwargs)
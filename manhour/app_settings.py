@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from django.db import IntegrityError, transaction
+
+from .caching import VersionedRegistry
+from .models import AppSetting
+
+TASKMASTER_RETENTION_HOURS = 12
+DEFAULT_HISTORY_VISIBILITY_HOURS = 24
+DEFAULT_AUTO_ARCHIVE_HOURS = 12
+DEFAULT_WORKER_LIMIT_MH = 9.0
+
+# 다른 프로세스에서 저장한 값도 이 시간 안에는 반영되도록 짧게 유지
+APP_SETTINGS_CACHE_SECONDS = 30
+
+
+def _positive_int(value, default: int) -> int:
+    try:
+        return int(value) if value else default
+    except (TypeError, ValueError):
+        return default
+
+
+def _tenths_to_float(value, default: float) -> float:
+    try:
+        return (int(value) / 10.0) if value is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
+def _load_app_settings(site: str) -> dict:
+    """("", site) 범위의 AppSetting을 한 번에 읽어 타입이 정해진 값으로 변환합니다."""
+    common = {}
+    scoped = {}
+    for key, row_site, int_value in AppSetting.objects.filter(
+        site__in={"", site}
+    ).values_list("key", "site", "int_value"):
+        if row_site == "":
+            common[key] = int_value
+        if row_site == site:
+            scoped[key] = int_value
+
+    return {
+        "auto_archive_hours": _positive_int(
+            common.get("auto_archive_hours"), DEFAULT_AUTO_ARCHIVE_HOURS
+        ),
+        "history_visibility_hours": _positive_int(
+            common.get("history_visibility_hours"), DEFAULT_HISTORY_VISIBILITY_HOURS
+        ),
+        "taskmaster_retention_hours": _positive_int(
+            common.get("taskmaster_retention_hours"), TASKMASTER_RETENTION_HOURS
+        ),
+        "default_worker_limit_mh": _tenths_to_float(
+            scoped.get("default_worker_limit_mh_tenths"), DEFAULT_WORKER_LIMIT_MH
+        ),
+        "navbar_toggle_position": (
+            "right" if scoped.get("navbar_toggle_position") == 1 else "left"
+        ),
+    }
+
+
+_app_settings = VersionedRegistry(
+    "app_settings", _load_app_settings, ttl=APP_SETTINGS_CACHE_SECONDS
+)
+
+
+def get_app_settings(site: str = "") -> dict:
+    return _app_settings.get(site or "")
+
+
+def invalidate_app_settings() -> None:
+    _app_settings.invalidate()
+
+
+def set_app_setting(key: str, site: str = "", int_value: int | None = None) -> None:
+    AppSetting.objects.update_or_create(
+        key=key,
+        site=site,
+        defaults={"int_value": int_value},
+    )
+    invalidate_app_settings()
+
+
+def get_taskmaster_retention_hours() -> int:
+    return get_app_settings()["taskmaster_retention_hours"]
+
+
+def get_auto_archive_hours() -> int:
+    return get_app_settings()["auto_archive_hours"]
+
+
+def get_history_visibility_hours() -> int:
+    return get_app_settings()["history_visibility_hours"]
+
+
+def get_default_worker_limit_mh(workplace: str) -> float:
+    return get_app_settings(workplace)["default_worker_limit_mh"]
+
+
+def get_navbar_toggle_position(workplace: str) -> str:
+    return get_app_settings(workplace)["navbar_toggle_position"]
+
+
+def claim_watermark(key: str, site: str, now_ts: int, interval: int) -> bool:
+    """
+    (key, site) AppSetting에 둔 마지막 실행 시각을 조건부 UPDATE로 선점합니다.
+    여러 프로세스가 동시에 돌아도 interval 안에는 한 곳만 True를 받습니다.
+    """
+    claimed = AppSetting.objects.filter(
+        key=key,
+        site=site,
+        int_value__lte=now_ts - interval,
+    ).update(int_value=now_ts)
+    if claimed:
+        return True
+
+    if AppSetting.objects.filter(key=key, site=site).exists():
+        return False
+    try:
+        with transaction.atomic():
+            AppSetting.objects.create(key=key, site=site, int_value=now_ts)
+    except IntegrityError:
+        return False
+    return True
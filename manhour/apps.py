@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ManningConfig(AppConfig):
     name = "manhour"
+
+    def ready(self):
+        from . import signals  # noqa: F401
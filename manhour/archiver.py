@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .app_settings import claim_watermark, get_auto_archive_hours
+from .models import AppSetting, WorkSession
+from .session_status import invalidate_session_status
+
+ARCHIVE_INTERVAL_SECONDS = 60
+ARCHIVE_WATERMARK_KEY = "auto_archive_last_run"
+
+
+def _claim_archive_slot(workplace: str, now_ts: int, interval: int) -> bool:
+    return claim_watermark(ARCHIVE_WATERMARK_KEY, workplace, now_ts, interval)
+
+
+def archive_expired_sessions(workplace: str) -> int:
+    """생성 후 자동 보관 시간이 지난 활성 세션을 종료 처리합니다."""
+    now = timezone.now()
+    cutoff = now - timedelta(hours=get_auto_archive_hours())
+    archived = WorkSession.objects.filter(
+        is_active=True,
+        site=workplace,
+        created_at__lt=cutoff,
+    ).update(is_active=False, finished_at=now)
+    if archived:
+        # update()는 post_save를 보내지 않으므로 직접 무효화
+        invalidate_session_status(workplace)
+    return archived
+
+
+def _archive_due_key(workplace: str) -> str:
+    return f"archive:next_due:{workplace}"
+
+
+def archive_if_due(workplace: str, interval: int = ARCHIVE_INTERVAL_SECONDS) -> int:
+    """
+    요청 경로용 보관 처리: run_archiver가 돌고 있지 않아도 interval마다 한 번은
+    만료 세션이 정리되게 합니다. 다음 실행 시각을 cache에 두고 먼저 읽으므로
+    대부분의 요청은 쓰기 없이 지나가고, 시각이 된 경우에만 조건부 UPDATE를 합니다.
+    """
+    now_ts = int(time.time())
+    due_key = _archive_due_key(workplace)
+    if cache.get(due_key, 0) > now_ts:
+        return 0
+
+    last_run = (
+        AppSetting.objects.filter(key=ARCHIVE_WATERMARK_KEY, site=workplace)
+        .values_list("int_value", flat=True)
+        .first()
+    )
+    if last_run is not None and last_run > now_ts - interval:
+        cache.set(due_key, last_run + interval, last_run + interval - now_ts)
+        return 0
+
+    claimed = _claim_archive_slot(workplace, now_ts, interval)
+    cache.set(due_key, now_ts + interval, interval)
+    if not claimed:
+        return 0
+    return archive_expired_sessions(workplace)
+
+
+def run_archive_pass(
+    interval: int = ARCHIVE_INTERVAL_SECONDS, force: bool = False
+) -> dict[str, int]:
+    """
+    활성 세션이 있는 근무지마다 보관 처리를 한 번 실행합니다.
+    반환값: 이번에 실제로 처리한 근무지별 보관 건수
+    """
+    now_ts = int(time.time())
+    workplaces = (
+        WorkSession.objects.filter(is_active=True)
+        .values_list("site", flat=True)
+        .distinct()
+    )
+    results = {}
+    for workplace in sorted(set(workplaces)):
+        if not force and not _claim_archive_slot(workplace, now_ts, interval):
+            continue
+        results[workplace] = archive_expired_sessions(workplace)
+    return results
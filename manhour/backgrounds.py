@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlparse
+
+from django.db.utils import OperationalError, ProgrammingError
+
+from .caching import VersionedRegistry
+from .models import BackgroundImage
+
+
+def _extract_youtube_id(url: str) -> str:
+    if not url:
+        return ""
+
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+
+    if "youtu.be" in host:
+        return parsed.path.lstrip("/")
+
+    if "youtube.com" in host:
+        if parsed.path == "/watch":
+            return parse_qs(parsed.query).get("v", [""])[0]
+        if parsed.path.startswith("/embed/"):
+            return parsed.path.split("/", 2)[2]
+        if parsed.path.startswith("/shorts/"):
+            return parsed.path.split("/", 2)[2]
+
+    return ""
+
+
+def _build_youtube_embed_url(url: str) -> str:
+    video_id = _extract_youtube_id(url)
+    if not video_id:
+        return ""
+    return (
+        "https://www.youtube.com/embed/"
+        f"{video_id}?autoplay=1&mute=1&loop=1&playlist={video_id}"
+        "&controls=0&modestbranding=1&playsinline=1"
+    )
+
+
+def _resolve_background(record: BackgroundImage) -> dict:
+    image_url = ""
+    if record.image_file:
+        image_url = record.image_file.url
+    elif record.image_url:
+        image_url = record.image_url
+    return {
+        "image_url": image_url,
+        "youtube_embed_url": (
+            _build_youtube_embed_url(record.youtube_url) if record.youtube_url else ""
+        ),
+    }
+
+
+def _load_background_configs() -> dict | None:
+    """배경 설정 전체를 한 번에 읽어 key별로 URL까지 풀어 둡니다."""
+    try:
+        return {
+            record.key: _resolve_background(record)
+            for record in BackgroundImage.objects.all()
+        }
+    except (OperationalError, ProgrammingError):
+        # 마이그레이션 전에는 캐시하지 않고 기본값을 쓰도록 둠
+        return None
+
+
+_background_configs = VersionedRegistry("background_configs", _load_background_configs)
+
+
+def get_background_config(key: str, default_url: str = "") -> dict:
+    config = (_background_configs.get() or {}).get(key) or {}
+    return {
+        "image_url": config.get("image_url") or default_url,
+        "youtube_embed_url": config.get("youtube_embed_url", ""),
+    }
+
+
+def invalidate_background_configs() -> None:
+    _background_configs.invalidate()
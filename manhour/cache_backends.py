@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+CREATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS cache_entries ("
+    " key TEXT PRIMARY KEY,"
+    " value BLOB NOT NULL,"
+    " expires REAL"
+    ")"
+)
+
+
+class SQLiteCache(BaseCache):
+    """
+    여러 gunicorn 워커가 같은 파일을 공유하는 SQLite 캐시.
+
+    CACHES = {"default": {
+        "BACKEND": "manhour.cache_backends.SQLiteCache",
+        "LOCATION": "/path/to/cache.sqlite3",
+        "OPTIONS": {"BUSY_TIMEOUT": 5},
+    }}
+
+    add()와 incr()는 한 문장/즉시 쓰기 트랜잭션으로 처리되어 프로세스 사이에서도
+    원자적이므로 락(single-flight)과 버전 카운터에 그대로 쓸 수 있습니다.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._path = str(location)
+        options = params.get("OPTIONS", {})
+        self._busy_timeout = float(options.get("BUSY_TIMEOUT", 5))
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(CREATE_TABLE_SQL)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _dumps(value) -> bytes:
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def _cull(self, conn, now):
+        conn.execute(
+            "DELETE FROM cache_entries WHERE expires IS NOT NULL AND expires <= ?",
+            (now,),
+        )
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count > self._max_entries:
+            # 영구 항목(버전 카운터, timeout=None)은 지우면 무효화가 되돌려지므로 제외
+            if self._cull_frequency == 0:
+                conn.execute("DELETE FROM cache_entries WHERE expires IS NOT NULL")
+                return
+            # 만료가 가장 빠른 항목부터 1/cull_frequency 삭제
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                " SELECT key FROM cache_entries WHERE expires IS NOT NULL"
+                " ORDER BY expires LIMIT ?"
+                ")",
+                (count // self._cull_frequency,),
+            )
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM cache_entries"
+                " WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return default if row is None else pickle.loads(row[0])
+
+    def get_many(self, keys, version=None):
+        key_map = {
+            self.make_and_validate_key(key, version=version): key for key in keys
+        }
+        if not key_map:
+            return {}
+        placeholders = ", ".join("?" for _ in key_map)
+        rows = (
+            self._connection()
+            .execute(
+                f"SELECT key, value FROM cache_entries WHERE key IN ({placeholders})"
+                " AND (expires IS NULL OR expires > ?)",
+                (*key_map, time.time()),
+            )
+            .fetchall()
+        )
+        return {key_map[key]: pickle.loads(value) for key, value in rows}
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._set_rows([(key, self._dumps(value), self.get_backend_timeout(timeout))])
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        expires = self.get_backend_timeout(timeout)
+        self._set_rows(
+            [
+                (
+                    self.make_and_validate_key(key, version=version),
+                    self._dumps(v),
+                    expires,
+                )
+                for key, v in data.items()
+            ]
+        )
+        return []
+
+    def _set_rows(self, rows):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._cull(conn, time.time())
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires)"
+                " VALUES (?, ?, ?)",
+                rows,
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        # 키가 없거나 만료된 경우에만 쓰는 한 문장 upsert → 동시에 호출해도 한 곳만 성공
+        cursor = self._connection().execute(
+            "INSERT INTO cache_entries (key, value, expires) VALUES (?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE"
+            " SET value = excluded.value, expires = excluded.expires"
+            " WHERE cache_entries.expires IS NOT NULL AND cache_entries.expires <= ?",
+            (key, self._dumps(value), self.get_backend_timeout(timeout), now),
+        )
+        return cursor.rowcount == 1
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value FROM cache_entries"
+                " WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                raise ValueError("Key '%s' not found" % key)
+            new_value = pickle.loads(row[0]) + delta
+            conn.execute(
+                "UPDATE cache_entries SET value = ? WHERE key = ?",
+                (self._dumps(new_value), key),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return new_value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._connection().execute(
+            "UPDATE cache_entries SET expires = ?"
+            " WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (self.get_backend_timeout(timeout), key, time.time()),
+        )
+        return cursor.rowcount == 1
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = (
+            self._connection()
+            .execute(
+                "SELECT 1 FROM cache_entries"
+                " WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._connection().execute(
+            "DELETE FROM cache_entries WHERE key = ?", (key,)
+        )
+        return cursor.rowcount == 1
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if keys:
+            placeholders = ", ".join("?" for _ in keys)
+            self._connection().execute(
+                f"DELETE FROM cache_entries WHERE key IN ({placeholders})", keys
+            )
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entries")
+
+    def close(self, **kwargs):
+        # 요청마다 다시 열지 않도록 스레드별 연결은 유지합니다.
+        pass
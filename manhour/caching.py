@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import transaction
+
+# 버전 카운터가 프로세스별 캐시(LocMem 등)에만 있으면 다른 워커의 invalidate()를
+# 볼 수 없으므로, ttl을 주지 않은 레지스트리도 이 시간이 지나면 다시 읽습니다.
+DEFAULT_REGISTRY_TTL_SECONDS = 300
+
+
+class VersionedRegistry:
+    """
+    자주 읽고 드물게 바뀌는 DB 데이터를 프로세스 메모리에 들고 있는 레지스트리.
+
+    버전 번호만 공용 cache에 두고, 조회할 때 버전이 바뀌었으면(또는 ttl이 지나면)
+    loader를 다시 호출합니다. 데이터를 바꾸는 쪽은 invalidate()만 부르면 됩니다.
+    ttl을 생략하면 DEFAULT_REGISTRY_TTL_SECONDS를 씁니다.
+    """
+
+    def __init__(self, name: str, loader, ttl: float | None = None):
+        self.version_key = f"registry:{name}:version"
+        self.loader = loader
+        self.ttl = DEFAULT_REGISTRY_TTL_SECONDS if ttl is None else ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _version_keys(self, args) -> list[str]:
+        if not args:
+            return [self.version_key]
+        suffix = ":".join(str(arg) for arg in args)
+        return [self.version_key, f"{self.version_key}:{suffix}"]
+
+    def current_version(self, *args):
+        """
+        전체 버전(인자 없음) 또는 (전체 버전, 인자별 버전) 쌍을 돌려줍니다.
+        인자별 버전은 invalidate(*args)로 해당 항목만 무효화할 때 쓰입니다.
+        """
+        keys = self._version_keys(args)
+        if len(keys) == 1:
+            return cache.get(keys[0], 0)
+        values = cache.get_many(keys)
+        return tuple(values.get(key, 0) for key in keys)
+
+    def get(self, *args):
+        version = self.current_version(*args)
+        entry = self._entries.get(args)
+        if entry is not None:
+            entry_version, loaded_at, value = entry
+            fresh = time.monotonic() - loaded_at < self.ttl
+            if entry_version == version and fresh:
+                return value
+
+        value = self.loader(*args)
+        if value is not None:
+            with self._lock:
+                self._entries[args] = (version, time.monotonic(), value)
+        return value
+
+    @staticmethod
+    def _bump(version_key: str) -> None:
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, None)
+
+    def invalidate(self, *args) -> None:
+        """인자를 주면 그 항목만, 없으면 전체를 무효화합니다."""
+        version_key = self._version_keys(args)[-1]
+        with self._lock:
+            if args:
+                self._entries.pop(args, None)
+            else:
+                self._entries.clear()
+        self._bump(version_key)
+        # 커밋 전에 다른 프로세스가 옛 데이터를 새 버전으로 읽어 갔을 수 있으므로
+        # 커밋 후 한 번 더 올립니다. (트랜잭션 밖이면 즉시 실행)
+        transaction.on_commit(lambda: self._bump(version_key))
+
+
+def _lock_key(name: str) -> str:
+    return f"lock:{name}"
+
+
+def acquire_lock(name: str, timeout: float) -> str | None:
+    """cache.add로 잡는 프로세스 간 락. 성공하면 해제용 토큰을 돌려줍니다."""
+    token = uuid.uuid4().hex
+    return token if cache.add(_lock_key(name), token, timeout) else None
+
+
+def release_lock(name: str, token: str) -> None:
+    # timeout으로 풀린 뒤 다른 프로세스가 잡은 락은 지우지 않음
+    if cache.get(_lock_key(name)) == token:
+        cache.delete(_lock_key(name))
+
+
+def is_locked(name: str) -> bool:
+    return cache.get(_lock_key(name)) is not None
+
+
+@contextmanager
+def single_flight(name: str, timeout: float = 60):
+    """
+    같은 name의 작업을 한 번에 한 프로세스만 수행하게 합니다.
+
+        with single_flight("key") as leader:
+            if leader:
+                ...  # 갱신
+    """
+    token = acquire_lock(name, timeout)
+    try:
+        yield token is not None
+    finally:
+        if token is not None:
+            release_lock(name, token)
+
+
+def wait_for_value(key: str, timeout: float, interval: float = 0.1):
+    """다른 프로세스가 갱신 중인 값을 timeout까지 기다립니다. 끝내 없으면 None."""
+    deadline = time.monotonic() + timeout
+    while True:
+        value = cache.get(key)
+        if value is not None or time.monotonic() >= deadline:
+            return value
+        time.sleep(interval)
@@ -1,7 +1,7 @@
 # 모든 HTML에서 “가동 중/대기 중” 배지가 항상 보이도록
 # navbar_base.html에서도 조건을 단순화했어요.
 
-from .models import AppSetting, WorkSession
+from .session_status import get_session_status
 from .workplaces import get_workplace_label_map, normalize_workplace
 
 WORKPLACE_SESSION_KEY = "workplace"
@@ -31,23 +31,4 @@ def _get_current_workplace(request):
 
 def active_session_status(request):
     workplace = _get_current_workplace(request)
-    if not workplace:
-        active_count = 0
-        current_session = None
-    else:
-        active_qs = WorkSession.objects.filter(
-            is_active=True,
-            site=workplace,
-        )
-        active_count = active_qs.count()
-        current_session = active_qs.order_by("-created_at").first()
-    navbar_value = (
-        AppSetting.objects.filter(key="navbar_toggle_position", site=workplace)
-        .values_list("int_value", flat=True)
-        .first()
-    )
-    return {
-        "active_count": active_count,
-        "session": current_session,
-        "navbar_toggle_position": "right" if navbar_value == 1 else "left",
-    }
+    return get_session_status(workplace)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .models import IndicatorSample
+
+INDICATOR_HISTORY_RETENTION_DAYS = 90
+
+
+def _latest_values(series: list[str]) -> dict[str, float]:
+    """시계열별 마지막 값을 한 번의 조회로 읽습니다 (series, recorded_at 인덱스 사용)."""
+    latest_id = (
+        IndicatorSample.objects.filter(series=OuterRef("series"))
+        .order_by("-recorded_at", "-id")
+        .values("id")[:1]
+    )
+    return dict(
+        IndicatorSample.objects.filter(
+            series__in=series, id=Subquery(latest_id)
+        ).values_list("series", "value")
+    )
+
+
+def record_indicator_samples(
+    values: dict[str, float | None], recorded_at: datetime | None = None
+) -> int:
+    """
+    series → 값 중 마지막 기록과 달라진 것만 한 번의 INSERT로 추가합니다.
+    (None 값은 건너뜀) 반환값: 추가한 행 수
+    """
+    recorded_at = recorded_at or timezone.now()
+    values = {series: value for series, value in values.items() if value is not None}
+    if not values:
+        return 0
+    latest = _latest_values(list(values))
+    samples = [
+        IndicatorSample(series=series, recorded_at=recorded_at, value=value)
+        for series, value in values.items()
+        if latest.get(series) != value
+    ]
+    IndicatorSample.objects.bulk_create(samples)
+    return len(samples)
+
+
+def get_indicator_history(
+    series: list[str],
+    since: datetime,
+    points: int,
+    until: datetime | None = None,
+) -> dict[str, list[dict]]:
+    """
+    여러 시계열을 한 번의 구간 조회로 읽어 points개 구간 평균으로 줄입니다.
+    반환값: series → [{"label": "HH:MM", "value": 평균}] (값이 없는 구간은 생략)
+
+    값이 바뀔 때만 저장하므로 since 직전의 마지막 샘플도 함께 읽어 첫 구간에 넣습니다.
+    """
+    until = until or timezone.now()
+    width = max((until - since) / max(points, 1), timedelta(seconds=1))
+    buckets = defaultdict(dict)
+    carried_id = (
+        IndicatorSample.objects.filter(series=OuterRef("series"), recorded_at__lt=since)
+        .order_by("-recorded_at", "-id")
+        .values("id")[:1]
+    )
+    rows = (
+        IndicatorSample.objects.filter(series__in=series, recorded_at__lte=until)
+        .filter(Q(recorded_at__gte=since) | Q(id=Subquery(carried_id)))
+        .order_by("recorded_at")
+        .values_list("series", "recorded_at", "value")
+    )
+    for name, recorded_at, value in rows:
+        recorded_at = max(recorded_at, since)
+        index = min(int((recorded_at - since) / width), points - 1)
+        bucket = buckets[name].setdefault(index, [recorded_at, 0.0, 0])
+        bucket[0] = recorded_at
+        bucket[1] += value
+        bucket[2] += 1
+
+    return {
+        name: [
+            {
+                "label": timezone.localtime(last_at).strftime("%H:%M"),
+                "value": round(total / count, 4),
+            }
+            for _index, (last_at, total, count) in sorted(buckets[name].items())
+        ]
+        for name in series
+    }
+
+
+def prune_indicator_samples(
+    retention_days: int = INDICATOR_HISTORY_RETENTION_DAYS,
+) -> int:
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = IndicatorSample.objects.filter(recorded_at__lt=cutoff).delete()
+    return deleted
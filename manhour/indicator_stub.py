@@ -0,0 +1,156 @@
+"""
+지표 외부 API(환율/EIA/CheckWX/Open-Meteo)를 흉내 내는 로컬 스텁 서버.
+테스트와 tools/bench_indicators.py에서 네트워크 없이 조회 계층을 검증/측정할 때 씁니다.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.utils import timezone
+
+
+def _forecast_payload():
+    start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    times = [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(24)]
+    return {
+        "hourly": {
+            "time": times,
+            "wind_speed_10m": [8.0] * 24,
+            "wind_gusts_10m": [14.0] * 24,
+            "precipitation_probability": [10] * 24,
+            "visibility": [10000] * 24,
+            "cloud_cover": [40] * 24,
+        }
+    }
+
+
+STUB_ROUTES = {
+    "/v6/": lambda: {
+        "conversion_rates": {"KRW": 1385.2},
+        "time_last_update_utc": "Mon, 19 Oct 2026 00:00:01 +0000",
+    },
+    "/v2/petroleum/": lambda: {
+        "response": {"data": [{"period": "2026-10-16", "value": "71.42"}]}
+    },
+    "/metar/": lambda: {
+        "data": [
+            {
+                "icao": "RKSI",
+                "station": {"name": "Incheon Intl"},
+                "observed": "2026-10-19T00:00:00",
+                "raw_text": "RKSI 190000Z 32008KT 9999 FEW030 14/06 Q1021",
+                "flight_category": "VFR",
+                "temperature": {"celsius": 14},
+                "wind": {"direction": 320, "speed_kts": 8},
+                "barometer": {"hpa": 1021},
+                "visibility": {"meters": "10000"},
+            }
+        ]
+    },
+    "/v1/forecast": _forecast_payload,
+}
+
+
+class IndicatorStubServer:
+    """
+    with IndicatorStubServer(delay=0.2) as stub:
+        with override_settings(**stub.settings_overrides()):
+            refresh_due_indicators(force=True)
+
+    delay: 응답마다 지연(초), failures: 경로 접두어별로 먼저 돌려줄 오류 상태 코드 목록
+    """
+
+    def __init__(self, delay: float = 0.0, failures: dict | None = None):
+        self.delay = delay
+        self.failures = {
+            prefix: list(codes) for prefix, codes in (failures or {}).items()
+        }
+        self.request_count = 0
+        self.connection_count = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def settings_overrides(self) -> dict:
+        return {
+            "EXCHANGE_RATE_API_BASE": self.base_url,
+            "EIA_API_BASE": self.base_url,
+            "CHECKWX_API_BASE": self.base_url,
+            "OPEN_METEO_API_BASE": self.base_url,
+            "EXCHANGE_RATE_API_KEY": "stub",
+            "EIA_API_KEY": "stub",
+            "CHECKWX_API_KEY": "stub",
+        }
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive 재사용을 확인하려면 HTTP/1.1이어야 함
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connection_count += 1
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.request_count += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                route = next(
+                    (prefix for prefix in STUB_ROUTES if self.path.startswith(prefix)),
+                    None,
+                )
+                status, payload = 404, {}
+                if route:
+                    with stub._lock:
+                        codes = stub.failures.get(route)
+                        failed_status = codes.pop(0) if codes else None
+                    if failed_status:
+                        status = failed_status
+                    else:
+                        status, payload = 200, STUB_ROUTES[route]()
+
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,593 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .caching import acquire_lock, is_locked, release_lock, wait_for_value
+from .indicator_history import get_indicator_history, record_indicator_samples
+
+logger = logging.getLogger(__name__)
+
+FINANCIAL_CACHE_KEY = "financial_indicators:v1"
+CHECKWX_CACHE_KEY = "checkwx:metar:v1"
+WEATHER_FORECAST_CACHE_KEY = "weather_forecast:v1"
+
+# 갱신 실패가 이어져도 이 시간까지는 마지막 값을 계속 보여줍니다.
+INDICATOR_MAX_STALE_SECONDS = 24 * 60 * 60
+INDICATOR_REFRESH_LOCK_SECONDS = 60
+# 값이 아예 없을 때 다른 프로세스의 갱신을 기다리는 최대 시간
+INDICATOR_COLD_WAIT_SECONDS = 3
+WEATHER_FORECAST_REFRESH_SECONDS = 15 * 60
+FINANCIAL_REFRESH_SECONDS = 30 * 60
+FINANCIAL_HISTORY_HOURS = 24
+# 한 번의 갱신 주기 전체(모든 지표 병렬 조회)에 허용하는 시간
+INDICATOR_FETCH_DEADLINE_SECONDS = 20
+INDICATOR_FETCH_WORKERS = 6
+
+# 스텁 서버로 오프라인 테스트/벤치마크할 수 있도록 settings로 바꿀 수 있는 기본 주소
+DEFAULT_API_BASES = {
+    "EXCHANGE_RATE_API_BASE": "https://v6.exchangerate-api.com",
+    "EIA_API_BASE": "https://api.eia.gov",
+    "CHECKWX_API_BASE": "https://api.checkwx.com",
+    "OPEN_METEO_API_BASE": "https://api.open-meteo.com",
+}
+
+WEATHER_AIRPORTS = {
+    "RKSI": {
+        "name": "Incheon Airport",
+        "lat": 37.4602,
+        "lon": 126.4407,
+    },
+    "RKSS": {
+        "name": "Gimpo Airport",
+        "lat": 37.5583,
+        "lon": 126.7906,
+    },
+}
+DEFAULT_WEATHER_AIRPORT = "RKSI"
+
+
+def _parse_float(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _api_base(name):
+    return getattr(settings, name, DEFAULT_API_BASES[name]).rstrip("/")
+
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    모든 지표 조회가 함께 쓰는 Session: 호스트별 연결을 재사용(keep-alive)하고,
+    연결 오류/429/5xx는 지수 백오프로 재시도합니다.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET"}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=len(DEFAULT_API_BASES),
+                    pool_maxsize=INDICATOR_FETCH_WORKERS,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
+# -----------------------------------------------------------
+# 외부 API 호출 (실패 시 None → 기존 캐시 유지)
+# -----------------------------------------------------------
+def _fetch_exchange_rate_usd_krw():
+    api_key = getattr(settings, "EXCHANGE_RATE_API_KEY", "")
+    if not api_key:
+        return None
+
+    url = f"{_api_base('EXCHANGE_RATE_API_BASE')}/v6/{api_key}/latest/USD"
+
+    try:
+        response = get_http_session().get(url, timeout=6)
+        if not response.ok:
+            return None
+        payload = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    rates = payload.get("conversion_rates", {}) if payload else {}
+    rate = _parse_float(rates.get("KRW"))
+    return {
+        "value": rate,
+        "as_of": payload.get("time_last_update_utc"),
+    }
+
+
+def _fetch_eia_spot_price(product):
+    api_key = getattr(settings, "EIA_API_KEY", "")
+    if not api_key:
+        return None
+
+    url = f"{_api_base('EIA_API_BASE')}/v2/petroleum/pri/spt/data/"
+    end = timezone.localdate()
+    start = end - timedelta(days=10)
+
+    try:
+        response = get_http_session().get(
+            url,
+            params={
+                "api_key": api_key,
+                "frequency": "daily",
+                "data[0]": "value",
+                "facets[product][]": product,
+                "start": start.strftime("%Y-%m-%d"),
+                "end": end.strftime("%Y-%m-%d"),
+                "sort[0][column]": "period",
+                "sort[0][direction]": "desc",
+                "offset": 0,
+                "length": 1,
+            },
+            timeout=6,
+        )
+        if not response.ok:
+            return None
+        payload = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    data = payload.get("response", {}).get("data", []) if payload else []
+    if not data:
+        return None
+
+    item = data[0]
+    value = _parse_float(item.get("value"))
+    return {
+        "value": value,
+        "as_of": item.get("period"),
+    }
+
+
+def _fetch_eia_wti():
+    return _fetch_eia_spot_price("EPCWTI")
+
+
+def _fetch_eia_jet_fuel():
+    return _fetch_eia_spot_price("EPJK")
+
+
+def _fetch_checkwx_metar():
+    api_key = getattr(settings, "CHECKWX_API_KEY", "")
+    if not api_key:
+        return []
+
+    stations = getattr(settings, "CHECKWX_STATIONS", "RKSI,RKSS")
+    stations = ",".join(
+        [code.strip().upper() for code in stations.split(",") if code.strip()]
+    )
+    if not stations:
+        return []
+
+    url = f"{_api_base('CHECKWX_API_BASE')}/metar/{stations}/decoded"
+
+    try:
+        response = get_http_session().get(
+            url,
+            headers={"X-API-Key": api_key},
+            timeout=6,
+        )
+        if not response.ok:
+            return None
+        payload = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    data = payload.get("data", []) if payload else []
+    results = []
+    for item in data:
+        wind_dir = item.get("wind", {}).get("direction")
+        wind_speed = item.get("wind", {}).get("speed_kts")
+        pressure_hpa = item.get("barometer", {}).get("hpa") or item.get(
+            "altimeter", {}
+        ).get("hpa")
+
+        results.append(
+            {
+                "icao": item.get("icao"),
+                "station": item.get("station", {}).get("name"),
+                "observed": item.get("observed"),
+                "raw_text": item.get("raw_text"),
+                "flight_category": item.get("flight_category"),
+                "temp_c": item.get("temperature", {}).get("celsius"),
+                "wind": wind_dir and wind_speed and f"{wind_dir}° {wind_speed}kt",
+                "wind_dir": wind_dir,
+                "wind_speed": wind_speed,
+                "pressure_hpa": pressure_hpa,
+                "visibility": item.get("visibility", {}).get("meters"),
+            }
+        )
+    return results
+
+
+def _fetch_weather_forecast(airport_code):
+    """
+    Open-Meteo API 호출: 시간별 원본(hourly)만 저장하고,
+    현재 시각 기준 8시간 구간은 응답할 때 잘라냅니다.
+    """
+    airport = WEATHER_AIRPORTS[airport_code]
+    params = {
+        "latitude": airport["lat"],
+        "longitude": airport["lon"],
+        "timezone": "Asia/Seoul",
+        "forecast_days": 1,
+        "wind_speed_unit": "kn",
+        "hourly": (
+            "wind_speed_10m,"
+            "wind_gusts_10m,"
+            "precipitation_probability,"
+            "visibility,"
+            "cloud_cover"
+        ),
+    }
+
+    try:
+        response = get_http_session().get(
+            f"{_api_base('OPEN_METEO_API_BASE')}/v1/forecast",
+            params=params,
+            timeout=10,
+        )
+        if not response.ok:
+            return None
+        payload = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+    return payload.get("hourly", {}) if payload else None
+
+
+def build_forecast_response(hourly, airport_code):
+    """
+    프론트 전달용 데이터 변환
+    """
+    airport = WEATHER_AIRPORTS[airport_code]
+    times = hourly.get("time", [])
+
+    wind_speed = hourly.get("wind_speed_10m", [])
+    wind_gust = hourly.get("wind_gusts_10m", [])
+    rain_prob = hourly.get("precipitation_probability", [])
+    visibility = hourly.get("visibility", [])
+    cloud_cover = hourly.get("cloud_cover", [])
+
+    labels = []
+    winds = []
+    gusts = []
+    rains = []
+    visibilities = []
+    clouds = []
+
+    now_local = timezone.localtime().replace(minute=0, second=0, microsecond=0)
+
+    start_index = 0
+
+    for i, time_text in enumerate(times):
+        try:
+            forecast_time = datetime.strptime(time_text, "%Y-%m-%dT%H:%M")
+            forecast_time = timezone.make_aware(
+                forecast_time,
+                timezone.get_current_timezone(),
+            )
+
+            if forecast_time >= now_local:
+                start_index = i
+                break
+        except ValueError:
+            continue
+
+    end_index = min(start_index + 8, len(times))
+
+    for i in range(start_index, end_index):
+        hour = times[i].split("T")[1][:2]
+
+        labels.append(f"{hour}시")
+        winds.append(round(float(wind_speed[i]), 1))
+        gusts.append(round(float(wind_gust[i]), 1))
+        rains.append(int(rain_prob[i]))
+        visibilities.append(int(visibility[i]))
+        clouds.append(int(cloud_cover[i]))
+
+    return {
+        "city": airport["name"],
+        "hours": labels,
+        "wind_speeds": winds,
+        "wind_gusts": gusts,
+        "rain_probs": rains,
+        "visibility": visibilities,
+        "cloud_cover": clouds,
+    }
+
+
+# -----------------------------------------------------------
+# 캐시 갱신 (stale-while-revalidate)
+# -----------------------------------------------------------
+def _weather_cache_key(airport_code):
+    return f"{WEATHER_FORECAST_CACHE_KEY}:{airport_code}"
+
+
+FINANCIAL_INDICATORS = ("usd_krw", "wti", "jet_fuel")
+
+
+def _financial_cache_key(name):
+    return f"{FINANCIAL_CACHE_KEY}:{name}"
+
+
+def indicator_jobs() -> dict[str, tuple]:
+    """캐시 키 → (조회 함수, 갱신 주기 초)"""
+    jobs = {
+        CHECKWX_CACHE_KEY: (
+            _fetch_checkwx_metar,
+            getattr(settings, "CHECKWX_CACHE_SECONDS", 600),
+        ),
+    }
+    # 환율/유가는 따로 갱신해야 한 쪽 실패가 다른 값을 막지 않고 병렬로 조회됨
+    financial_fetchers = {
+        "usd_krw": _fetch_exchange_rate_usd_krw,
+        "wti": _fetch_eia_wti,
+        "jet_fuel": _fetch_eia_jet_fuel,
+    }
+    for name in FINANCIAL_INDICATORS:
+        jobs[_financial_cache_key(name)] = (
+            financial_fetchers[name],
+            FINANCIAL_REFRESH_SECONDS,
+        )
+    for code in WEATHER_AIRPORTS:
+        jobs[_weather_cache_key(code)] = (
+            lambda code=code: _fetch_weather_forecast(code),
+            WEATHER_FORECAST_REFRESH_SECONDS,
+        )
+    return jobs
+
+
+def _indicator_samples(key: str, data) -> dict[str, float | None]:
+    """갱신된 지표 값에서 시계열(IndicatorSample)로 남길 값을 뽑습니다."""
+    if key == CHECKWX_CACHE_KEY:
+        samples = {}
+        for station in data:
+            icao = station.get("icao")
+            if icao:
+                samples[f"metar:{icao}:temp_c"] = _parse_float(station.get("temp_c"))
+                samples[f"metar:{icao}:wind_kt"] = _parse_float(
+                    station.get("wind_speed")
+                )
+        return samples
+    for name in FINANCIAL_INDICATORS:
+        if key == _financial_cache_key(name):
+            return {name: _parse_float(data.get("value"))}
+    # 예보는 미래 값이라 시계열로 남기지 않음
+    return {}
+
+
+def _entry_age(entry) -> float | None:
+    if not entry:
+        return None
+    return max(0.0, time.time() - entry["fetched_at"])
+
+
+def refresh_indicator(key: str) -> bool | None:
+    """
+    외부 API를 호출해 캐시를 갱신합니다. 같은 키는 한 프로세스만 갱신하며,
+    다른 곳에서 이미 갱신 중이면 호출하지 않고 None을 돌려줍니다.
+    실패하면 기존 값을 그대로 두고 False를 돌려줍니다.
+    """
+    refreshed, data = _claim_and_fetch(key)
+    if refreshed:
+        record_indicator_samples(_indicator_samples(key, data))
+    return refreshed
+
+
+def _claim_and_fetch(key: str) -> tuple[bool | None, object | None]:
+    token = acquire_lock(key, INDICATOR_REFRESH_LOCK_SECONDS)
+    if token is None:
+        return None, None
+    try:
+        data = _refresh_locked(key)
+    finally:
+        release_lock(key, token)
+    return data is not None, data
+
+
+def _refresh_locked(key: str):
+    """외부 API 값을 캐시에 저장하고 돌려줍니다 (실패 시 None, DB는 건드리지 않음)."""
+    fetcher, _interval = indicator_jobs()[key]
+    try:
+        data = fetcher()
+    except Exception:
+        logger.exception("indicator refresh failed: %s", key)
+        data = None
+    if data is not None:
+        cache.set(
+            key,
+            {"data": data, "fetched_at": time.time()},
+            INDICATOR_MAX_STALE_SECONDS,
+        )
+    return data
+
+
+def refresh_due_indicators(
+    force: bool = False, deadline: float = INDICATOR_FETCH_DEADLINE_SECONDS
+) -> dict[str, bool | None]:
+    """
+    갱신 주기가 지난 지표를 스레드 풀에서 병렬로 갱신합니다.
+    deadline 안에 끝나지 않은 지표는 False로 보고하고 기다리지 않습니다
+    (해당 스레드는 요청 timeout 안에 끝나면 캐시를 그대로 채움).
+    반환값: 키별 성공 여부 (다른 프로세스가 갱신 중이면 None)
+    """
+    jobs = indicator_jobs()
+    entries = cache.get_many(list(jobs))
+    due = [
+        key
+        for key, (_fetcher, interval) in jobs.items()
+        if force
+        or _entry_age(entries.get(key)) is None
+        or _entry_age(entries.get(key)) >= interval
+    ]
+    if not due:
+        return {}
+
+    pool = ThreadPoolExecutor(
+        max_workers=min(len(due), INDICATOR_FETCH_WORKERS),
+        thread_name_prefix="indicator-refresh",
+    )
+    try:
+        futures = {pool.submit(_claim_and_fetch, key): key for key in due}
+        done, not_done = wait(futures, timeout=deadline)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # 조회는 스레드에서, 시계열 저장은 호출한 스레드에서 한 번에 (DB 연결을 늘리지 않음)
+    results = {}
+    samples = {}
+    for future in done:
+        key = futures[future]
+        results[key], data = future.result()
+        if results[key]:
+            samples.update(_indicator_samples(key, data))
+    record_indicator_samples(samples)
+    for future in not_done:
+        logger.warning("indicator refresh timed out: %s", futures[future])
+        results[futures[future]] = False
+    return results
+
+
+def _refresh_in_background(key: str) -> bool:
+    # 락은 요청 스레드에서 잡아, 스레드가 시작되기 전에 들어온 요청도 중복 갱신하지 않게 함
+    token = acquire_lock(key, INDICATOR_REFRESH_LOCK_SECONDS)
+    if token is None:
+        return False
+
+    def run():
+        try:
+            data = _refresh_locked(key)
+            if data is not None:
+                record_indicator_samples(_indicator_samples(key, data))
+        finally:
+            release_lock(key, token)
+            connection.close()
+
+    threading.Thread(target=run, daemon=True).start()
+    return True
+
+
+def _read_entry(key: str):
+    """캐시 항목을 읽고, 갱신 주기가 지났으면 백그라운드 갱신을 겁니다."""
+    entry = cache.get(key)
+    age = _entry_age(entry)
+    _fetcher, interval = indicator_jobs()[key]
+    if (age is None or age >= interval) and getattr(
+        settings, "INDICATOR_BACKGROUND_REFRESH", True
+    ):
+        _refresh_in_background(key)
+    return entry
+
+
+def indicator_etag(key: str, *parts) -> str | None:
+    """
+    마지막 갱신 시각으로 만든 약한 ETag (값이 없으면 None → 조건부 응답 안 함).
+    age_seconds만 다른 응답은 같은 것으로 보므로 W/ 접두어를 붙입니다.
+    304 응답에서도 갱신 주기 검사는 그대로 이뤄집니다.
+    """
+    entry = _read_entry(key)
+    if entry is None:
+        return None
+    raw = ":".join(str(part) for part in (key, entry["fetched_at"], *parts))
+    return f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+
+def get_indicator(key: str) -> tuple[object | None, float | None]:
+    """
+    캐시된 값을 외부 API를 기다리지 않고 바로 돌려줍니다: (data, age 초).
+    갱신 주기가 지났으면 백그라운드 갱신을 한 번만 걸고 이전 값을 응답하며,
+    값이 아예 없을 때만 진행 중인 갱신을 잠시 기다립니다.
+    (refresh_indicators 명령이 돌고 있으면 보통 여기까지 오지 않습니다)
+    """
+    entry = _read_entry(key)
+    age = _entry_age(entry)
+    if entry is None and is_locked(key):
+        entry = wait_for_value(key, INDICATOR_COLD_WAIT_SECONDS)
+        age = _entry_age(entry)
+    if entry is None:
+        return None, None
+    return entry["data"], round(age)
+
+
+def get_checkwx_metar():
+    return get_indicator(CHECKWX_CACHE_KEY)
+
+
+def get_financial_indicators():
+    """환율/유가 묶음(최근 24시간 추이 포함)과 그중 가장 오래된 값의 경과 시간"""
+    indicators = {}
+    ages = []
+    for name in FINANCIAL_INDICATORS:
+        data, age = get_indicator(_financial_cache_key(name))
+        indicators[name] = data
+        if age is not None:
+            ages.append(age)
+    if not ages:
+        return None, None
+    history = get_indicator_history(
+        list(FINANCIAL_INDICATORS),
+        since=timezone.now() - timedelta(hours=FINANCIAL_HISTORY_HOURS),
+        points=getattr(settings, "FINANCIAL_HISTORY_MAX_POINTS", 48),
+    )
+    indicators["history"] = history
+    indicators["usd_krw_history"] = history["usd_krw"]
+    return indicators, max(ages)
+
+
+def get_weather_forecast(airport_code):
+    hourly, age = get_indicator(_weather_cache_key(airport_code))
+    if hourly is None:
+        return None, None
+    return build_forecast_response(hourly, airport_code), age
+
+
+def financial_indicators_etag() -> str | None:
+    tags = [indicator_etag(_financial_cache_key(name)) for name in FINANCIAL_INDICATORS]
+    if not any(tags):
+        return None
+    raw = ":".join(tag or "-" for tag in tags)
+    return f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+
+def weather_forecast_etag(airport_code) -> str | None:
+    # 응답은 현재 시각부터 8시간을 잘라 보내므로 시(hour)가 바뀌면 새 ETag
+    return indicator_etag(
+        _weather_cache_key(airport_code), timezone.localtime().strftime("%Y%m%d%H")
+    )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from manhour.taskmasters import TASKMASTER_PURGE_CHUNK_SIZE, purge_expired_taskmasters
+
+
+class Command(BaseCommand):
+    help = (
+        "보관 기간이 지난 마스터 데이터(TaskMaster)를 구간별로 삭제합니다. "
+        "화면에서는 정리하지 않으므로 cron 등으로 주기 실행하세요 "
+        "(예: */10 * * * * manage.py purge_taskmasters)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=TASKMASTER_PURGE_CHUNK_SIZE,
+            help="한 번에 처리할 PK 구간 크기",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 대상 건수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        def report(last_id, max_id, total):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"id {last_id}/{max_id} 처리, 누적 {total}건")
+
+        total = purge_expired_taskmasters(
+            chunk_size=max(1, options["chunk_size"]),
+            dry_run=dry_run,
+            progress=report,
+        )
+        label = "삭제 대상" if dry_run else "삭제"
+        self.stdout.write(f"{label}: {total}건")
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from manhour.indicator_history import prune_indicator_samples
+from manhour.indicators import refresh_due_indicators
+
+INDICATOR_POLL_SECONDS = 60
+
+
+class Command(BaseCommand):
+    help = "METAR/예보/환율 등 대시보드 지표를 주기적으로 갱신해 캐시에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=INDICATOR_POLL_SECONDS,
+            help="갱신 대상 확인 간격(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="한 번만 실행하고 종료",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="갱신 주기와 관계없이 모든 지표를 갱신",
+        )
+
+    def handle(self, *args, **options):
+        interval = max(1, options["interval"])
+        force = options["force"]
+        while True:
+            results = refresh_due_indicators(force=force)
+            for key, ok in results.items():
+                if ok is False:
+                    self.stderr.write(f"{key}: 갱신 실패, 이전 값 유지")
+                elif options["verbosity"] > 1:
+                    self.stdout.write(
+                        f"{key}: {'갱신' if ok else '다른 프로세스가 갱신 중'}"
+                    )
+            pruned = prune_indicator_samples()
+            if pruned and options["verbosity"] > 1:
+                self.stdout.write(f"보관 기간이 지난 지표 기록 {pruned}건 삭제")
+            if options["once"]:
+                return
+            force = False
+            time.sleep(interval)
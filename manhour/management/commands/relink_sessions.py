@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from manhour.session_links import relink_sessions
+
+
+class Command(BaseCommand):
+    help = "manhour/manning 세션의 link_key를 다시 계산하고 빠진 연결을 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=300,
+            help="반복 실행 간격(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="한 번만 실행하고 종료",
+        )
+
+    def handle(self, *args, **options):
+        interval = max(1, options["interval"])
+        while True:
+            result = relink_sessions()
+            self.stdout.write(
+                "키 갱신: manhour {manhour_keys}건, manning {manning_keys}건 / "
+                "연결 {linked}건".format(**result)
+            )
+            if options["once"]:
+                return
+            time.sleep(interval)
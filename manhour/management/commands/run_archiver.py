@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from manhour.archiver import ARCHIVE_INTERVAL_SECONDS, run_archive_pass
+
+
+class Command(BaseCommand):
+    help = "만료된 작업 세션을 주기적으로 자동 보관합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=ARCHIVE_INTERVAL_SECONDS,
+            help="근무지별 최소 실행 간격(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="한 번만 실행하고 종료",
+        )
+
+    def handle(self, *args, **options):
+        interval = max(1, options["interval"])
+        while True:
+            results = run_archive_pass(interval=interval)
+            for workplace, archived in results.items():
+                if archived:
+                    self.stdout.write(f"{workplace or '(공통)'}: {archived}건 보관")
+            if options["once"]:
+                return
+            time.sleep(interval)
@@ -0,0 +1,46 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+def dedupe_taskmasters(apps, schema_editor):
+    TaskMaster = apps.get_model("manhour", "TaskMaster")
+    WorkItem = apps.get_model("manhour", "WorkItem")
+
+    keep_by_key = {}
+    duplicates = {}
+    for row in TaskMaster.objects.order_by("-id").values(
+        "id", "site", "gibun_code", "work_order", "op"
+    ):
+        key = (row["site"], row["gibun_code"], row["work_order"], row["op"])
+        if key in keep_by_key:
+            duplicates[row["id"]] = keep_by_key[key]
+        else:
+            keep_by_key[key] = row["id"]
+
+    for old_id, keep_id in duplicates.items():
+        WorkItem.objects.filter(task_master_id=old_id).update(task_master_id=keep_id)
+    if duplicates:
+        TaskMaster.objects.filter(id__in=list(duplicates)).delete()
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0029_workplace_config_key_and_site_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_taskmasters, noop_reverse),
+        migrations.AddConstraint(
+            model_name="taskmaster",
+            constraint=models.UniqueConstraint(
+                fields=("site", "gibun_code", "work_order", "op"),
+                name="uniq_taskmaster_site_gibun_wo_op",
+            ),
+        ),
+    ]
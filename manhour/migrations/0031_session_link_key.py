@@ -0,0 +1,48 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+from manhour.utils import normalize_link_key
+
+
+def backfill_link_keys(apps, schema_editor):
+    WorkSession = apps.get_model("manhour", "WorkSession")
+    GibunPriority = apps.get_model("manhour", "GibunPriority")
+
+    primary_gibun = {}
+    for session_id, gibun in GibunPriority.objects.order_by(
+        "session_id", "order", "id"
+    ).values_list("session_id", "gibun"):
+        primary_gibun.setdefault(session_id, gibun)
+
+    sessions = []
+    for session in WorkSession.objects.filter(id__in=list(primary_gibun)).only("id"):
+        session.link_key = normalize_link_key(primary_gibun[session.id])
+        sessions.append(session)
+    WorkSession.objects.bulk_update(sessions, ["link_key"], batch_size=500)
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0030_taskmaster_unique_natural_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worksession",
+            name="link_key",
+            field=models.CharField(blank=True, default="", max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name="worksession",
+            index=models.Index(
+                fields=["site", "link_key"], name="manhour_ws_site_link_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_link_keys, noop_reverse),
+    ]
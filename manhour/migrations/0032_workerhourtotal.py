@@ -0,0 +1,74 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_worker_hour_totals(apps, schema_editor):
+    Assignment = apps.get_model("manhour", "Assignment")
+    WorkerHourTotal = apps.get_model("manhour", "WorkerHourTotal")
+
+    rows = (
+        Assignment.objects.values("work_item__session_id", "worker__name")
+        .annotate(total=Sum("allocated_mh"))
+        .order_by()
+    )
+    WorkerHourTotal.objects.bulk_create(
+        [
+            WorkerHourTotal(
+                session_id=row["work_item__session_id"],
+                worker_name=row["worker__name"],
+                total_mh=float(row["total"] or 0),
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0031_session_link_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkerHourTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("worker_name", models.CharField(max_length=50)),
+                ("total_mh", models.FloatField(default=0.0)),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="worker_hour_totals",
+                        to="manhour.worksession",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("session", "worker_name"),
+                        name="uniq_worker_hour_total_session_name",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_worker_hour_totals, noop_reverse),
+    ]
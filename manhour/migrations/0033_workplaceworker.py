@@ -0,0 +1,71 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_workplace_workers(apps, schema_editor):
+    Worker = apps.get_model("manhour", "Worker")
+    WorkplaceWorker = apps.get_model("manhour", "WorkplaceWorker")
+
+    rows = (
+        Worker.objects.exclude(session__site="")
+        .values("session__site", "name")
+        .annotate(usage_count=Count("id"), last_seen_at=Max("session__created_at"))
+        .order_by()
+    )
+    WorkplaceWorker.objects.bulk_create(
+        [
+            WorkplaceWorker(
+                site=row["session__site"],
+                name=row["name"],
+                usage_count=row["usage_count"],
+                last_seen_at=row["last_seen_at"],
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0032_workerhourtotal"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkplaceWorker",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("site", models.CharField(max_length=50, verbose_name="근무지")),
+                ("name", models.CharField(max_length=50)),
+                ("last_seen_at", models.DateTimeField()),
+                ("usage_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["name", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["site", "last_seen_at"],
+                        name="manhour_wpw_site_seen_idx",
+                    )
+                ],
+                "unique_together": {("site", "name")},
+            },
+        ),
+        migrations.RunPython(backfill_workplace_workers, noop_reverse),
+    ]
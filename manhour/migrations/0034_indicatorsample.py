@@ -0,0 +1,39 @@
+# Generated by Django 5.1 on 2026-10-19 11:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0033_workplaceworker"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IndicatorSample",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("series", models.CharField(max_length=50)),
+                ("recorded_at", models.DateTimeField()),
+                ("value", models.FloatField()),
+            ],
+            options={
+                "ordering": ["series", "recorded_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["series", "recorded_at"],
+                        name="manhour_ind_series_at_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+from manhour.utils import normalize_link_key
+
+
+def backfill_link_keys(apps, schema_editor):
+    GibunPriority = apps.get_model("manhour", "GibunPriority")
+
+    priorities = []
+    for priority in GibunPriority.objects.only("id", "gibun"):
+        priority.link_key = normalize_link_key(priority.gibun)
+        if priority.link_key:
+            priorities.append(priority)
+    GibunPriority.objects.bulk_update(priorities, ["link_key"], batch_size=500)
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0034_indicatorsample"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gibunpriority",
+            name="link_key",
+            field=models.CharField(blank=True, default="", max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name="gibunpriority",
+            index=models.Index(fields=["link_key"], name="manhour_gib_link_key_idx"),
+        ),
+        migrations.RunPython(backfill_link_keys, noop_reverse),
+    ]
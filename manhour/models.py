@@ -1,5 +1,6 @@
 from django.db import models
 from django.db.models import Q
+from .utils import normalize_link_key
 from .workplace_config import get_default_workplace_choices
 
 
@@ -35,6 +36,14 @@ class TaskMaster(models.Model):
         verbose_name="근무지",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["site", "gibun_code", "work_order", "op"],
+                name="uniq_taskmaster_site_gibun_wo_op",
+            )
+        ]
+
     def __str__(self):
         return f"{self.gibun_code} - {self.work_order} ({self.site})"
 
@@ -66,6 +75,14 @@ class WorkSession(models.Model):
         verbose_name="근무 형태",
     )
 
+    # manning 세션 연결용: 대표 기번(우선순위 1번)을 정규화한 값
+    link_key = models.CharField(max_length=50, blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["site", "link_key"], name="manhour_ws_site_link_idx"),
+        ]
+
     @property
     def is_night_shift(self):
         return self.shift_type == self.SHIFT_NIGHT
@@ -94,6 +111,8 @@ class GibunPriority(models.Model):
     session = models.ForeignKey(WorkSession, on_delete=models.CASCADE)
     gibun = models.CharField(max_length=50)
     order = models.PositiveIntegerField(default=999)
+    # manning 등록번호 매칭용: 정규화한 기번 (bulk_create 시에는 직접 채움)
+    link_key = models.CharField(max_length=50, blank=True, default="")
 
     class Meta:
         unique_together = ("session", "gibun")
@@ -101,8 +120,16 @@ class GibunPriority(models.Model):
             models.Index(
                 fields=["session", "order"], name="manhour_gib_session_3525d4_idx"
             ),
+            models.Index(fields=["link_key"], name="manhour_gib_link_key_idx"),
         ]
 
+    def save(self, *args, **kwargs):
+        self.link_key = normalize_link_key(self.gibun)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "gibun" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "link_key"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.session.name} / {self.gibun} = {self.order}"
 
@@ -167,6 +194,27 @@ class Assignment(models.Model):
         ]
 
 
+class WorkerHourTotal(models.Model):
+    """세션별 작업자 배정 시간 합계 (refresh_worker_totals에서 갱신, manning 보드 조회용)"""
+
+    session = models.ForeignKey(
+        WorkSession, related_name="worker_hour_totals", on_delete=models.CASCADE
+    )
+    worker_name = models.CharField(max_length=50)
+    total_mh = models.FloatField(default=0.0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["session", "worker_name"],
+                name="uniq_worker_hour_total_session_name",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.session_id} / {self.worker_name} = {self.total_mh}"
+
+
 class GibunTeam(models.Model):
     session = models.ForeignKey(
         "WorkSession", on_delete=models.CASCADE, related_name="gibun_teams"
@@ -246,6 +294,30 @@ class AppSetting(models.Model):
         return f"{self.key}"
 
 
+class WorkplaceWorker(models.Model):
+    """근무지별 작업자 명부 (Worker 생성 시 갱신, 대시보드/자동완성 조회용)"""
+
+    site = models.CharField(
+        max_length=50,
+        verbose_name="근무지",
+    )
+    name = models.CharField(max_length=50)
+    last_seen_at = models.DateTimeField()
+    usage_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("site", "name")
+        indexes = [
+            models.Index(
+                fields=["site", "last_seen_at"], name="manhour_wpw_site_seen_idx"
+            ),
+        ]
+        ordering = ["name", "id"]
+
+    def __str__(self):
+        return f"{self.name} ({self.site})"
+
+
 class DefaultWorkerDirectory(models.Model):
     site = models.CharField(
         max_length=50,
@@ -260,3 +332,22 @@ class DefaultWorkerDirectory(models.Model):
 
     def __str__(self):
         return f"{self.name} ({self.site})"
+
+
+class IndicatorSample(models.Model):
+    """대시보드 지표(환율/유가/METAR) 시계열: 갱신 때마다 값이 바뀐 경우만 추가"""
+
+    series = models.CharField(max_length=50)
+    recorded_at = models.DateTimeField()
+    value = models.FloatField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["series", "recorded_at"], name="manhour_ind_series_at_idx"
+            ),
+        ]
+        ordering = ["series", "recorded_at"]
+
+    def __str__(self):
+        return f"{self.series} {self.recorded_at:%Y-%m-%d %H:%M} {self.value}"
@@ -1,7 +1,16 @@
-from django.db import transaction
-from django.db.models import Sum, Count
-
-from .models import GibunPriority, WorkSession, Assignment, WorkItem
+from django.db import connection, transaction
+from django.db.models import Q, Sum, Count
+
+from .models import (
+    GibunPriority,
+    WorkSession,
+    Assignment,
+    WorkItem,
+    Worker,
+    WorkerHourTotal,
+)
+from .utils import SHIFT_START_DAY, SHIFT_START_NIGHT
+from .worker_directory import record_workplace_workers
 
 # -----------------------------------------------------------
 # 상수
@@ -307,12 +316,158 @@ def run_sync_schedule(session_id):
 
 
 def refresh_worker_totals(session):
-    workers = session.worker_set.all()
+    """
+    작업자별 used_mh(간비/DIRECT 제외)와 WorkerHourTotal(전체 배정 합계)을
+    세션 단위 집계 한 번으로 갱신합니다.
+    """
+    billable = ~Q(work_item__work_order__in=[KANBI_WO, DIRECT_WO])
+    totals = {
+        row["worker_id"]: row
+        for row in Assignment.objects.filter(work_item__session=session)
+        .values("worker_id", "worker__name")
+        .annotate(
+            total=Sum("allocated_mh"),
+            billable=Sum("allocated_mh", filter=billable),
+        )
+    }
+
+    workers = list(session.worker_set.all())
     for w in workers:
-        total = (
-            w.assignments.filter(work_item__session=session)
-            .exclude(work_item__work_order__in=[KANBI_WO, DIRECT_WO])
-            .aggregate(Sum("allocated_mh"))["allocated_mh__sum"]
+        w.used_mh = round((totals.get(w.id) or {}).get("billable") or 0.0, 2)
+
+    hour_totals = {}
+    for row in totals.values():
+        name = row["worker__name"]
+        hour_totals[name] = hour_totals.get(name, 0.0) + float(row["total"] or 0)
+
+    with transaction.atomic():
+        Worker.objects.bulk_update(workers, ["used_mh"], batch_size=500)
+        WorkerHourTotal.objects.filter(session=session).delete()
+        WorkerHourTotal.objects.bulk_create(
+            [
+                WorkerHourTotal(session=session, worker_name=name, total_mh=total)
+                for name, total in hour_totals.items()
+            ]
+        )
+
+
+# -----------------------------------------------------------
+# 3) 세션 복제 (교대 인계용)
+# -----------------------------------------------------------
+def _shift_start(shift_type):
+    return (
+        SHIFT_START_NIGHT if shift_type == WorkSession.SHIFT_NIGHT else SHIFT_START_DAY
+    )
+
+
+def clone_session(source, name, shift_type=None, include_assignments=True):
+    """
+    source 세션의 작업자/기번 우선순위/작업 항목(선택: 고정·간비 배정)을
+    새 세션으로 복사합니다. 행 단위 ORM 대신 INSERT ... SELECT로 처리하고,
+    작업 항목 FK는 id 순번(ROW_NUMBER), 작업자 FK는 이름으로 다시 연결합니다.
+    근무 형태가 바뀌면 고정 배정의 시각(분)을 교대 시작 시각 차이만큼 옮깁니다.
+    """
+    shift_type = shift_type or source.shift_type
+    minute_offset = _shift_start(shift_type) - _shift_start(source.shift_type)
+
+    qn = connection.ops.quote_name
+    worker_table = qn(Worker._meta.db_table)
+    priority_table = qn(GibunPriority._meta.db_table)
+    item_table = qn(WorkItem._meta.db_table)
+    assignment_table = qn(Assignment._meta.db_table)
+    item_columns = [
+        "model_type",
+        "gibun_input",
+        "original_gibun",
+        "work_order",
+        "op",
+        "description",
+        "work_mh",
+        "adjusted_mh",
+        "ordering",
+        "task_master_id",
+    ]
+    item_column_sql = ", ".join(qn(col) for col in item_columns)
+
+    with transaction.atomic():
+        session = WorkSession.objects.create(
+            name=name,
+            site=source.site,
+            shift_type=shift_type,
+            is_active=True,
+            link_key=source.link_key,
         )
-        w.used_mh = round(total or 0.0, 2)
-        w.save(update_fields=["used_mh"])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {worker_table} "
+                f"({qn('session_id')}, {qn('name')}, {qn('limit_mh')}, {qn('used_mh')}) "
+                f"SELECT %s, {qn('name')}, {qn('limit_mh')}, 0 FROM {worker_table} "
+                f"WHERE {qn('session_id')} = %s ORDER BY {qn('id')}",
+                [session.id, source.id],
+            )
+            cursor.execute(
+                f"INSERT INTO {priority_table} "
+                f"({qn('session_id')}, {qn('gibun')}, {qn('order')}, {qn('link_key')}) "
+                f"SELECT %s, {qn('gibun')}, {qn('order')}, {qn('link_key')} "
+                f"FROM {priority_table} "
+                f"WHERE {qn('session_id')} = %s",
+                [session.id, source.id],
+            )
+            # id 순서대로 넣어야 아래 ROW_NUMBER 매핑이 원본과 1:1로 맞습니다.
+            cursor.execute(
+                f"INSERT INTO {item_table} "
+                f"({qn('session_id')}, {qn('is_manual')}, {item_column_sql}) "
+                f"SELECT %s, CASE WHEN %s THEN {qn('is_manual')} ELSE %s END, "
+                f"{item_column_sql} FROM {item_table} "
+                f"WHERE {qn('session_id')} = %s ORDER BY {qn('id')}",
+                [session.id, include_assignments, False, source.id],
+            )
+            if include_assignments:
+                # 옮긴 시각은 0~1439로 맞추고, 자정을 넘는 배정만 종료를 +1440 합니다.
+                # (SQLite의 %는 음수에 음수를 돌려주므로 1440을 더해 한 번 더 나눔)
+                offset = int(minute_offset)
+                shifted_start = (
+                    f"(((a.{qn('start_min')} + {offset}) %% 1440 + 1440) %% 1440)"
+                )
+                shifted_end = (
+                    f"(((a.{qn('end_min')} + {offset}) %% 1440 + 1440) %% 1440)"
+                )
+                cursor.execute(
+                    f"INSERT INTO {assignment_table} "
+                    f"({qn('work_item_id')}, {qn('worker_id')}, {qn('allocated_mh')}, "
+                    f"{qn('start_min')}, {qn('end_min')}, {qn('is_fixed')}, {qn('code')}) "
+                    f"WITH old_items AS ("
+                    f"  SELECT {qn('id')}, {qn('work_order')}, "
+                    f"  ROW_NUMBER() OVER (ORDER BY {qn('id')}) AS rn "
+                    f"  FROM {item_table} WHERE {qn('session_id')} = %s"
+                    f"), new_items AS ("
+                    f"  SELECT {qn('id')}, ROW_NUMBER() OVER (ORDER BY {qn('id')}) AS rn "
+                    f"  FROM {item_table} WHERE {qn('session_id')} = %s"
+                    f") "
+                    f"SELECT ni.{qn('id')}, nw.{qn('id')}, a.{qn('allocated_mh')}, "
+                    f"{shifted_start}, "
+                    f"CASE WHEN {shifted_end} < {shifted_start} "
+                    f"THEN {shifted_end} + 1440 ELSE {shifted_end} END, "
+                    f"a.{qn('is_fixed')}, a.{qn('code')} "
+                    f"FROM {assignment_table} a "
+                    f"JOIN old_items oi ON oi.{qn('id')} = a.{qn('work_item_id')} "
+                    f"JOIN new_items ni ON ni.rn = oi.rn "
+                    f"JOIN {worker_table} ow ON ow.{qn('id')} = a.{qn('worker_id')} "
+                    f"JOIN {worker_table} nw "
+                    f"  ON nw.{qn('session_id')} = %s AND nw.{qn('name')} = ow.{qn('name')} "
+                    f"WHERE a.{qn('is_fixed')} = %s OR oi.{qn('work_order')} = %s",
+                    [
+                        source.id,
+                        session.id,
+                        session.id,
+                        True,
+                        KANBI_WO,
+                    ],
+                )
+
+        record_workplace_workers(
+            session.site,
+            Worker.objects.filter(session=session).values_list("name", flat=True),
+        )
+
+    return session
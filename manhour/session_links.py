@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from django.db.models import OuterRef, Q, Subquery
+
+from manning.models import WorkSession as ManningWorkSession
+
+from .models import GibunPriority, WorkSession
+from .utils import normalize_link_key
+
+# 두 앱의 근무 형태 체계(DAY/NIGHT, 1~4 Shift)가 달라 link_key에는 넣지 않고,
+# 같은 키가 여러 개면 최근 생성 세션을 고릅니다.
+
+
+def primary_gibun_link_key(session: WorkSession) -> str:
+    return (
+        GibunPriority.objects.filter(session=session)
+        .order_by("order", "id")
+        .values_list("link_key", flat=True)
+        .first()
+    ) or ""
+
+
+def find_manhour_session(manning_session, workplace: str = "") -> WorkSession | None:
+    """
+    manning 세션과 같은 link_key를 가진 manhour 세션 (활성 세션 우선, 최신순).
+    대표 기번이 아니어도 등록번호가 세션 기번 중 하나와 같으면 그 활성 세션을 씁니다.
+    """
+    if not manning_session.link_key:
+        return None
+    qs = WorkSession.objects.all()
+    if workplace:
+        qs = qs.filter(site=workplace)
+    session = (
+        qs.filter(link_key=manning_session.link_key)
+        .order_by("-is_active", "-created_at", "-id")
+        .first()
+    )
+    if session:
+        return session
+
+    return (
+        qs.filter(gibunpriority__link_key=manning_session.link_key, is_active=True)
+        .order_by("-created_at", "-id")
+        .first()
+    )
+
+
+def find_manning_session_id(session: WorkSession) -> int | None:
+    """
+    manhour 세션에 연결됐거나 같은 link_key를 가진 활성 manning 세션 id.
+    없으면 세션의 다른 기번과 등록번호가 같은 manning 세션을 찾습니다.
+    """
+    condition = Q(manhour_session=session)
+    if session.link_key:
+        condition |= Q(link_key=session.link_key)
+    active = ManningWorkSession.objects.filter(is_active=True, site=session.site)
+    manning_id = (
+        active.filter(condition)
+        .order_by("-created_at", "-id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    if manning_id:
+        return manning_id
+
+    gibun_keys = set(
+        GibunPriority.objects.filter(session=session)
+        .exclude(link_key="")
+        .values_list("link_key", flat=True)
+    )
+    if not gibun_keys:
+        return None
+    return (
+        active.filter(link_key__in=gibun_keys)
+        .order_by("-created_at", "-id")
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def link_manning_sessions(session: WorkSession) -> int:
+    """아직 연결되지 않은 같은 키의 manning 세션을 새 manhour 세션에 연결합니다."""
+    if not session.link_key:
+        return 0
+    return ManningWorkSession.objects.filter(
+        site=session.site,
+        link_key=session.link_key,
+        is_active=True,
+        manhour_session__isnull=True,
+    ).update(manhour_session=session)
+
+
+def refresh_link_key(session: WorkSession) -> bool:
+    """
+    기번 우선순위를 바꾼 뒤 호출: 대표 기번으로 link_key를 다시 계산하고
+    같은 키의 미연결 manning 세션을 연결합니다. 반환값: link_key 변경 여부
+    """
+    key = primary_gibun_link_key(session)
+    changed = key != session.link_key
+    if changed:
+        session.link_key = key
+        # link_key는 세션 요약과 무관하므로 post_save 없이 갱신
+        WorkSession.objects.filter(id=session.id).update(link_key=key)
+    link_manning_sessions(session)
+    return changed
+
+
+def relink_sessions() -> dict[str, int]:
+    """
+    link_key를 다시 계산하고 비어 있는 manning→manhour 연결을 채웁니다.
+    기번 순서 변경 등으로 대표 기번이 바뀐 세션을 주기적으로 맞추는 용도입니다.
+    """
+    primary_link_key = (
+        GibunPriority.objects.filter(session=OuterRef("pk"))
+        .order_by("order", "id")
+        .values("link_key")[:1]
+    )
+    manhour_changed = []
+    for session in WorkSession.objects.filter(is_active=True).annotate(
+        primary_link_key=Subquery(primary_link_key)
+    ):
+        key = session.primary_link_key or ""
+        if key != session.link_key:
+            session.link_key = key
+            manhour_changed.append(session)
+    WorkSession.objects.bulk_update(manhour_changed, ["link_key"], batch_size=500)
+
+    manning_changed = []
+    for session in ManningWorkSession.objects.only("id", "aircraft_reg", "link_key"):
+        key = normalize_link_key(session.aircraft_reg)
+        if key != session.link_key:
+            session.link_key = key
+            manning_changed.append(session)
+    ManningWorkSession.objects.bulk_update(
+        manning_changed, ["link_key"], batch_size=500
+    )
+
+    linked = 0
+    for manning_session in ManningWorkSession.objects.filter(
+        is_active=True, manhour_session__isnull=True
+    ).exclude(link_key=""):
+        target = find_manhour_session(manning_session, workplace=manning_session.site)
+        if target:
+            manning_session.manhour_session = target
+            manning_session.save(update_fields=["manhour_session"])
+            linked += 1
+
+    return {
+        "manhour_keys": len(manhour_changed),
+        "manning_keys": len(manning_changed),
+        "linked": linked,
+    }
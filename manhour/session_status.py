@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from manning.models import WorkSession as ManningWorkSession
+
+from .app_settings import get_history_visibility_hours, get_navbar_toggle_position
+from .caching import VersionedRegistry
+from .models import TaskMaster, WorkSession
+
+EMPTY_SESSION_STATUS = {"active_count": 0, "current_session_id": None}
+
+
+def _active_session_loader(model):
+    def load(workplace: str) -> dict:
+        # 근무지당 활성 세션은 많지 않으므로 id만 한 번에 읽어 개수/최신 세션을 같이 구함
+        ids = list(
+            model.objects.filter(is_active=True, site=workplace)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+        return {
+            "active_count": len(ids),
+            "current_session_id": ids[0] if ids else None,
+        }
+
+    return load
+
+
+_manhour_status = VersionedRegistry(
+    "session_status:manhour", _active_session_loader(WorkSession)
+)
+_manning_status = VersionedRegistry(
+    "session_status:manning", _active_session_loader(ManningWorkSession)
+)
+
+
+def _load_dashboard_counts(workplace: str) -> dict:
+    history_cutoff = timezone.now() - timedelta(hours=get_history_visibility_hours())
+    sessions = WorkSession.objects.filter(site=workplace)
+    return {
+        "active_count": sessions.filter(is_active=True).count(),
+        "history_count": sessions.filter(is_active=False)
+        .filter(
+            Q(finished_at__gte=history_cutoff)
+            | Q(finished_at__isnull=True, created_at__gte=history_cutoff)
+        )
+        .count(),
+        "master_data_count": (
+            TaskMaster.objects.filter(site=workplace).count() if workplace else 0
+        ),
+    }
+
+
+# 이력 개수는 시간이 지나면서도 바뀌므로 ttl과 ETag의 분 단위 구간으로 함께 맞춥니다.
+DASHBOARD_COUNTS_TTL_SECONDS = 60
+
+_dashboard_counts = VersionedRegistry(
+    "dashboard_counts", _load_dashboard_counts, ttl=DASHBOARD_COUNTS_TTL_SECONDS
+)
+
+
+def get_session_status(workplace: str) -> dict:
+    """navbar용 근무지별 활성 세션 요약 (개수, 최신 세션 id, 토글 위치)"""
+    status = _manhour_status.get(workplace) if workplace else EMPTY_SESSION_STATUS
+    return {**status, "navbar_toggle_position": get_navbar_toggle_position(workplace)}
+
+
+def get_manning_session_status(workplace: str) -> dict:
+    return _manning_status.get(workplace) if workplace else EMPTY_SESSION_STATUS
+
+
+def invalidate_session_status(workplace: str | None = None) -> None:
+    """workplace를 주면 그 근무지만, 없으면 모든 근무지의 요약을 무효화합니다."""
+    args = (workplace,) if workplace is not None else ()
+    _manhour_status.invalidate(*args)
+    # 세션 수가 바뀌면 대시보드 카운트도 달라짐
+    _dashboard_counts.invalidate(*args)
+
+
+def invalidate_manning_session_status(workplace: str | None = None) -> None:
+    args = (workplace,) if workplace is not None else ()
+    _manning_status.invalidate(*args)
+
+
+def get_dashboard_counts(workplace: str) -> dict:
+    """대시보드 카드용 근무지별 활성/이력 세션 수와 마스터 데이터 수"""
+    return _dashboard_counts.get(workplace)
+
+
+def dashboard_counts_etag(workplace: str) -> str:
+    """
+    근무지별 버전 카운터 + 분 단위 구간으로 만든 ETag.
+    COUNT 쿼리 없이 캐시 조회 한 번으로 계산되어 폴링 요청에 304를 돌려줄 수 있습니다.
+    """
+    version = _dashboard_counts.current_version(workplace)
+    bucket = int(time.time() // DASHBOARD_COUNTS_TTL_SECONDS)
+    raw = f"{workplace}:{version}:{bucket}".encode("utf-8")
+    return f'"{hashlib.md5(raw).hexdigest()}"'
+
+
+def invalidate_dashboard_counts(workplace: str | None = None) -> None:
+    """세션/마스터 데이터 수가 바뀌는 곳에서 호출합니다 (workplace 없으면 전체)."""
+    args = (workplace,) if workplace is not None else ()
+    _dashboard_counts.invalidate(*args)
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from manning.models import WorkSession as ManningWorkSession
+
+from .backgrounds import invalidate_background_configs
+from .models import BackgroundImage, Workplace, WorkSession
+from .session_status import (
+    invalidate_manning_session_status,
+    invalidate_session_status,
+)
+from .workplaces import invalidate_workplace_registry
+
+
+@receiver([post_save, post_delete], sender=Workplace)
+def workplace_changed(sender, **kwargs):
+    invalidate_workplace_registry()
+
+
+@receiver([post_save, post_delete], sender=WorkSession)
+def work_session_changed(sender, instance, **kwargs):
+    invalidate_session_status(instance.site)
+
+
+@receiver([post_save, post_delete], sender=ManningWorkSession)
+def manning_session_changed(sender, instance, **kwargs):
+    invalidate_manning_session_status(instance.site)
+
+
+@receiver([post_save, post_delete], sender=BackgroundImage)
+def background_image_changed(sender, **kwargs):
+    invalidate_background_configs()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+from .app_settings import get_taskmaster_retention_hours
+from .models import TaskMaster, WorkItem
+from .session_status import invalidate_dashboard_counts
+
+TASKMASTER_UPSERT_CHUNK_SIZE = 500
+TASKMASTER_PURGE_CHUNK_SIZE = 1000
+# 키 하나당 3개 변수 + site 1개: SQLite 기본 변수 제한(999) 안에 들도록 유지
+TASKMASTER_KEY_LOOKUP_CHUNK_SIZE = 300
+
+
+def taskmaster_key(gibun_code: str, work_order: str, op: str) -> tuple[str, str, str]:
+    return (gibun_code or "", work_order or "", op or "")
+
+
+def _key_conditions(keys, chunk_size: int):
+    """(gibun_code, work_order, op) 조합을 chunk_size개씩 묶은 OR 조건"""
+    ordered_keys = sorted(set(keys))
+    for start in range(0, len(ordered_keys), chunk_size):
+        condition = Q()
+        for gibun_code, work_order, op in ordered_keys[start : start + chunk_size]:
+            condition |= Q(gibun_code=gibun_code, work_order=work_order, op=op)
+        yield condition
+
+
+def find_existing_taskmaster_keys(
+    site: str,
+    keys,
+    chunk_size: int = TASKMASTER_KEY_LOOKUP_CHUNK_SIZE,
+) -> set[tuple[str, str, str]]:
+    """
+    입력한 (gibun_code, work_order, op) 조합 중 이미 등록된 키만 돌려줍니다.
+    조합 단위로 조회하므로 uniq_taskmaster_site_gibun_wo_op 인덱스만으로 처리됩니다.
+    """
+    found = set()
+    for condition in _key_conditions(keys, chunk_size):
+        found.update(
+            TaskMaster.objects.filter(condition, site=site).values_list(
+                "gibun_code", "work_order", "op"
+            )
+        )
+    return found
+
+
+def delete_expired_taskmaster_keys(
+    site: str,
+    keys,
+    chunk_size: int = TASKMASTER_KEY_LOOKUP_CHUNK_SIZE,
+) -> int:
+    """
+    주어진 키 중 보관 기간이 지난 행만 삭제합니다 (다시 붙여넣은 키가 중복으로
+    막히지 않도록). 전체 정리는 purge_taskmasters 명령이 맡습니다.
+    """
+    cutoff = timezone.now() - timedelta(hours=get_taskmaster_retention_hours())
+    deleted = 0
+    with transaction.atomic():
+        for condition in _key_conditions(keys, chunk_size):
+            expired = TaskMaster.objects.filter(
+                condition, site=site, created_at__lt=cutoff
+            )
+            WorkItem.objects.filter(task_master__in=expired).update(task_master=None)
+            deleted += expired.delete()[1].get(TaskMaster._meta.label, 0)
+    if deleted:
+        invalidate_dashboard_counts(site)
+    return deleted
+
+
+def bulk_upsert_taskmasters(
+    site: str,
+    rows: list[dict],
+    chunk_size: int = TASKMASTER_UPSERT_CHUNK_SIZE,
+) -> dict:
+    """
+    (site, gibun_code, work_order, op) 기준으로 마스터 데이터를 일괄 저장합니다.
+    같은 키가 이미 있으면 description/default_mh만 갱신합니다.
+
+    rows: gibun_code/work_order/op/description/default_mh 키를 가진 dict 목록
+    반환값: inserted/updated/skipped 건수와 키별 TaskMaster 객체
+    """
+    skipped = 0
+    by_key = {}
+    for row in rows:
+        key = taskmaster_key(
+            row.get("gibun_code"), row.get("work_order"), row.get("op")
+        )
+        if not key[1]:
+            skipped += 1
+            continue
+        if key in by_key:
+            # 같은 요청 안의 중복 행은 마지막 값만 반영
+            skipped += 1
+        by_key[key] = TaskMaster(
+            site=site,
+            gibun_code=key[0],
+            work_order=key[1],
+            op=key[2],
+            description=row.get("description") or "",
+            default_mh=row.get("default_mh") or 0.0,
+        )
+
+    objs = list(by_key.values())
+    if not objs:
+        return {"inserted": 0, "updated": 0, "skipped": skipped, "task_masters": {}}
+
+    with transaction.atomic():
+        before = TaskMaster.objects.filter(site=site).count()
+        for start in range(0, len(objs), chunk_size):
+            TaskMaster.objects.bulk_create(
+                objs[start : start + chunk_size],
+                update_conflicts=True,
+                unique_fields=["site", "gibun_code", "work_order", "op"],
+                update_fields=["description", "default_mh"],
+            )
+        inserted = TaskMaster.objects.filter(site=site).count() - before
+
+    if inserted:
+        invalidate_dashboard_counts(site)
+    return {
+        "inserted": inserted,
+        "updated": len(objs) - inserted,
+        "skipped": skipped,
+        "task_masters": by_key,
+    }
+
+
+def purge_expired_taskmasters(
+    chunk_size: int = TASKMASTER_PURGE_CHUNK_SIZE,
+    dry_run: bool = False,
+    progress=None,
+) -> int:
+    """
+    보관 기간이 지난 마스터 데이터를 PK 구간 단위로 나눠 삭제합니다.
+    구간마다 WorkItem.task_master를 먼저 비운 뒤 지우므로 한 번에 잠그는 행 수가 제한됩니다.
+
+    progress: (처리한 마지막 id, 마지막 id, 누적 건수)를 받는 콜백
+    반환값: 삭제(dry_run이면 삭제 대상) 건수
+    """
+    cutoff = timezone.now() - timedelta(hours=get_taskmaster_retention_hours())
+    expired = TaskMaster.objects.filter(created_at__lt=cutoff)
+    bounds = expired.aggregate(low=Min("id"), high=Max("id"))
+    if bounds["low"] is None:
+        return 0
+
+    total = 0
+    for start in range(bounds["low"], bounds["high"] + 1, chunk_size):
+        chunk = expired.filter(id__gte=start, id__lt=start + chunk_size)
+        if dry_run:
+            total += chunk.count()
+        else:
+            with transaction.atomic():
+                WorkItem.objects.filter(task_master__in=chunk).update(task_master=None)
+                total += chunk.delete()[1].get(TaskMaster._meta.label, 0)
+        if progress:
+            progress(min(start + chunk_size - 1, bounds["high"]), bounds["high"], total)
+    if total and not dry_run:
+        invalidate_dashboard_counts()
+    return total
+
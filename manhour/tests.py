@@ -1,21 +1,65 @@
-from django.test import TestCase
+from datetime import timedelta
+import tempfile
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.db import connection
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 from manning.models import WorkSession as ManningWorkSession
 
 from .models import (
+    Assignment,
+    BackgroundImage,
     DefaultWorkerDirectory,
+    GibunPriority,
+    WorkItem,
     TaskMaster,
     WorkSession,
     Worker,
+    WorkerHourTotal,
+    IndicatorSample,
     Workplace,
+    WorkplaceWorker,
+)
+from .app_settings import (
+    get_app_settings,
+    get_default_worker_limit_mh,
+    get_navbar_toggle_position,
+    set_app_setting,
 )
+from .archiver import run_archive_pass
+from .backgrounds import get_background_config
+from .cache_backends import SQLiteCache
+from .caching import DEFAULT_REGISTRY_TTL_SECONDS, single_flight
+from .indicator_history import get_indicator_history, record_indicator_samples
+from .indicator_stub import IndicatorStubServer
+from .indicators import (
+    CHECKWX_CACHE_KEY,
+    get_financial_indicators,
+    indicator_jobs,
+    refresh_due_indicators,
+    refresh_indicator,
+)
+from .services import clone_session, refresh_worker_totals
+from .session_links import find_manhour_session, find_manning_session_id
+from .session_status import get_manning_session_status, get_session_status
+from .taskmasters import bulk_upsert_taskmasters, find_existing_taskmaster_keys
 from .workplaces import (
     ensure_default_workplaces,
     get_workplace_choices,
     normalize_workplace,
     rename_workplace_code,
 )
+from .worker_directory import get_workplace_worker_names
 from .workplace_config import get_default_workplace_choices
 
 
@@ -111,3 +155,869 @@ class AuthorizationAndScopeTests(TestCase):
         self.assertTrue(
             WorkSession.objects.filter(id=self.site_a_session.id).exists()
         )
+
+
+class TaskMasterIngestTests(TestCase):
+    def test_bulk_upsert_reports_inserted_updated_and_skipped(self):
+        TaskMaster.objects.create(
+            gibun_code="HL1001",
+            work_order="1000",
+            op="0010",
+            description="기존",
+            default_mh=1.0,
+            site="SITE-A",
+        )
+
+        result = bulk_upsert_taskmasters(
+            "SITE-A",
+            [
+                {
+                    "gibun_code": "HL1001",
+                    "work_order": "1000",
+                    "op": "0010",
+                    "description": "갱신",
+                    "default_mh": 2.0,
+                },
+                {
+                    "gibun_code": "HL1001",
+                    "work_order": "2000",
+                    "op": "0010",
+                    "description": "신규",
+                    "default_mh": 3.0,
+                },
+                {
+                    "gibun_code": "HL1001",
+                    "work_order": "",
+                    "op": "0010",
+                    "description": "WO 없음",
+                    "default_mh": 1.0,
+                },
+            ],
+        )
+
+        self.assertEqual(
+            (result["inserted"], result["updated"], result["skipped"]), (1, 1, 1)
+        )
+        self.assertEqual(TaskMaster.objects.filter(site="SITE-A").count(), 2)
+        updated = TaskMaster.objects.get(site="SITE-A", work_order="1000")
+        self.assertEqual(updated.description, "갱신")
+        self.assertEqual(updated.default_mh, 2.0)
+        self.assertTrue(all(tm.pk for tm in result["task_masters"].values()))
+
+    def test_existing_key_lookup_matches_only_exact_triples(self):
+        for gibun, wo, op in [("HL1001", "1000", "0010"), ("HL1002", "2000", "0020")]:
+            TaskMaster.objects.create(
+                gibun_code=gibun,
+                work_order=wo,
+                op=op,
+                description="",
+                default_mh=1.0,
+                site="SITE-A",
+            )
+
+        found = find_existing_taskmaster_keys(
+            "SITE-A",
+            [("HL1001", "1000", "0010"), ("HL1001", "2000", "0020")],
+            chunk_size=1,
+        )
+
+        self.assertEqual(found, {("HL1001", "1000", "0010")})
+
+
+class CreateSessionTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        for gibun in ["HL1001", "HL1002", "HL1003"]:
+            for wo in ["1000", "2000"]:
+                TaskMaster.objects.create(
+                    gibun_code=gibun,
+                    work_order=wo,
+                    op="0010",
+                    description="",
+                    default_mh=1.0,
+                    site="SITE-A",
+                )
+
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["user_role"] = "user"
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def _create(self, gibun_input):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(
+                reverse("manhour:create_session"),
+                {
+                    "session_name": "주간",
+                    "worker_names": "홍길동, 김철수",
+                    "gibun_input": gibun_input,
+                    "shift_type": "DAY",
+                },
+            )
+        return len(ctx.captured_queries)
+
+    def test_session_bootstrap_uses_constant_queries(self):
+        self._create("HL1001")  # 캐시 워밍업
+        single = self._create("HL1001")
+        many = self._create("HL1001 HL1002 HL1003 HL9999")
+
+        self.assertEqual(single, many)
+        second = WorkSession.objects.get(name="주간 (3)")
+        self.assertEqual(
+            list(
+                GibunPriority.objects.filter(session=second)
+                .order_by("order")
+                .values_list("gibun", flat=True)
+            ),
+            ["HL1001", "HL1002", "HL1003", "HL9999"],
+        )
+        self.assertEqual(WorkItem.objects.filter(session=second).count(), 7)
+        self.assertEqual(
+            list(
+                Worker.objects.filter(session=second).values_list("name", flat=True)
+            ),
+            ["홍길동", "김철수"],
+        )
+
+
+class CloneSessionTests(TestCase):
+    def test_clone_remaps_items_and_rebases_fixed_minutes(self):
+        source = WorkSession.objects.create(name="주간", site="SITE-A")
+        kim = Worker.objects.create(session=source, name="김철수")
+        lee = Worker.objects.create(session=source, name="이영희")
+        GibunPriority.objects.create(session=source, gibun="HL1001", order=1)
+        first = WorkItem.objects.create(
+            session=source, gibun_input="HL1001", work_order="1000", work_mh=2.0
+        )
+        second = WorkItem.objects.create(
+            session=source, gibun_input="HL1001", work_order="2000", work_mh=1.0
+        )
+        kanbi = WorkItem.objects.create(session=source, work_order="간비")
+        Assignment.objects.create(
+            work_item=second, worker=lee, allocated_mh=1.0, is_fixed=True
+        )
+        Assignment.objects.create(
+            work_item=first, worker=kim, allocated_mh=2.0, is_fixed=False
+        )
+        Assignment.objects.create(
+            work_item=kanbi,
+            worker=kim,
+            start_min=720,
+            end_min=780,
+            is_fixed=True,
+            code="LUNCH",
+        )
+
+        clone = clone_session(source, name="야간", shift_type=WorkSession.SHIFT_NIGHT)
+
+        self.assertEqual(clone.shift_type, WorkSession.SHIFT_NIGHT)
+        self.assertEqual(
+            list(clone.worker_set.values_list("name", flat=True)),
+            ["김철수", "이영희"],
+        )
+        self.assertEqual(clone.workitem_set.count(), 3)
+        self.assertTrue(GibunPriority.objects.filter(session=clone).exists())
+
+        cloned = Assignment.objects.filter(work_item__session=clone)
+        self.assertEqual(cloned.count(), 2)
+        fixed = cloned.get(is_fixed=True, work_item__work_order="2000")
+        self.assertEqual(fixed.worker.name, "이영희")
+        lunch = cloned.get(code="LUNCH")
+        self.assertEqual((lunch.start_min, lunch.end_min), (0, 60))
+        self.assertEqual(lunch.worker.session_id, clone.id)
+
+    def test_clone_night_to_day_normalizes_minutes(self):
+        source = WorkSession.objects.create(
+            name="야간", site="SITE-A", shift_type=WorkSession.SHIFT_NIGHT
+        )
+        kim = Worker.objects.create(session=source, name="김철수")
+        kanbi = WorkItem.objects.create(session=source, work_order="간비")
+        Assignment.objects.create(
+            work_item=kanbi,
+            worker=kim,
+            start_min=1380,
+            end_min=1500,
+            is_fixed=True,
+            code="MEAL",
+        )
+        Assignment.objects.create(
+            work_item=kanbi,
+            worker=kim,
+            start_min=60,
+            end_min=120,
+            is_fixed=True,
+            code="REST",
+        )
+
+        clone = clone_session(source, name="주간", shift_type=WorkSession.SHIFT_DAY)
+
+        cloned = Assignment.objects.filter(work_item__session=clone)
+        self.assertEqual(
+            {a.code: (a.start_min, a.end_min) for a in cloned},
+            {"MEAL": (660, 780), "REST": (780, 840)},
+        )
+
+
+class ReorderItemsTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        self.session = WorkSession.objects.create(name="A", site="SITE-A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["user_role"] = "user"
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def test_reorder_persists_with_single_bulk_update(self):
+        items = [
+            WorkItem.objects.create(
+                session=self.session, gibun_input="HL1001", ordering=(idx + 1) * 10
+            )
+            for idx in range(20)
+        ]
+        ordered_ids = [item.id for item in reversed(items)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse("manhour:reorder_items", args=[self.session.id]),
+                data={"gibun": "HL1001", "ordered_ids": ordered_ids},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.json()["status"], "success")
+        updates = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "manhour_workitem"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(
+                WorkItem.objects.filter(session=self.session)
+                .order_by("ordering")
+                .values_list("id", flat=True)
+            ),
+            ordered_ids,
+        )
+
+
+class WorkplaceRegistryTests(TestCase):
+    def test_resolution_is_query_free_until_workplaces_change(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        normalize_workplace("SITE-A")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(normalize_workplace("Site A"), "SITE-A")
+            self.assertIn(("SITE-A", "Site A"), get_workplace_choices())
+
+        Workplace.objects.create(code="SITE-B", label="Site B")
+
+        self.assertEqual(normalize_workplace("Site B"), "SITE-B")
+
+    def test_entries_expire_after_default_ttl_without_invalidation(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        normalize_workplace("SITE-A")
+        # 신호를 거치지 않는 변경(다른 워커의 무효화를 못 본 경우와 같음)
+        Workplace.objects.filter(code="SITE-A").update(label="Site Alpha")
+
+        self.assertEqual(normalize_workplace("Site Alpha"), "")
+
+        later = time.monotonic() + DEFAULT_REGISTRY_TTL_SECONDS + 1
+        with mock.patch("manhour.caching.time.monotonic", return_value=later):
+            self.assertEqual(normalize_workplace("Site Alpha"), "SITE-A")
+
+
+class AppSettingCacheTests(TestCase):
+    def test_getters_share_one_load_and_see_writes(self):
+        get_app_settings("SITE-A")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_default_worker_limit_mh("SITE-A"), 9.0)
+            self.assertEqual(get_navbar_toggle_position("SITE-A"), "left")
+
+        set_app_setting("default_worker_limit_mh_tenths", site="SITE-A", int_value=75)
+        set_app_setting("navbar_toggle_position", site="SITE-A", int_value=1)
+
+        self.assertEqual(get_default_worker_limit_mh("SITE-A"), 7.5)
+        self.assertEqual(get_navbar_toggle_position("SITE-A"), "right")
+        self.assertEqual(get_navbar_toggle_position("SITE-B"), "left")
+
+
+class ArchiverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _expired_session(self, site):
+        session = WorkSession.objects.create(name="old", site=site)
+        WorkSession.objects.filter(id=session.id).update(
+            created_at=timezone.now() - timedelta(days=2)
+        )
+        return session
+
+    def test_archives_once_per_interval_per_workplace(self):
+        first = self._expired_session("SITE-A")
+
+        self.assertEqual(run_archive_pass(), {"SITE-A": 1})
+        first.refresh_from_db()
+        self.assertFalse(first.is_active)
+
+        self._expired_session("SITE-A")
+        self.assertEqual(run_archive_pass(), {})
+        self.assertEqual(run_archive_pass(force=True), {"SITE-A": 1})
+
+    def test_request_dispatch_archives_once_per_interval(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        session = self._expired_session("SITE-A")
+        client_session = self.client.session
+        client_session["is_authenticated"] = True
+        client_session["workplace"] = "SITE-A"
+        client_session.save()
+        url = reverse("manhour:update_limits", args=[session.id])
+
+        self.client.post(url, {})
+        session.refresh_from_db()
+        self.assertFalse(session.is_active)
+
+        # 같은 간격 안의 요청은 cache만 읽고 AppSetting에 쓰지 않음
+        later = self._expired_session("SITE-A")
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(url, {})
+        later.refresh_from_db()
+        self.assertTrue(later.is_active)
+        self.assertFalse(
+            [
+                query["sql"]
+                for query in ctx.captured_queries
+                if "manhour_appsetting" in query["sql"]
+            ]
+        )
+
+        call_command("run_archiver", "--once", stdout=StringIO())
+        later.refresh_from_db()
+        self.assertTrue(later.is_active)
+
+
+class TaskMasterPurgeTests(TestCase):
+    def test_purge_nulls_references_and_supports_dry_run(self):
+        session = WorkSession.objects.create(name="S", site="SITE-A")
+        masters = [
+            TaskMaster.objects.create(
+                gibun_code="HL1001", work_order=str(1000 + i), op="0010", site="SITE-A"
+            )
+            for i in range(5)
+        ]
+        TaskMaster.objects.filter(id__in=[m.id for m in masters[:3]]).update(
+            created_at=timezone.now() - timedelta(days=2)
+        )
+        item = WorkItem.objects.create(
+            session=session, work_order="1000", task_master=masters[0]
+        )
+
+        out = StringIO()
+        call_command("purge_taskmasters", "--dry-run", stdout=out)
+        self.assertIn("3건", out.getvalue())
+        self.assertEqual(TaskMaster.objects.count(), 5)
+
+        call_command("purge_taskmasters", "--chunk-size", "2", stdout=StringIO())
+
+        self.assertEqual(TaskMaster.objects.count(), 2)
+        item.refresh_from_db()
+        self.assertIsNone(item.task_master)
+
+    def test_repaste_of_expired_rows_is_not_a_conflict(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        TaskMaster.objects.create(
+            gibun_code="HL1001", work_order="1000", op="0010", site="SITE-A"
+        )
+        TaskMaster.objects.create(
+            gibun_code="HL1001", work_order="2000", op="0010", site="SITE-A"
+        )
+        TaskMaster.objects.update(created_at=timezone.now() - timedelta(days=2))
+        client_session = self.client.session
+        client_session["workplace"] = "SITE-A"
+        client_session.save()
+        row = {
+            "gibun_code": "HL1001",
+            "work_order": "1000",
+            "op": "0010",
+            "description": "재등록",
+        }
+
+        response = self.client.post(
+            reverse("manhour:paste_data"), [row], content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # 겹친 키만 지우고, 나머지 만료 행은 purge_taskmasters에 맡김
+        self.assertTrue(TaskMaster.objects.filter(work_order="2000").exists())
+        master = TaskMaster.objects.get(work_order="1000")
+        self.assertEqual(master.description, "재등록")
+        self.assertGreater(master.created_at, timezone.now() - timedelta(hours=1))
+
+        response = self.client.post(
+            reverse("manhour:paste_data"), [row], content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 409)
+
+
+@override_settings(
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+)
+class NavbarDataViewLinkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def test_page_navbar_links_current_session(self):
+        WorkSession.objects.create(name="old", site="SITE-A")
+        latest = WorkSession.objects.create(name="new", site="SITE-A")
+
+        response = self.client.get(reverse("manhour:master_data_list"))
+
+        self.assertContains(
+            response, reverse("manhour:result_view", args=[latest.id])
+        )
+
+    def test_page_renders_without_active_session(self):
+        response = self.client.get(reverse("manhour:master_data_list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "bi-clipboard-plus")
+
+
+class SessionStatusCacheTests(TestCase):
+    def test_status_is_cached_per_workplace_and_follows_session_changes(self):
+        first = WorkSession.objects.create(name="A1", site="SITE-A")
+        WorkSession.objects.create(name="B1", site="SITE-B")
+        get_session_status("SITE-A")
+
+        with self.assertNumQueries(0):
+            status = get_session_status("SITE-A")
+        self.assertEqual(status["active_count"], 1)
+        self.assertEqual(status["current_session_id"], first.id)
+
+        second = WorkSession.objects.create(name="A2", site="SITE-A")
+        self.assertEqual(get_session_status("SITE-A")["current_session_id"], second.id)
+
+        second.is_active = False
+        second.save()
+        self.assertEqual(get_session_status("SITE-A")["active_count"], 1)
+
+        WorkSession.objects.filter(site="SITE-A").delete()
+        self.assertEqual(get_session_status("SITE-A")["active_count"], 0)
+        self.assertEqual(get_session_status("SITE-B")["active_count"], 1)
+
+    def test_manning_status_counts_only_the_workplace(self):
+        ManningWorkSession.objects.create(name="A", site="SITE-A")
+        ManningWorkSession.objects.create(name="B", site="SITE-B")
+
+        self.assertEqual(get_manning_session_status("SITE-A")["active_count"], 1)
+        self.assertEqual(get_manning_session_status("")["active_count"], 0)
+
+
+class BackgroundConfigCacheTests(TestCase):
+    def test_configs_are_resolved_once_and_refreshed_on_save(self):
+        record = BackgroundImage.objects.create(
+            key="index", youtube_url="https://youtu.be/abc123"
+        )
+        get_background_config("index")
+
+        with self.assertNumQueries(0):
+            config = get_background_config("index", "/static/default.jpg")
+            missing = get_background_config("other", "/static/other.jpg")
+        self.assertEqual(config["image_url"], "/static/default.jpg")
+        self.assertIn("/embed/abc123?", config["youtube_embed_url"])
+        self.assertEqual(missing["image_url"], "/static/other.jpg")
+
+        record.image_url = "https://example.com/bg.jpg"
+        record.youtube_url = ""
+        record.save()
+
+        config = get_background_config("index", "/static/default.jpg")
+        self.assertEqual(config["image_url"], "https://example.com/bg.jpg")
+        self.assertEqual(config["youtube_embed_url"], "")
+
+
+class SessionLinkTests(TestCase):
+    def test_sessions_link_by_normalized_registration(self):
+        manning = ManningWorkSession.objects.create(
+            name="WP", aircraft_reg="hl-7701", site="SITE-A"
+        )
+        other_site = ManningWorkSession.objects.create(
+            name="WP", aircraft_reg="HL7701", site="SITE-B"
+        )
+        self.assertEqual(manning.link_key, "HL7701")
+
+        session = WorkSession.objects.create(name="S", site="SITE-A")
+        GibunPriority.objects.create(session=session, gibun="HL7701", order=1)
+
+        out = StringIO()
+        call_command("relink_sessions", "--once", stdout=out)
+
+        session.refresh_from_db()
+        manning.refresh_from_db()
+        other_site.refresh_from_db()
+        self.assertEqual(session.link_key, "HL7701")
+        self.assertEqual(manning.manhour_session_id, session.id)
+        self.assertIsNone(other_site.manhour_session_id)
+        self.assertEqual(find_manning_session_id(session), manning.id)
+
+    def test_reordering_gibuns_relinks_without_the_command(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        session = WorkSession.objects.create(
+            name="S", site="SITE-A", link_key="HL7701"
+        )
+        GibunPriority.objects.create(session=session, gibun="HL7701", order=1)
+        GibunPriority.objects.create(session=session, gibun="HL8802", order=2)
+        manning = ManningWorkSession.objects.create(
+            name="WP", aircraft_reg="HL8802", site="SITE-A"
+        )
+        # 대표 기번이 아니어도 세션 기번 중 하나와 같으면 찾음
+        self.assertEqual(find_manning_session_id(session), manning.id)
+
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+        self.client.get(
+            reverse("manhour:reorder_gibun", args=[session.id, "HL8802", "up"])
+        )
+
+        session.refresh_from_db()
+        manning.refresh_from_db()
+        self.assertEqual(session.link_key, "HL8802")
+        self.assertEqual(manning.manhour_session_id, session.id)
+
+    def test_registration_matches_normalized_secondary_gibun(self):
+        session = WorkSession.objects.create(name="S", site="SITE-A", link_key="HL7701")
+        GibunPriority.objects.create(session=session, gibun="HL7701", order=1)
+        secondary = GibunPriority.objects.create(
+            session=session, gibun="hl-8802", order=2
+        )
+        self.assertEqual(secondary.link_key, "HL8802")
+        manning = ManningWorkSession.objects.create(
+            name="WP", aircraft_reg="HL 8802", site="SITE-A"
+        )
+
+        self.assertEqual(find_manhour_session(manning, workplace="SITE-A"), session)
+        self.assertIsNone(find_manhour_session(manning, workplace="SITE-B"))
+
+
+class WorkerHourTotalTests(TestCase):
+    def test_refresh_materializes_totals_in_constant_queries(self):
+        session = WorkSession.objects.create(name="S", site="SITE-A")
+        kim = Worker.objects.create(session=session, name="Kim")
+        lee = Worker.objects.create(session=session, name="Lee")
+        Worker.objects.create(session=session, name="Park", used_mh=3.0)
+        task = WorkItem.objects.create(session=session, work_order="1000")
+        kanbi = WorkItem.objects.create(session=session, work_order="간비")
+        Assignment.objects.create(work_item=task, worker=kim, allocated_mh=2.5)
+        Assignment.objects.create(work_item=kanbi, worker=kim, allocated_mh=1.0)
+        Assignment.objects.create(work_item=task, worker=lee, allocated_mh=4.0)
+
+        with self.assertNumQueries(7):
+            refresh_worker_totals(session)
+
+        self.assertEqual(
+            dict(Worker.objects.filter(session=session).values_list("name", "used_mh")),
+            {"Kim": 2.5, "Lee": 4.0, "Park": 0.0},
+        )
+        self.assertEqual(
+            dict(
+                WorkerHourTotal.objects.filter(session=session).values_list(
+                    "worker_name", "total_mh"
+                )
+            ),
+            {"Kim": 3.5, "Lee": 4.0},
+        )
+
+
+class WorkplaceWorkerDirectoryTests(TestCase):
+    def test_session_creation_and_clone_maintain_the_directory(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+        self.client.post(
+            reverse("manhour:create_session"),
+            {"session_name": "S", "worker_names": "Kim\nLee", "gibun_input": ""},
+        )
+        source = WorkSession.objects.get(site="SITE-A")
+        clone_session(source, "S2")
+
+        self.assertEqual(get_workplace_worker_names("SITE-A"), ["Kim", "Lee"])
+        self.assertEqual(
+            dict(WorkplaceWorker.objects.values_list("name", "usage_count")),
+            {"Kim": 2, "Lee": 2},
+        )
+        WorkplaceWorker.objects.filter(name="Kim").update(
+            last_seen_at=timezone.now() - timedelta(days=30)
+        )
+        self.assertEqual(
+            get_workplace_worker_names(
+                "SITE-A", since=timezone.now() - timedelta(days=7)
+            ),
+            ["Lee"],
+        )
+
+    def test_paste_input_refreshes_session_workers(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        session = WorkSession.objects.create(name="S", site="SITE-A")
+        Worker.objects.create(session=session, name="Park")
+        Worker.objects.create(session=session, name="Kim")
+        stale = timezone.now() - timedelta(days=30)
+        WorkplaceWorker.objects.create(
+            site="SITE-A", name="Kim", last_seen_at=stale, usage_count=3
+        )
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+        for _ in range(2):
+            self.client.post(
+                reverse("manhour:paste_input", args=[session.id]),
+                {"excel_data": "HL1001\t1000\t0010\tDESC\t1.5"},
+            )
+
+        self.assertEqual(get_workplace_worker_names("SITE-A"), ["Kim", "Park"])
+        # 작업 붙여넣기는 사용 횟수를 올리지 않고 최근 사용 시각만 갱신
+        self.assertEqual(
+            dict(WorkplaceWorker.objects.values_list("name", "usage_count")),
+            {"Kim": 3, "Park": 1},
+        )
+        self.assertGreater(WorkplaceWorker.objects.get(name="Kim").last_seen_at, stale)
+
+
+@override_settings(INDICATOR_BACKGROUND_REFRESH=False)
+class IndicatorRefreshTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_view_serves_cached_metar_without_calling_upstream(self):
+        station = {"icao": "RKSI", "raw_text": "RKSI 191200Z"}
+        with mock.patch(
+            "manhour.indicators._fetch_checkwx_metar", return_value=[station]
+        ):
+            refresh_indicator(CHECKWX_CACHE_KEY)
+
+        with mock.patch("manhour.indicators._fetch_checkwx_metar") as fetch:
+            response = self.client.get(reverse("manhour:checkwx_metar_api"))
+
+        fetch.assert_not_called()
+        payload = response.json()
+        self.assertEqual(payload["stations"], [station])
+        self.assertEqual(payload["age_seconds"], 0)
+
+    def test_failed_refresh_keeps_stale_value(self):
+        with mock.patch(
+            "manhour.indicators._fetch_checkwx_metar", return_value=[{"icao": "RKSS"}]
+        ):
+            refresh_indicator(CHECKWX_CACHE_KEY)
+        with mock.patch("manhour.indicators._fetch_checkwx_metar", return_value=None):
+            refreshed = refresh_indicator(CHECKWX_CACHE_KEY)
+
+        self.assertFalse(refreshed)
+        self.assertEqual(
+            self.client.get(reverse("manhour:checkwx_metar_api")).json()["stations"],
+            [{"icao": "RKSS"}],
+        )
+
+    def test_refresh_pass_fetches_providers_in_parallel_over_pooled_connections(self):
+        with IndicatorStubServer(delay=0.3) as stub:
+            with override_settings(**stub.settings_overrides()):
+                started = time.perf_counter()
+                results = refresh_due_indicators(force=True)
+                elapsed = time.perf_counter() - started
+                indicators, _age = get_financial_indicators()
+                refresh_due_indicators(force=True)
+
+        self.assertEqual(set(results), set(indicator_jobs()))
+        self.assertTrue(all(results.values()))
+        self.assertLess(elapsed, 0.3 * len(results))
+        self.assertEqual(indicators["usd_krw"]["value"], 1385.2)
+        self.assertEqual(indicators["usd_krw_history"][-1]["value"], 1385.2)
+        self.assertEqual(
+            IndicatorSample.objects.filter(series="metar:RKSI:wind_kt").count(), 1
+        )
+        self.assertLess(stub.connection_count, stub.request_count)
+
+    def test_transient_upstream_errors_are_retried(self):
+        with IndicatorStubServer(failures={"/metar/": [503]}) as stub:
+            with override_settings(**stub.settings_overrides()):
+                self.assertTrue(refresh_indicator(CHECKWX_CACHE_KEY))
+
+        self.assertEqual(stub.request_count, 2)
+
+
+class SQLiteCacheTests(TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "cache.sqlite3"
+
+    def _backend(self):
+        # 인스턴스마다 별도 연결 → 서로 다른 워커 프로세스와 같은 조건
+        return SQLiteCache(self.path, {"OPTIONS": {"BUSY_TIMEOUT": 5}})
+
+    def test_add_and_incr_are_atomic_across_connections(self):
+        first, second = self._backend(), self._backend()
+        self.assertTrue(first.add("lock", "a", 30))
+        self.assertFalse(second.add("lock", "b", 30))
+        self.assertEqual(second.get("lock"), "a")
+
+        first.set("counter", 0, None)
+
+        def bump():
+            backend = self._backend()
+            for _ in range(25):
+                backend.incr("counter")
+
+        threads = [threading.Thread(target=bump) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(second.get("counter"), 100)
+
+    def test_expired_entries_can_be_added_again(self):
+        backend = self._backend()
+        backend.set("key", "old", 0.01)
+        time.sleep(0.02)
+        self.assertIsNone(backend.get("key"))
+        self.assertTrue(backend.add("key", "new", 30))
+        self.assertEqual(backend.get_many(["key", "missing"]), {"key": "new"})
+
+    def test_cull_keeps_permanent_entries(self):
+        backend = SQLiteCache(
+            self.path, {"OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 1}}
+        )
+        backend.set("registry:version", 7, None)
+        for index in range(5):
+            backend.set(f"data:{index}", index, 60)
+
+        self.assertEqual(backend.get("registry:version"), 7)
+
+
+    def test_test_runner_keeps_the_shared_cache_file_untouched(self):
+        # 테스트의 cache.clear()가 운영 cache.sqlite3를 비우지 않아야 함
+        self.assertNotIsInstance(caches["default"], SQLiteCache)
+
+
+class SingleFlightTests(TestCase):
+    def test_only_one_holder_at_a_time(self):
+        with single_flight("refresh:test") as leader:
+            with single_flight("refresh:test") as follower:
+                self.assertTrue(leader)
+                self.assertFalse(follower)
+        with single_flight("refresh:test") as again:
+            self.assertTrue(again)
+
+
+class IndicatorHistoryTests(TestCase):
+    def test_history_is_downsampled_per_series_in_one_query(self):
+        start = timezone.now() - timedelta(hours=4)
+        for minute in range(0, 240, 10):
+            record_indicator_samples(
+                {"usd_krw": 1300 + minute, "wti": 70.0},
+                recorded_at=start + timedelta(minutes=minute),
+            )
+
+        with self.assertNumQueries(1):
+            history = get_indicator_history(
+                ["usd_krw", "wti"],
+                since=start,
+                points=4,
+                until=start + timedelta(hours=4),
+            )
+
+        self.assertEqual(len(history["usd_krw"]), 4)
+        self.assertEqual(history["usd_krw"][0]["value"], 1325.0)
+        # 값이 그대로인 wti는 첫 샘플 하나만 저장됨
+        self.assertEqual(history["wti"], [{"label": mock.ANY, "value": 70.0}])
+
+    def test_unchanged_values_are_not_recorded_again(self):
+        recorded_at = timezone.now()
+        self.assertEqual(
+            record_indicator_samples({"wti": 70.0, "usd_krw": 1300.0}, recorded_at),
+            2,
+        )
+
+        with self.assertNumQueries(2):
+            added = record_indicator_samples(
+                {"wti": 70.0, "usd_krw": 1301.0, "jet_fuel": None},
+                recorded_at + timedelta(minutes=10),
+            )
+
+        self.assertEqual(added, 1)
+        self.assertEqual(
+            list(
+                IndicatorSample.objects.filter(series="usd_krw").values_list(
+                    "value", flat=True
+                )
+            ),
+            [1300.0, 1301.0],
+        )
+        self.assertEqual(IndicatorSample.objects.filter(series="wti").count(), 1)
+
+        # 구간 이전에 저장된 값도 첫 구간으로 이어서 보여줌
+        history = get_indicator_history(
+            ["wti"],
+            since=recorded_at + timedelta(hours=1),
+            points=4,
+            until=recorded_at + timedelta(hours=2),
+        )
+        self.assertEqual([point["value"] for point in history["wti"]], [70.0])
+
+
+class DashboardConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        WorkSession.objects.create(name="A1", site="SITE-A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def test_unchanged_counts_answer_304_without_count_queries(self):
+        url = reverse("manhour:dashboard_counts_api")
+        first = self.client.get(url)
+        self.assertEqual(first.json()["active_count"], 1)
+        etag = first["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # 세션 미들웨어 쿼리만 있고 COUNT 쿼리는 없음
+        self.assertFalse(
+            [query for query in ctx.captured_queries if "manhour_" in query["sql"]]
+        )
+
+        WorkSession.objects.create(name="A2", site="SITE-A")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["active_count"], 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @override_settings(INDICATOR_BACKGROUND_REFRESH=False)
+    def test_metar_etag_follows_refresh_time(self):
+        url = reverse("manhour:checkwx_metar_api")
+        self.assertNotIn("ETag", self.client.get(url))
+
+        with mock.patch("manhour.indicators._fetch_checkwx_metar", return_value=[]):
+            refresh_indicator(CHECKWX_CACHE_KEY)
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
@@ -24,6 +24,11 @@ urlpatterns = [
         views.EditSessionView.as_view(),
         name="edit_session",
     ),
+    path(
+        "session/<int:session_id>/clone/",
+        views.CloneSessionView.as_view(),
+        name="clone_session",
+    ),
     path(
         "session/<int:session_id>/finish/",
         views.FinishSessionView.as_view(),
@@ -181,6 +186,11 @@ urlpatterns = [
         views.CheckWxMetarApiView.as_view(),
         name="checkwx_metar_api",
     ),
+    path(
+        "api/financial-indicators/",
+        views.FinancialIndicatorsApiView.as_view(),
+        name="financial_indicators_api",
+    ),
     path(
         "api/weather-forecast/",
         views.WeatherForecastApiView.as_view(),
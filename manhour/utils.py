@@ -1,3 +1,5 @@
+import re
+
 MINUTES_PER_DAY = 1440
 
 SHIFT_START_DAY = 8 * 60      # 08:00 = 480
@@ -196,3 +198,11 @@ class ScheduleCalculator:
                 remain -= use
 
         return self.results
+
+
+# ---------------------------------------------------------
+# 3. manhour ↔ manning 세션 연결 키
+# ---------------------------------------------------------
+def normalize_link_key(value):
+    """기번/등록번호를 비교용 키로 정규화 ('hl-7701 ' → 'HL7701')"""
+    return re.sub(r"[^0-9A-Z가-힣]", "", (value or "").upper())[:50]
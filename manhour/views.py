@@ -2,14 +2,12 @@ import json
 import logging
 import math
 import re
-from datetime import timedelta, datetime
-import requests
+from datetime import timedelta
 
 logger = logging.getLogger(__name__)
 
 from django.conf import settings
 from django.contrib import messages
-from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Q, Count, Max, Case, When, Sum, FloatField
 from django.db.models.functions import Coalesce
@@ -25,10 +23,16 @@ from django.views.generic import (
     DeleteView,
     DetailView,
 )
-from django.views.decorators.http import require_POST
-from manhour.utils import ScheduleCalculator, format_min_to_time, get_adjusted_min
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
+from manhour.utils import (
+    ScheduleCalculator,
+    format_min_to_time,
+    get_adjusted_min,
+    normalize_link_key,
+)
 from .models import (
-    AppSetting,
     Assignment,
     DefaultWorkerDirectory,
     FeaturedVideo,
@@ -39,6 +43,37 @@ from .models import (
     Worker,
     Workplace,
 )
+from .app_settings import (
+    get_auto_archive_hours,
+    get_default_worker_limit_mh,
+    get_history_visibility_hours,
+    get_navbar_toggle_position,
+    get_taskmaster_retention_hours,
+    set_app_setting,
+)
+from .archiver import archive_if_due
+from .indicators import (
+    CHECKWX_CACHE_KEY,
+    DEFAULT_WEATHER_AIRPORT,
+    WEATHER_AIRPORTS,
+    financial_indicators_etag,
+    get_checkwx_metar,
+    get_financial_indicators,
+    get_weather_forecast,
+    indicator_etag,
+    weather_forecast_etag,
+)
+from .session_links import (
+    find_manning_session_id,
+    link_manning_sessions,
+    refresh_link_key,
+)
+from .session_status import (
+    dashboard_counts_etag,
+    get_dashboard_counts,
+    invalidate_dashboard_counts,
+)
+from .worker_directory import record_workplace_workers, touch_workplace_workers
 from .workplaces import (
     get_workplace_choices,
     get_workplace_label_map,
@@ -51,7 +86,18 @@ from .forms import (
     WorkItemForm,
     TaskMasterForm,
 )
-from .services import run_auto_assign, refresh_worker_totals, run_sync_schedule
+from .services import (
+    clone_session,
+    run_auto_assign,
+    refresh_worker_totals,
+    run_sync_schedule,
+)
+from .taskmasters import (
+    bulk_upsert_taskmasters,
+    delete_expired_taskmaster_keys,
+    find_existing_taskmaster_keys,
+    taskmaster_key,
+)
 
 # -----------------------------------------------------------
 # 공용 헬퍼 함수
@@ -62,16 +108,6 @@ DIRECT_WO = "DIRECT"
 WORKPLACE_SESSION_KEY = "workplace"
 WORKPLACE_LABEL_SESSION_KEY = "workplace_label"
 
-TASKMASTER_RETENTION_HOURS = 12
-DEFAULT_HISTORY_VISIBILITY_HOURS = 24
-DEFAULT_AUTO_ARCHIVE_HOURS = 12
-DEFAULT_WORKER_LIMIT_MH = 9.0
-
-FINANCIAL_CACHE_KEY = "financial_indicators:v1"
-FINANCIAL_HISTORY_KEY = "financial_indicators:history:v1"
-CHECKWX_CACHE_KEY = "checkwx:metar:v1"
-WEATHER_FORECAST_CACHE_KEY = "weather_forecast:v1"
-
 
 def set_workplace_in_session(request, workplace: str | None) -> str:
     normalized = normalize_workplace(workplace)
@@ -125,80 +161,6 @@ def get_item_or_404(request, item_id: int, **kwargs):
     )
 
 
-def purge_expired_taskmasters():
-    cutoff = timezone.now() - timedelta(hours=get_taskmaster_retention_hours())
-    TaskMaster.objects.filter(created_at__lt=cutoff).delete()
-
-
-def get_taskmaster_retention_hours() -> int:
-    value = (
-        AppSetting.objects.filter(key="taskmaster_retention_hours", site="")
-        .values_list("int_value", flat=True)
-        .first()
-    )
-    try:
-        return int(value) if value else TASKMASTER_RETENTION_HOURS
-    except (TypeError, ValueError):
-        return TASKMASTER_RETENTION_HOURS
-
-
-def get_auto_archive_hours() -> int:
-    value = (
-        AppSetting.objects.filter(key="auto_archive_hours", site="")
-        .values_list("int_value", flat=True)
-        .first()
-    )
-    try:
-        return int(value) if value else DEFAULT_AUTO_ARCHIVE_HOURS
-    except (TypeError, ValueError):
-        return DEFAULT_AUTO_ARCHIVE_HOURS
-
-
-def get_history_visibility_hours() -> int:
-    value = (
-        AppSetting.objects.filter(key="history_visibility_hours", site="")
-        .values_list("int_value", flat=True)
-        .first()
-    )
-    try:
-        return int(value) if value else DEFAULT_HISTORY_VISIBILITY_HOURS
-    except (TypeError, ValueError):
-        return DEFAULT_HISTORY_VISIBILITY_HOURS
-
-
-def get_default_worker_limit_mh(workplace: str) -> float:
-    value = (
-        AppSetting.objects.filter(
-            key="default_worker_limit_mh_tenths",
-            site=workplace,
-        )
-        .values_list("int_value", flat=True)
-        .first()
-    )
-    try:
-        return (int(value) / 10.0) if value is not None else DEFAULT_WORKER_LIMIT_MH
-    except (TypeError, ValueError):
-        return DEFAULT_WORKER_LIMIT_MH
-
-
-def get_navbar_toggle_position(workplace: str) -> str:
-    value = (
-        AppSetting.objects.filter(key="navbar_toggle_position", site=workplace)
-        .values_list("int_value", flat=True)
-        .first()
-    )
-    return "right" if value == 1 else "left"
-
-
-def auto_archive_expired_sessions(workplace: str) -> None:
-    cutoff = timezone.now() - timedelta(hours=get_auto_archive_hours())
-    WorkSession.objects.filter(
-        is_active=True,
-        site=workplace,
-        created_at__lt=cutoff,
-    ).update(is_active=False, finished_at=timezone.now())
-
-
 def get_or_create_common_item(session, wo: str) -> WorkItem:
     defaults = {
         "gibun_input": "COMMON",
@@ -220,6 +182,21 @@ def get_or_create_common_item(session, wo: str) -> WorkItem:
     return item
 
 
+def _next_free_session_name(session_name: str, workplace: str) -> str:
+    """활성 세션과 겹치지 않는 이름을 찾습니다. ("이름", "이름 (2)", ...)"""
+    taken = set(
+        WorkSession.objects.filter(
+            name__startswith=session_name, is_active=True, site=workplace
+        ).values_list("name", flat=True)
+    )
+    final_name = session_name
+    cnt = 1
+    while final_name in taken:
+        cnt += 1
+        final_name = f"{session_name} ({cnt})"
+    return final_name
+
+
 class SimpleLoginRequiredMixin:
     def dispatch(self, request, *args, **kwargs):
         if not request.session.get("is_authenticated"):
@@ -228,7 +205,7 @@ class SimpleLoginRequiredMixin:
         if not workplace:
             messages.error(request, "근무지를 선택해주세요.")
             return redirect("manhour:login")
-        auto_archive_expired_sessions(workplace)
+        archive_if_due(workplace)
         return super().dispatch(request, *args, **kwargs)
 
 
@@ -523,30 +500,18 @@ class SettingsView(SimpleLoginRequiredMixin, View):
             messages.error(request, "유효한 시간(양의 정수)을 입력해주세요.")
             return redirect("manhour:settings")
 
-        AppSetting.objects.update_or_create(
-            key="auto_archive_hours",
-            site="",
-            defaults={"int_value": hours},
-        )
-        AppSetting.objects.update_or_create(
-            key="history_visibility_hours",
-            site="",
-            defaults={"int_value": history_hours},
-        )
-        AppSetting.objects.update_or_create(
-            key="taskmaster_retention_hours",
-            site="",
-            defaults={"int_value": taskmaster_retention},
-        )
-        AppSetting.objects.update_or_create(
-            key="default_worker_limit_mh_tenths",
+        set_app_setting("auto_archive_hours", int_value=hours)
+        set_app_setting("history_visibility_hours", int_value=history_hours)
+        set_app_setting("taskmaster_retention_hours", int_value=taskmaster_retention)
+        set_app_setting(
+            "default_worker_limit_mh_tenths",
             site=workplace,
-            defaults={"int_value": int(round(default_limit * 10))},
+            int_value=int(round(default_limit * 10)),
         )
-        AppSetting.objects.update_or_create(
-            key="navbar_toggle_position",
+        set_app_setting(
+            "navbar_toggle_position",
             site=workplace,
-            defaults={"int_value": 1 if navbar_toggle_position == "right" else 0},
+            int_value=1 if navbar_toggle_position == "right" else 0,
         )
         normalized_default_workers = raw_default_workers.replace("\r", "").replace(
             "\n", ","
@@ -635,13 +600,22 @@ class CreateSessionView(SimpleLoginRequiredMixin, View):
         if not session_name:
             session_name = "Session (이름 없음)"
 
-        final_name = session_name
-        cnt = 1
-        while WorkSession.objects.filter(
-            name=final_name, is_active=True, site=workplace
-        ).exists():
-            cnt += 1
-            final_name = f"{session_name} ({cnt})"
+        final_name = _next_free_session_name(session_name, workplace)
+
+        # 작업자 이름 (입력 순서 유지, 중복 제거)
+        worker_list = []
+        seen_names = set()
+        for line in worker_names.splitlines():
+            # 쉼표, 탭, 공백 등으로 이름 분리
+            for name in re.split(r"[,\t/;|\s]+", line):
+                name = name.strip()
+                if name and name not in seen_names:
+                    worker_list.append(name)
+                    seen_names.add(name)
+
+        # 기번 (입력 순서 유지, 중복 제거)
+        raw_gibuns = [g.strip() for g in re.split(r"[,\s]+", gibun_input) if g.strip()]
+        raw_gibuns = list(dict.fromkeys(raw_gibuns))
 
         with transaction.atomic():
             session = WorkSession.objects.create(
@@ -649,68 +623,77 @@ class CreateSessionView(SimpleLoginRequiredMixin, View):
                 shift_type=shift_type,
                 is_active=True,
                 site=workplace,
+                link_key=normalize_link_key(raw_gibuns[0] if raw_gibuns else ""),
             )
 
             # -------------------------------------------------------------
-            # 1. 작업자 등록 (순서 보장)
+            # 1. 작업자 등록 (순서 보장: bulk_create도 입력 순서대로 ID 부여)
             # -------------------------------------------------------------
-            lines = worker_names.splitlines()
-            seen_names = set()
-
             default_limit_mh = get_default_worker_limit_mh(workplace)
-
-            for line in lines:
-                # 쉼표, 탭, 공백 등으로 이름 분리
-                names = re.split(r"[,\t/;|\s]+", line)
-                names = [n.strip() for n in names if n.strip()]
-
-                for name in names:
-                    if name not in seen_names:
-                        # 팀 정보 없이 이름만 저장 -> 입력 순서(ID)대로 저장됨
-                        Worker.objects.create(
-                            session=session,
-                            name=name,
-                            limit_mh=default_limit_mh,
-                        )
-                        seen_names.add(name)
+            Worker.objects.bulk_create(
+                [
+                    Worker(session=session, name=name, limit_mh=default_limit_mh)
+                    for name in worker_list
+                ]
+            )
+            record_workplace_workers(workplace, worker_list)
 
             # -------------------------------------------------------------
             # 2. 기번 및 마스터 데이터 저장
             # -------------------------------------------------------------
-            if gibun_input:
-                raw_gibuns = re.split(r"[,\s]+", gibun_input)
-                raw_gibuns = [g.strip() for g in raw_gibuns if g.strip()]
-
-                for idx, gibun in enumerate(raw_gibuns, start=1):
-                    # GibunPriority는 입력 순서를 기억합니다.
-                    GibunPriority.objects.create(
-                        session=session, gibun=gibun, order=idx
-                    )
+            if raw_gibuns:
+                # GibunPriority는 입력 순서를 기억합니다.
+                GibunPriority.objects.bulk_create(
+                    [
+                        GibunPriority(
+                            session=session,
+                            gibun=gibun,
+                            order=idx,
+                            link_key=normalize_link_key(gibun),
+                        )
+                        for idx, gibun in enumerate(raw_gibuns, start=1)
+                    ]
+                )
 
-                    masters = TaskMaster.objects.filter(
-                        gibun_code=gibun, site=workplace
-                    )
-                    if masters.exists():
+                masters_by_gibun = {}
+                for tm in TaskMaster.objects.filter(
+                    gibun_code__in=raw_gibuns, site=workplace
+                ).order_by("id"):
+                    masters_by_gibun.setdefault(tm.gibun_code, []).append(tm)
+
+                new_items = []
+                for gibun in raw_gibuns:
+                    masters = masters_by_gibun.get(gibun)
+                    if masters:
                         for tm in masters:
-                            WorkItem.objects.create(
+                            new_items.append(
+                                WorkItem(
+                                    session=session,
+                                    task_master=tm,
+                                    gibun_input=gibun,
+                                    original_gibun=gibun,
+                                    model_type=tm.gibun_code,
+                                    work_order=tm.work_order,
+                                    op=tm.op,
+                                    description=tm.description,
+                                    work_mh=tm.default_mh,
+                                )
+                            )
+                    else:
+                        new_items.append(
+                            WorkItem(
                                 session=session,
-                                task_master=tm,
                                 gibun_input=gibun,
-                                model_type=tm.gibun_code,
-                                work_order=tm.work_order,
-                                op=tm.op,
-                                description=tm.description,
-                                work_mh=tm.default_mh,
+                                original_gibun=gibun,
+                                model_type=gibun,
+                                work_order="정보 없음",
+                                description="마스터 데이터가 없습니다.",
+                                work_mh=0.0,
                             )
-                    else:
-                        WorkItem.objects.create(
-                            session=session,
-                            gibun_input=gibun,
-                            model_type=gibun,
-                            work_order="정보 없음",
-                            description="마스터 데이터가 없습니다.",
-                            work_mh=0.0,
                         )
+                WorkItem.objects.bulk_create(new_items)
+
+            link_manning_sessions(session)
 
         messages.success(request, f"세션 '{final_name}'이(가) 시작되었습니다!")
 
@@ -719,6 +702,32 @@ class CreateSessionView(SimpleLoginRequiredMixin, View):
         return redirect("manhour:session_list")
 
 
+class CloneSessionView(SimpleLoginRequiredMixin, View):
+    # 교대 인계: 기존 세션의 기번/작업/인원/간비를 새 세션으로 복사
+    def post(self, request, session_id):
+        source = get_session_any_status_or_404(request, session_id)
+        workplace = get_current_workplace(request)
+
+        shift_type = request.POST.get("shift_type") or (
+            WorkSession.SHIFT_DAY if source.is_night_shift else WorkSession.SHIFT_NIGHT
+        )
+        if shift_type not in dict(WorkSession.SHIFT_CHOICES):
+            shift_type = source.shift_type
+        include_assignments = request.POST.get("include_assignments", "1") == "1"
+        session_name = (request.POST.get("session_name") or "").strip() or source.name
+
+        session = clone_session(
+            source,
+            name=_next_free_session_name(session_name, workplace),
+            shift_type=shift_type,
+            include_assignments=include_assignments,
+        )
+        run_sync_schedule(session.id)
+
+        messages.success(request, f"세션 '{session.name}'이(가) 복제되었습니다!")
+        return redirect("manhour:result_view", session_id=session.id)
+
+
 class EditSessionView(SimpleLoginRequiredMixin, View):
     # 세션 정보 및 작업자 명단 수정
     def get(self, request, session_id):
@@ -768,6 +777,7 @@ class EditSessionView(SimpleLoginRequiredMixin, View):
         # 신규 작업자 추가 (이미 있는 사람은 건너뜀)
         default_limit_mh = get_default_worker_limit_mh(get_current_workplace(request))
         existing_names = session.worker_set.values_list("name", flat=True)
+        added_names = []
         for name in new_names:
             if name not in existing_names:
                 Worker.objects.create(
@@ -775,6 +785,8 @@ class EditSessionView(SimpleLoginRequiredMixin, View):
                     name=name,
                     limit_mh=default_limit_mh,
                 )
+                added_names.append(name)
+        record_workplace_workers(session.site, added_names)
 
         adjusted_mh_map = request.session.get(f"adjusted_mh_map_{session.id}", {})
         run_auto_assign(session.id, adjusted_mh_map)
@@ -903,21 +915,7 @@ class ResultView(SimpleLoginRequiredMixin, DetailView):
 
     @staticmethod
     def _find_matching_manning_session_id(session) -> int | None:
-        try:
-            from manning.models import WorkSession as ManningWorkSession
-
-            candidates = ManningWorkSession.objects.filter(is_active=True)
-            if session.name:
-                candidates = candidates.filter(
-                    Q(name__icontains=session.name)
-                    | Q(work_package_name__icontains=session.name)
-                    | Q(aircraft_reg__icontains=session.name)
-                )
-            return (
-                candidates.order_by("-created_at").values_list("id", flat=True).first()
-            )
-        except Exception:
-            return None
+        return find_manning_session_id(session)
 
     def post(self, request, session_id):
         # 결과 화면에서 '자동 배정' 버튼 눌렀을 때
@@ -1066,6 +1064,7 @@ class ManageItemsView(SimpleLoginRequiredMixin, View):
         # ---------------------------------------------------------
         # 0. 기번 우선순위 업데이트 (prio_ 로 들어오는 값)
         # ---------------------------------------------------------
+        priorities_changed = False
         for key, value in request.POST.items():
             if key.startswith("prio_"):
                 try:
@@ -1075,8 +1074,11 @@ class ManageItemsView(SimpleLoginRequiredMixin, View):
                     if gp and gp.order != new_order:
                         gp.order = new_order
                         gp.save()
+                        priorities_changed = True
                 except ValueError:
                     continue
+        if priorities_changed:
+            refresh_link_key(session)
 
         # 조정 M/H 값이 넘어오면 work_mh에 반영
         mh_percent = request.POST.get("mh_percent", "0")
@@ -1149,6 +1151,8 @@ class ManageItemsView(SimpleLoginRequiredMixin, View):
                     worker, created = Worker.objects.get_or_create(
                         session=session, name=name_part
                     )
+                    if created:
+                        record_workplace_workers(session.site, [name_part])
                     if worker.limit_mh != limit_val:
                         worker.limit_mh = limit_val
                         worker.save(update_fields=["limit_mh"])
@@ -1378,9 +1382,13 @@ class ManageItemsView(SimpleLoginRequiredMixin, View):
                 .values_list("gibun_input", flat=True)
                 .distinct()
             )
-            GibunPriority.objects.filter(session=session).exclude(
-                gibun__in=remaining_gibuns
-            ).delete()
+            removed, _ = (
+                GibunPriority.objects.filter(session=session)
+                .exclude(gibun__in=remaining_gibuns)
+                .delete()
+            )
+            if removed:
+                refresh_link_key(session)
 
         # ---------------------------------------------------------
         # 2. 자동 배정/스케줄 동기화 재실행
@@ -1491,15 +1499,16 @@ class PasteDataView(MasterDataBaseMixin, View):
                 (item["gibun_code"], item["work_order"], item["op"])
                 for item in normalized
             }
-            existing_keys = set(
-                TaskMaster.objects.filter(
-                    site=workplace,
-                    gibun_code__in={k[0] for k in input_keys},
-                    work_order__in={k[1] for k in input_keys},
-                    op__in={k[2] for k in input_keys},
-                ).values_list("gibun_code", "work_order", "op")
+            duplicate_keys = sorted(
+                find_existing_taskmaster_keys(workplace, input_keys)
             )
-            duplicate_keys = sorted(input_keys & existing_keys)
+            # 보관 기간이 지난 행과 겹친 경우: 겹친 행만 지우고 다시 확인
+            if duplicate_keys and delete_expired_taskmaster_keys(
+                workplace, duplicate_keys
+            ):
+                duplicate_keys = sorted(
+                    find_existing_taskmaster_keys(workplace, input_keys)
+                )
             if duplicate_keys:
                 preview = [
                     f"{gibun}/{wo}/{op}" for gibun, wo, op in duplicate_keys[:10]
@@ -1515,22 +1524,17 @@ class PasteDataView(MasterDataBaseMixin, View):
                     status=409,
                 )
 
-            saved_count = 0
-            with transaction.atomic():
-                for item in normalized:
-                    TaskMaster.objects.update_or_create(
-                        site=workplace,
-                        gibun_code=item["gibun_code"],
-                        work_order=item["work_order"],
-                        op=item["op"],
-                        defaults={
-                            "description": item["description"],
-                            "default_mh": item["default_mh"],
-                        },
-                    )
-                    saved_count += 1
+            result = bulk_upsert_taskmasters(workplace, normalized)
 
-            return JsonResponse({"status": "success", "count": saved_count})
+            return JsonResponse(
+                {
+                    "status": "success",
+                    "count": result["inserted"] + result["updated"],
+                    "inserted": result["inserted"],
+                    "updated": result["updated"],
+                    "skipped": result["skipped"],
+                }
+            )
 
         except json.JSONDecodeError:
             return JsonResponse(
@@ -1908,7 +1912,7 @@ class PasteInputView(SimpleLoginRequiredMixin, View):
             messages.warning(request, "입력된 데이터가 없어서 홈으로 돌아갑니다.")
             return redirect("manhour:index")
 
-        new_items = []
+        parsed_rows = []
         lines = raw_data.strip().split("\n")
 
         for idx, line in enumerate(lines):
@@ -1941,35 +1945,48 @@ class PasteInputView(SimpleLoginRequiredMixin, View):
                         continue
 
                 if wo_val:
-                    task_master, created = TaskMaster.objects.update_or_create(
-                        site=workplace,
-                        work_order=wo_val,
-                        op=op_val,
-                        defaults={
+                    parsed_rows.append(
+                        {
                             "gibun_code": model_val,
+                            "work_order": wo_val,
+                            "op": op_val,
                             "description": desc_val,
                             "default_mh": mh_val,
-                        },
+                        }
                     )
+            except Exception:
+                logger.exception("Failed to process pasted line: %s", line)
+                continue
 
+        new_items = []
+        if parsed_rows:
+            with transaction.atomic():
+                task_masters = bulk_upsert_taskmasters(workplace, parsed_rows)[
+                    "task_masters"
+                ]
+                for row in parsed_rows:
+                    key = taskmaster_key(
+                        row["gibun_code"], row["work_order"], row["op"]
+                    )
                     new_items.append(
                         WorkItem(
                             session=session,
-                            task_master=task_master,
-                            model_type=model_val,
-                            work_order=wo_val,
-                            op=op_val,
-                            description=desc_val,
-                            work_mh=mh_val,
+                            task_master=task_masters.get(key),
+                            model_type=row["gibun_code"],
+                            work_order=row["work_order"],
+                            op=row["op"],
+                            description=row["description"],
+                            work_mh=row["default_mh"],
                         )
                     )
-            except Exception:
-                logger.exception("Failed to process pasted line: %s", line)
-                continue
+                WorkItem.objects.bulk_create(new_items)
+            # 작업이 추가된 세션의 작업자는 근무지 명부에서 최근 사용 시각만 갱신
+            # (작업자 추가가 아니므로 사용 횟수는 올리지 않음)
+            touch_workplace_workers(
+                session.site, session.worker_set.values_list("name", flat=True)
+            )
 
         if new_items:
-            with transaction.atomic():
-                WorkItem.objects.bulk_create(new_items)
             messages.success(request, f"✅ {len(new_items)}건 저장 완료!")
         else:
             messages.warning(request, "저장할 유효한 데이터가 없습니다.")
@@ -2076,6 +2093,20 @@ class PasteItemsView(SimpleLoginRequiredMixin, View):
             work_items = []
 
             with transaction.atomic():
+                task_masters = bulk_upsert_taskmasters(
+                    workplace,
+                    [
+                        {
+                            "gibun_code": item["gibun"],
+                            "work_order": item["wo"],
+                            "op": item["op"],
+                            "description": item["desc"],
+                            "default_mh": item["mh"],
+                        }
+                        for item in normalized
+                    ],
+                )["task_masters"]
+
                 for item in normalized:
                     last_item_ordering += 10
                     gibun = item["gibun"]
@@ -2084,26 +2115,20 @@ class PasteItemsView(SimpleLoginRequiredMixin, View):
                         last_order += 1
                         new_priorities.append(
                             GibunPriority(
-                                session=session, gibun=gibun, order=last_order
+                                session=session,
+                                gibun=gibun,
+                                order=last_order,
+                                link_key=normalize_link_key(gibun),
                             )
                         )
                         added_gibuns.add(gibun)
 
-                    task_master, _ = TaskMaster.objects.update_or_create(
-                        site=workplace,
-                        work_order=item["wo"],
-                        op=item["op"],
-                        defaults={
-                            "gibun_code": gibun,
-                            "description": item["desc"],
-                            "default_mh": item["mh"],
-                        },
-                    )
-
                     work_items.append(
                         WorkItem(
                             session=session,
-                            task_master=task_master,
+                            task_master=task_masters.get(
+                                taskmaster_key(gibun, item["wo"], item["op"])
+                            ),
                             model_type=gibun,
                             gibun_input=gibun,
                             work_order=item["wo"],
@@ -2119,6 +2144,9 @@ class PasteItemsView(SimpleLoginRequiredMixin, View):
 
                 WorkItem.objects.bulk_create(work_items)
 
+            if new_priorities:
+                refresh_link_key(session)
+
             return JsonResponse({"status": "success", "count": len(work_items)})
 
         except json.JSONDecodeError:
@@ -2311,7 +2339,12 @@ class DuplicateMasterItemsView(SimpleLoginRequiredMixin, View):
                 if gibun and gibun not in existing_gibuns and gibun not in added_gibuns:
                     last_order += 1
                     new_priorities.append(
-                        GibunPriority(session=session, gibun=gibun, order=last_order)
+                        GibunPriority(
+                            session=session,
+                            gibun=gibun,
+                            order=last_order,
+                            link_key=normalize_link_key(gibun),
+                        )
                     )
                     added_gibuns.add(gibun)
 
@@ -2334,6 +2367,9 @@ class DuplicateMasterItemsView(SimpleLoginRequiredMixin, View):
                     GibunPriority.objects.bulk_create(new_priorities)
                 WorkItem.objects.bulk_create(new_items)
 
+            if new_priorities:
+                refresh_link_key(session)
+
             return JsonResponse({"status": "success", "count": len(new_items)})
 
         except json.JSONDecodeError:
@@ -2738,6 +2774,7 @@ class DeleteTaskMasterView(SimpleLoginRequiredMixin, View):
             workplace = get_current_workplace(request)
             task = get_object_or_404(TaskMaster, pk=target_pk, site=workplace)
             task.delete()
+            invalidate_dashboard_counts(workplace)
             messages.success(request, f"데이터 '{task.work_order}'가 삭제되었습니다.")
         except Exception as e:
             messages.error(request, f"삭제 중 오류가 발생했습니다: {e}")
@@ -2884,6 +2921,7 @@ class AddSingleItemView(SimpleLoginRequiredMixin, View):
                 GibunPriority.objects.create(
                     session=session, gibun=gibun, order=new_order
                 )
+                refresh_link_key(session)
 
             # 3. 작업자 배정 (선택)
             if worker_name:
@@ -2894,6 +2932,7 @@ class AddSingleItemView(SimpleLoginRequiredMixin, View):
                 if created:
                     worker.limit_mh = get_default_worker_limit_mh(session.site)
                     worker.save(update_fields=["limit_mh"])
+                    record_workplace_workers(session.site, [worker_name])
 
                 # [수정] create -> update_or_create (IntegrityError 방지)
                 Assignment.objects.update_or_create(
@@ -2963,7 +3002,6 @@ class MasterDataListView(SimpleLoginRequiredMixin, ListView):
     context_object_name = "taskmasters"
 
     def get_queryset(self):
-        purge_expired_taskmasters()
         workplace = get_current_workplace(self.request)
         return TaskMaster.objects.filter(site=workplace).order_by(
             "gibun_code", "work_order", "op"
@@ -3024,6 +3062,7 @@ class MasterDataBulkEditView(SimpleLoginRequiredMixin, View):
             deleted_count, _ = TaskMaster.objects.filter(
                 site=workplace, id__in=selected_ids
             ).delete()
+            invalidate_dashboard_counts(workplace)
             if deleted_count > 0:
                 messages.warning(
                     request, f"선택한 {deleted_count}개의 데이터를 삭제했습니다."
@@ -3064,381 +3103,84 @@ class MasterDataCountApiView(MasterDataBaseMixin, View):
         return JsonResponse({"count": count})
 
 
-class DashboardCountsApiView(MasterDataBaseMixin, View):
-    def get(self, request, *args, **kwargs):
-        workplace = get_current_workplace(request)
-        active_count = WorkSession.objects.filter(
-            is_active=True,
-            site=workplace,
-        ).count()
-
-        history_cutoff = timezone.now() - timedelta(
-            hours=get_history_visibility_hours()
-        )
-        history_count = (
-            WorkSession.objects.filter(is_active=False, site=workplace)
-            .filter(
-                Q(finished_at__gte=history_cutoff)
-                | Q(finished_at__isnull=True, created_at__gte=history_cutoff)
-            )
-            .count()
-        )
-
-        master_data_count = self.get_master_data_count()
-
-        return JsonResponse(
-            {
-                "active_count": active_count,
-                "history_count": history_count,
-                "master_data_count": master_data_count,
-            }
-        )
-
-
-def _parse_float(value):
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        return float(str(value).replace(",", ""))
-    except (TypeError, ValueError):
-        return None
-
-
-def _fetch_exchange_rate_usd_krw():
-    api_key = getattr(settings, "EXCHANGE_RATE_API_KEY", "")
-    if not api_key:
-        return None
-
-    url = f"https://v6.exchangerate-api.com/v6/{api_key}/latest/USD"
-
-    try:
-        response = requests.get(url, timeout=6)
-        if not response.ok:
-            return None
-        payload = response.json()
-    except (requests.RequestException, ValueError):
-        return None
-
-    rates = payload.get("conversion_rates", {}) if payload else {}
-    rate = _parse_float(rates.get("KRW"))
-    return {
-        "value": rate,
-        "as_of": payload.get("time_last_update_utc"),
-    }
-
-
-def _fetch_eia_wti():
-    api_key = getattr(settings, "EIA_API_KEY", "")
-    if not api_key:
-        return None
-
-    url = "https://api.eia.gov/v2/petroleum/pri/spt/data/"
-    end = timezone.localdate()
-    start = end - timedelta(days=10)
-
-    try:
-        response = requests.get(
-            url,
-            params={
-                "api_key": api_key,
-                "frequency": "daily",
-                "data[0]": "value",
-                "facets[product][]": "EPCWTI",
-                "start": start.strftime("%Y-%m-%d"),
-                "end": end.strftime("%Y-%m-%d"),
-                "sort[0][column]": "period",
-                "sort[0][direction]": "desc",
-                "offset": 0,
-                "length": 1,
-            },
-            timeout=6,
-        )
-        if not response.ok:
-            return None
-        payload = response.json()
-    except (requests.RequestException, ValueError):
-        return None
-
-    data = payload.get("response", {}).get("data", []) if payload else []
-    if not data:
-        return None
-
-    item = data[0]
-    value = _parse_float(item.get("value"))
-    return {
-        "value": value,
-        "as_of": item.get("period"),
-    }
-
-
-def _fetch_eia_jet_fuel():
-    api_key = getattr(settings, "EIA_API_KEY", "")
-    if not api_key:
-        return None
-
-    url = "https://api.eia.gov/v2/petroleum/pri/spt/data/"
-    end = timezone.localdate()
-    start = end - timedelta(days=10)
-
-    try:
-        response = requests.get(
-            url,
-            params={
-                "api_key": api_key,
-                "frequency": "daily",
-                "data[0]": "value",
-                "facets[product][]": "EPJK",
-                "start": start.strftime("%Y-%m-%d"),
-                "end": end.strftime("%Y-%m-%d"),
-                "sort[0][column]": "period",
-                "sort[0][direction]": "desc",
-                "offset": 0,
-                "length": 1,
-            },
-            timeout=6,
-        )
-        if not response.ok:
-            return None
-        payload = response.json()
-    except (requests.RequestException, ValueError):
-        return None
-
-    data = payload.get("response", {}).get("data", []) if payload else []
-    if not data:
-        return None
-
-    item = data[0]
-    value = _parse_float(item.get("value"))
-    return {
-        "value": value,
-        "as_of": item.get("period"),
-    }
+def _dashboard_counts_etag(request, *args, **kwargs):
+    return dashboard_counts_etag(get_current_workplace(request))
 
 
-def _update_exchange_history(value):
-    if value is None:
-        return cache.get(FINANCIAL_HISTORY_KEY, [])
+def _metar_etag(request, *args, **kwargs):
+    return indicator_etag(CHECKWX_CACHE_KEY)
 
-    history = cache.get(FINANCIAL_HISTORY_KEY, [])
-    label = timezone.localtime().strftime("%H:%M")
 
-    if history and history[-1].get("value") == value:
-        return history
+def _financial_indicators_etag(request, *args, **kwargs):
+    return financial_indicators_etag()
 
-    history.append({"label": label, "value": value})
-    max_points = getattr(settings, "FINANCIAL_HISTORY_MAX_POINTS", 48)
-    history = history[-max_points:]
-    cache.set(FINANCIAL_HISTORY_KEY, history, 24 * 60 * 60)
-    return history
 
+def _weather_forecast_etag(request, *args, **kwargs):
+    return weather_forecast_etag(WeatherForecastApiView.get_airport_code(request))
 
-def _fetch_checkwx_metar():
-    api_key = getattr(settings, "CHECKWX_API_KEY", "")
-    if not api_key:
-        return []
 
-    stations = getattr(settings, "CHECKWX_STATIONS", "RKSI,RKSS")
-    stations = ",".join(
-        [code.strip().upper() for code in stations.split(",") if code.strip()]
-    )
-    if not stations:
-        return []
+# 폴링 응답은 브라우저가 매번 ETag로 재검증(304)하도록 함
+poll_revalidate = cache_control(private=True, no_cache=True)
 
-    url = f"https://api.checkwx.com/metar/{stations}/decoded"
 
-    try:
-        response = requests.get(
-            url,
-            headers={"X-API-Key": api_key},
-            timeout=6,
-        )
-        if not response.ok:
-            return []
-        payload = response.json()
-    except (requests.RequestException, ValueError):
-        return []
-
-    data = payload.get("data", []) if payload else []
-    results = []
-    for item in data:
-        wind_dir = item.get("wind", {}).get("direction")
-        wind_speed = item.get("wind", {}).get("speed_kts")
-        pressure_hpa = item.get("barometer", {}).get("hpa") or item.get(
-            "altimeter", {}
-        ).get("hpa")
-
-        results.append(
-            {
-                "icao": item.get("icao"),
-                "station": item.get("station", {}).get("name"),
-                "observed": item.get("observed"),
-                "raw_text": item.get("raw_text"),
-                "flight_category": item.get("flight_category"),
-                "temp_c": item.get("temperature", {}).get("celsius"),
-                "wind": wind_dir and wind_speed and f"{wind_dir}° {wind_speed}kt",
-                "wind_dir": wind_dir,
-                "wind_speed": wind_speed,
-                "pressure_hpa": pressure_hpa,
-                "visibility": item.get("visibility", {}).get("meters"),
-            }
-        )
-    return results
+class DashboardCountsApiView(MasterDataBaseMixin, View):
+    @method_decorator(poll_revalidate)
+    @method_decorator(condition(etag_func=_dashboard_counts_etag))
+    def get(self, request, *args, **kwargs):
+        workplace = get_current_workplace(request)
+        return JsonResponse(get_dashboard_counts(workplace))
 
 
 class CheckWxMetarApiView(View):
+    # 외부 API는 refresh_indicators가 갱신하고, 여기서는 캐시 값과 경과 시간만 응답
+    @method_decorator(poll_revalidate)
+    @method_decorator(condition(etag_func=_metar_etag))
     def get(self, request, *args, **kwargs):
-        cached = cache.get(CHECKWX_CACHE_KEY)
-        if cached is not None:
-            return JsonResponse({"stations": cached})
+        stations, age = get_checkwx_metar()
+        return JsonResponse({"stations": stations or [], "age_seconds": age})
 
-        stations = _fetch_checkwx_metar()
-        cache_seconds = getattr(settings, "CHECKWX_CACHE_SECONDS", 600)
-        cache.set(CHECKWX_CACHE_KEY, stations, cache_seconds)
-        return JsonResponse({"stations": stations})
 
+class FinancialIndicatorsApiView(View):
+    @method_decorator(poll_revalidate)
+    @method_decorator(condition(etag_func=_financial_indicators_etag))
+    def get(self, request, *args, **kwargs):
+        indicators, age = get_financial_indicators()
+        return JsonResponse({**(indicators or {}), "age_seconds": age})
 
-class WeatherForecastApiView(View):
 
-    AIRPORTS = {
-        "RKSI": {
-            "name": "Incheon Airport",
-            "lat": 37.4602,
-            "lon": 126.4407,
-        },
-        "RKSS": {
-            "name": "Gimpo Airport",
-            "lat": 37.5583,
-            "lon": 126.7906,
-        },
+class WeatherForecastApiView(View):
+    EMPTY_FORECAST = {
+        "hours": [],
+        "wind_speeds": [],
+        "wind_gusts": [],
+        "rain_probs": [],
+        "visibility": [],
+        "cloud_cover": [],
     }
 
-    DEFAULT_AIRPORT = "RKSI"
-
+    @staticmethod
+    def get_airport_code(request):
+        airport_code = request.GET.get("airport", DEFAULT_WEATHER_AIRPORT).upper()
+        if airport_code not in WEATHER_AIRPORTS:
+            airport_code = DEFAULT_WEATHER_AIRPORT
+        return airport_code
+
+    @method_decorator(poll_revalidate)
+    @method_decorator(condition(etag_func=_weather_forecast_etag))
     def get(self, request, *args, **kwargs):
-        try:
-            forecast_data = self.fetch_weather_forecast(request)
+        airport_code = self.get_airport_code(request)
 
-            return JsonResponse(forecast_data)
-
-        except Exception as e:
+        forecast_data, age = get_weather_forecast(airport_code)
+        if forecast_data is None:
+            # 첫 갱신 전: 빈 예보를 돌려주고 다음 폴링에서 채워짐
             return JsonResponse(
                 {
-                    "error": str(e),
-                    "hours": [],
-                    "wind_speeds": [],
-                    "wind_gusts": [],
-                    "rain_probs": [],
-                    "visibility": [],
-                    "cloud_cover": [],
-                },
-                status=500,
+                    "city": WEATHER_AIRPORTS[airport_code]["name"],
+                    **self.EMPTY_FORECAST,
+                    "age_seconds": None,
+                }
             )
-
-    def get_airport(self, request):
-        airport_code = request.GET.get("airport", self.DEFAULT_AIRPORT).upper()
-        return self.AIRPORTS.get(airport_code, self.AIRPORTS[self.DEFAULT_AIRPORT])
-
-    def fetch_weather_forecast(self, request):
-        """
-        Open-Meteo API 호출
-        """
-        airport = self.get_airport(request)
-
-        lat = airport["lat"]
-        lon = airport["lon"]
-
-        url = "https://api.open-meteo.com/v1/forecast"
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "timezone": "Asia/Seoul",
-            "forecast_days": 1,
-            "wind_speed_unit": "kn",
-            "hourly": (
-                "wind_speed_10m,"
-                "wind_gusts_10m,"
-                "precipitation_probability,"
-                "visibility,"
-                "cloud_cover"
-            ),
-        }
-
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
-        return self.build_response_data(data, airport)
-
-    def build_response_data(self, data, airport):
-        """
-        프론트 전달용 데이터 변환
-        """
-
-        hourly = data.get("hourly", {})
-
-        times = hourly.get("time", [])
-
-        wind_speed = hourly.get("wind_speed_10m", [])
-        wind_gust = hourly.get("wind_gusts_10m", [])
-
-        rain_prob = hourly.get(
-            "precipitation_probability",
-            [],
-        )
-
-        visibility = hourly.get("visibility", [])
-
-        cloud_cover = hourly.get("cloud_cover", [])
-
-        labels = []
-        winds = []
-        gusts = []
-        rains = []
-        visibilities = []
-        clouds = []
-
-        now_local = timezone.localtime().replace(minute=0, second=0, microsecond=0)
-
-        start_index = 0
-
-        for i, time_text in enumerate(times):
-            try:
-                forecast_time = datetime.strptime(time_text, "%Y-%m-%dT%H:%M")
-                forecast_time = timezone.make_aware(
-                    forecast_time,
-                    timezone.get_current_timezone(),
-                )
-
-                if forecast_time >= now_local:
-                    start_index = i
-                    break
-            except ValueError:
-                continue
-
-        end_index = min(start_index + 8, len(times))
-
-        for i in range(start_index, end_index):
-            hour = times[i].split("T")[1][:2]
-
-            labels.append(f"{hour}시")
-            winds.append(round(float(wind_speed[i]), 1))
-            gusts.append(round(float(wind_gust[i]), 1))
-            rains.append(int(rain_prob[i]))
-            visibilities.append(int(visibility[i]))
-            clouds.append(int(cloud_cover[i]))
-
-        return {
-            "city": airport["name"],
-            "hours": labels,
-            "wind_speeds": winds,
-            "wind_gusts": gusts,
-            "rain_probs": rains,
-            "visibility": visibilities,
-            "cloud_cover": clouds,
-        }
+        return JsonResponse({**forecast_data, "age_seconds": age})
 
 
 class TaskMasterDeleteView(SimpleLoginRequiredMixin, DeleteView):
@@ -3452,6 +3194,7 @@ class TaskMasterDeleteView(SimpleLoginRequiredMixin, DeleteView):
     def form_valid(self, form):
         self.object = self.get_object()
         self.object.delete()
+        invalidate_dashboard_counts(self.object.site)
         messages.success(self.request, "항목이 삭제되었습니다.")
 
         # 돌아갈 페이지 유동적 처리
@@ -3469,6 +3212,7 @@ class TaskMasterDeleteAllView(SimpleAdminRequiredMixin, View):
         count = TaskMaster.objects.filter(site=workplace).count()
         if count > 0:
             TaskMaster.objects.filter(site=workplace).delete()
+            invalidate_dashboard_counts(workplace)
             messages.warning(request, f"총 {count}개의 데이터가 모두 삭제되었습니다.")
         else:
             messages.info(request, "삭제할 데이터가 없습니다.")
@@ -3529,28 +3273,56 @@ class ReorderItemsView(SimpleLoginRequiredMixin, View):
                     gibun_order.append(gibun)
                     seen_gibun.add(gibun)
 
-            with transaction.atomic():
-                for idx, gibun in enumerate(gibun_order, start=1):
-                    GibunPriority.objects.update_or_create(
-                        session=session,
-                        gibun=gibun,
-                        defaults={"order": idx},
+            # 변경할 순서를 메모리에서 먼저 계산한 뒤 모델별로 한 번에 저장
+            existing_priorities = {
+                gp.gibun: gp
+                for gp in GibunPriority.objects.filter(
+                    session=session, gibun__in=gibun_order
+                )
+            }
+            priorities_to_update = []
+            priorities_to_create = []
+            for idx, gibun in enumerate(gibun_order, start=1):
+                gp = existing_priorities.get(gibun)
+                if gp is None:
+                    priorities_to_create.append(
+                        GibunPriority(
+                            session=session,
+                            gibun=gibun,
+                            order=idx,
+                            link_key=normalize_link_key(gibun),
+                        )
                     )
+                elif gp.order != idx:
+                    gp.order = idx
+                    priorities_to_update.append(gp)
 
-                # 기번 내부 순서 저장
-                per_gibun_index = {}
-                for item_id in ordered_ids_int:
-                    item = item_map.get(item_id)
-                    if not item:
-                        continue
-                    gibun = (item.gibun_input or "").strip()
-                    if gibun not in per_gibun_index:
-                        per_gibun_index[gibun] = 0
-                    per_gibun_index[gibun] += 1
-                    new_ordering = per_gibun_index[gibun] * 10
-                    if item.ordering != new_ordering:
-                        item.ordering = new_ordering
-                        item.save(update_fields=["ordering"])
+            # 기번 내부 순서
+            per_gibun_index = {}
+            items_to_update = []
+            for item_id in ordered_ids_int:
+                item = item_map.get(item_id)
+                if not item:
+                    continue
+                gibun = (item.gibun_input or "").strip()
+                if gibun not in per_gibun_index:
+                    per_gibun_index[gibun] = 0
+                per_gibun_index[gibun] += 1
+                new_ordering = per_gibun_index[gibun] * 10
+                if item.ordering != new_ordering:
+                    item.ordering = new_ordering
+                    items_to_update.append(item)
+
+            with transaction.atomic():
+                if priorities_to_create:
+                    GibunPriority.objects.bulk_create(priorities_to_create)
+                if priorities_to_update:
+                    GibunPriority.objects.bulk_update(priorities_to_update, ["order"])
+                if items_to_update:
+                    WorkItem.objects.bulk_update(items_to_update, ["ordering"])
+
+            if priorities_to_create or priorities_to_update:
+                refresh_link_key(session)
 
             return JsonResponse({"status": "success"})
 
@@ -3598,13 +3370,16 @@ class ReorderGibunView(SimpleLoginRequiredMixin, View):
                 priorities[current_idx],
             )
 
-        # 5. 재번호 매기기 (1, 2, 3... 순서로 DB 업데이트)
-        with transaction.atomic():
-            for i, gp in enumerate(priorities):
-                new_order = i + 1
-                if gp.order != new_order:
-                    gp.order = new_order
-                    gp.save(update_fields=["order"])
+        # 5. 재번호 매기기 (1, 2, 3... 순서로 바뀐 행만 한 번에 업데이트)
+        changed = []
+        for i, gp in enumerate(priorities):
+            new_order = i + 1
+            if gp.order != new_order:
+                gp.order = new_order
+                changed.append(gp)
+        if changed:
+            GibunPriority.objects.bulk_update(changed, ["order"])
+            refresh_link_key(session)
 
         # 6. 관리 페이지로 복귀
         return redirect("manhour:manage_items", session_id=session.id)
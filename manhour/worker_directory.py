@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import WorkplaceWorker
+
+
+def record_workplace_workers(site: str, names, seen_at=None) -> None:
+    """
+    세션에 작업자가 추가될 때 근무지 명부를 갱신합니다.
+    이미 있는 이름은 최근 사용 시각/횟수만 올리고, 없는 이름은 새로 추가합니다.
+    """
+    names = list(dict.fromkeys(name for name in names if name))
+    if not site or not names:
+        return
+    seen_at = seen_at or timezone.now()
+
+    WorkplaceWorker.objects.filter(site=site, name__in=names).update(
+        last_seen_at=seen_at,
+        usage_count=F("usage_count") + 1,
+    )
+    WorkplaceWorker.objects.bulk_create(
+        [
+            WorkplaceWorker(site=site, name=name, last_seen_at=seen_at, usage_count=1)
+            for name in names
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def touch_workplace_workers(site: str, names, seen_at=None) -> None:
+    """
+    기존 세션 작업자가 다시 쓰일 때 호출: 사용 횟수는 그대로 두고 최근 사용 시각만 올립니다.
+    명부에 없는 이름은 record_workplace_workers와 같이 새로 추가합니다.
+    """
+    names = list(dict.fromkeys(name for name in names if name))
+    if not site or not names:
+        return
+    seen_at = seen_at or timezone.now()
+
+    WorkplaceWorker.objects.filter(site=site, name__in=names).update(
+        last_seen_at=seen_at
+    )
+    WorkplaceWorker.objects.bulk_create(
+        [
+            WorkplaceWorker(site=site, name=name, last_seen_at=seen_at, usage_count=1)
+            for name in names
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def get_workplace_worker_names(site: str, since=None) -> list[str]:
+    """근무지 명부의 이름 목록 (since를 주면 그 이후 사용된 사람만)"""
+    qs = WorkplaceWorker.objects.filter(site=site)
+    if since is not None:
+        qs = qs.filter(last_seen_at__gte=since)
+    return list(qs.order_by("name").values_list("name", flat=True))
@@ -3,6 +3,8 @@ from __future__ import annotations
 from django.db import transaction
 from django.db.utils import OperationalError, ProgrammingError
 
+from .app_settings import invalidate_app_settings
+from .caching import VersionedRegistry
 from .models import (
     AppSetting,
     DefaultWorkerDirectory,
@@ -10,6 +12,11 @@ from .models import (
     TaskMaster,
     WorkSession,
     Workplace,
+    WorkplaceWorker,
+)
+from .session_status import (
+    invalidate_manning_session_status,
+    invalidate_session_status,
 )
 from .workplace_config import (
     DEFAULT_WORKPLACE_DEFINITIONS,
@@ -45,6 +52,23 @@ def _update_scoped_models_for_code_change(old_codes: set[str], new_code: str) ->
         DefaultWorkerDirectory.objects.get_or_create(site=new_code, name=directory.name)
         directory.delete()
 
+    for entry in WorkplaceWorker.objects.filter(site__in=source_codes).exclude(
+        site=new_code
+    ):
+        merged, created = WorkplaceWorker.objects.get_or_create(
+            site=new_code,
+            name=entry.name,
+            defaults={
+                "last_seen_at": entry.last_seen_at,
+                "usage_count": entry.usage_count,
+            },
+        )
+        if not created:
+            merged.last_seen_at = max(merged.last_seen_at, entry.last_seen_at)
+            merged.usage_count += entry.usage_count
+            merged.save(update_fields=["last_seen_at", "usage_count"])
+        entry.delete()
+
     TaskMaster.objects.filter(site__in=source_codes).update(site=new_code)
     WorkSession.objects.filter(site__in=source_codes).update(site=new_code)
     FeaturedVideo.objects.filter(site__in=source_codes).update(site=new_code)
@@ -58,6 +82,10 @@ def rename_workplace_code(
     alias_values.add(old_code)
     with transaction.atomic():
         _update_scoped_models_for_code_change(alias_values, new_code)
+    invalidate_workplace_registry()
+    invalidate_app_settings()
+    invalidate_session_status()
+    invalidate_manning_session_status()
 
 
 def ensure_default_workplaces() -> None:
@@ -78,6 +106,7 @@ def ensure_default_workplaces() -> None:
             for definition in DEFAULT_WORKPLACE_DEFINITIONS
         ]
     )
+    invalidate_workplace_registry()
 
 
 def get_workplaces(include_inactive: bool = False) -> list[Workplace]:
@@ -91,10 +120,40 @@ def get_workplaces(include_inactive: bool = False) -> list[Workplace]:
         return []
 
 
+def _load_workplace_registry() -> dict | None:
+    ensure_default_workplaces()
+    try:
+        rows = list(
+            Workplace.objects.order_by("sort_order", "id").values_list(
+                "code", "label", "is_active"
+            )
+        )
+    except (OperationalError, ProgrammingError):
+        return None
+    if not rows:
+        return None
+    return {
+        "all": [(code, label) for code, label, _ in rows],
+        "active": [(code, label) for code, label, is_active in rows if is_active],
+        "labels": {code: label for code, label, _ in rows},
+        "aliases": {label: code for code, label, _ in rows},
+    }
+
+
+# code -> label/별칭 매핑을 프로세스당 한 번만 읽고, Workplace가 바뀌면 다시 읽습니다.
+_workplace_registry = VersionedRegistry("workplaces", _load_workplace_registry)
+
+
+def invalidate_workplace_registry() -> None:
+    _workplace_registry.invalidate()
+
+
 def get_workplace_choices(include_inactive: bool = False) -> list[tuple[str, str]]:
-    workplaces = get_workplaces(include_inactive=include_inactive)
-    if workplaces:
-        return [(workplace.code, workplace.label) for workplace in workplaces]
+    registry = _workplace_registry.get()
+    if registry:
+        choices = registry["all"] if include_inactive else registry["active"]
+        if choices:
+            return list(choices)
     return get_default_workplace_choices()
 
 
@@ -105,15 +164,15 @@ def get_workplace_label_map(include_inactive: bool = False) -> dict[str, str]:
 def normalize_workplace(workplace: str | None) -> str:
     if not workplace:
         return ""
-    valid = {code for code, _ in get_workplace_choices(include_inactive=True)}
-    if workplace in valid:
+    registry = _workplace_registry.get()
+    if registry:
+        labels, aliases = registry["labels"], registry["aliases"]
+    else:
+        labels = dict(get_default_workplace_choices())
+        aliases = {label: code for code, label in labels.items()}
+    if workplace in labels:
         return workplace
-    label_map = {
-        label: code for code, label in get_workplace_choices(include_inactive=True)
-    }
-    if workplace in label_map:
-        return label_map[workplace]
-    return ""
+    return aliases.get(workplace, "")
 
 
 def get_workplace_label(workplace: str | None) -> str:
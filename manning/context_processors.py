@@ -1,10 +1,11 @@
-from .models import WorkSession
-from manhour.workplaces import get_workplace_choices
+from manhour.session_status import get_manning_session_status
+from manhour.workplaces import get_workplace_choices, normalize_workplace
 
 
 def active_session_status(request):
-    active_count = WorkSession.objects.filter(is_active=True).count()
+    workplace = normalize_workplace(request.session.get("workplace"))
+    status = get_manning_session_status(workplace)
     return {
-        "active_count": active_count,
+        "active_count": status["active_count"],
         "navbar_workplace_options": get_workplace_choices(),
     }
@@ -0,0 +1,43 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+from manhour.utils import normalize_link_key
+
+
+def backfill_link_keys(apps, schema_editor):
+    WorkSession = apps.get_model("manning", "WorkSession")
+
+    sessions = []
+    for session in WorkSession.objects.only("id", "aircraft_reg"):
+        session.link_key = normalize_link_key(session.aircraft_reg)
+        if session.link_key:
+            sessions.append(session)
+    WorkSession.objects.bulk_update(sessions, ["link_key"], batch_size=500)
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manhour", "0031_session_link_key"),
+        ("manning", "0034_worksession_memo_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worksession",
+            name="link_key",
+            field=models.CharField(blank=True, default="", max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name="worksession",
+            index=models.Index(
+                fields=["site", "link_key"], name="manning_ws_site_link_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_link_keys, noop_reverse),
+    ]
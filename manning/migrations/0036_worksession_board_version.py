@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manning", "0035_session_link_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worksession",
+            name="board_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from manhour.utils import normalize_link_key
+
 
 class WorkSession(models.Model):
     BLOCK_CHECK_1A = "1A"
@@ -64,6 +66,22 @@ class WorkSession(models.Model):
     afternoon_card = models.TextField(blank=True, default="")
     afternoon_towing = models.TextField(blank=True, default="")
     special_note = models.TextField(blank=True, default="")
+    # 보드(구역/배치 인원) 변경 시마다 증가: 이동 API의 낙관적 동시성 검사용
+    board_version = models.PositiveIntegerField(default=0)
+    # manhour 세션 연결용: 정규화한 등록번호(aircraft_reg)
+    link_key = models.CharField(max_length=50, blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["site", "link_key"], name="manning_ws_site_link_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.link_key = normalize_link_key(self.aircraft_reg)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "aircraft_reg" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "link_key"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         label = self.work_package_name or self.name
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from django.db import transaction
+
+from manhour.session_links import find_manhour_session
+
+from .models import Manning, SessionArea, WorkerDirectory, WorkSession
+
+# 교대 인계 시 그대로 넘기는 세션 정보(메모 포함)
+CLONED_SESSION_FIELDS = [
+    "name",
+    "work_package_name",
+    "aircraft_reg",
+    "block_check",
+    "site",
+    "memo",
+    "important_process",
+    "morning_tool",
+    "morning_material",
+    "morning_bench",
+    "morning_towing",
+    "afternoon_cleanup",
+    "afternoon_card",
+    "afternoon_towing",
+    "special_note",
+]
+
+
+def clone_manning_session(source: WorkSession, shift_type: str) -> WorkSession:
+    """
+    source 세션의 구역/배치 인원/작업자 명단/메모를 새 근무 형태 세션으로 복사합니다.
+    구역은 bulk_create로 만든 뒤 원본 구역 id → 새 구역으로 다시 연결하고,
+    manhour 세션은 link_key 인덱스로 찾아 연결합니다.
+    """
+    areas = list(
+        SessionArea.objects.filter(session=source).order_by(
+            "position", "ordering", "id"
+        )
+    )
+    mannings = list(
+        Manning.objects.filter(area__session=source)
+        .order_by("area_id", "id")
+        .values("area_id", "worker_name", "hours", "memo")
+    )
+    directory_names = list(
+        WorkerDirectory.objects.filter(session=source)
+        .order_by("name")
+        .values_list("name", flat=True)
+    )
+
+    with transaction.atomic():
+        session = WorkSession(
+            shift_type=shift_type,
+            is_active=True,
+            **{field: getattr(source, field) for field in CLONED_SESSION_FIELDS},
+        )
+        session.save()
+        session.manhour_session = find_manhour_session(session, workplace=session.site)
+        if session.manhour_session_id:
+            session.save(update_fields=["manhour_session"])
+
+        new_areas = SessionArea.objects.bulk_create(
+            [
+                SessionArea(
+                    session=session,
+                    name=area.name,
+                    position=area.position,
+                    ordering=area.ordering,
+                )
+                for area in areas
+            ]
+        )
+        # bulk_create는 입력 순서대로 pk를 채워 돌려주므로 원본과 1:1 대응
+        area_map = {old.id: new for old, new in zip(areas, new_areas)}
+
+        Manning.objects.bulk_create(
+            [
+                Manning(
+                    area=area_map[row["area_id"]],
+                    worker_name=row["worker_name"],
+                    hours=row["hours"],
+                    memo=row["memo"],
+                )
+                for row in mannings
+            ]
+        )
+        WorkerDirectory.objects.bulk_create(
+            [WorkerDirectory(session=session, name=name) for name in directory_names]
+        )
+
+    return session
@@ -1,10 +1,29 @@
-from django.test import TestCase
+import json
+from unittest import mock
+
+from django.contrib.messages import get_messages
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
+from manhour.models import GibunPriority as ManhourGibunPriority
 from manhour.models import WorkSession as ManhourWorkSession
-from manhour.models import Workplace
+from manhour.models import Workplace, WorkplaceWorker
 
-from .models import Manning, SessionArea, WorkSession
+from .models import (
+    AreaTemplate,
+    AreaTemplateItem,
+    Manning,
+    SessionArea,
+    WorkSession,
+)
+from .views import (
+    _get_area_template_choices,
+    _get_area_template_items,
+    _resolve_session_template_key,
+)
 
 
 class WorkplaceIsolationTests(TestCase):
@@ -81,3 +100,474 @@ class WorkplaceIsolationTests(TestCase):
 
         self.assertEqual(response.status_code, 302)
         self.assertTrue(ManhourWorkSession.objects.filter(id=manhour_session.id).exists())
+
+
+class AreaTemplateRegistryTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["user_role"] = "admin"
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def test_editor_save_refreshes_lookup_and_signature_match(self):
+        _get_area_template_choices()
+
+        self.client.post(
+            reverse("manning:template_editor"),
+            {
+                "new_template_key": "Wide",
+                "new_template_label": "Wide body",
+                "new_template_order": "1",
+                "new_template_left_items": "L1\nL2",
+                "new_template_none_items": "",
+                "new_template_right_items": "R1",
+            },
+        )
+        _get_area_template_choices()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                _get_area_template_choices(), [{"key": "Wide", "label": "Wide body"}]
+            )
+            self.assertEqual(
+                _get_area_template_items("wide"),
+                [("LEFT", "L1"), ("LEFT", "L2"), ("RIGHT", "R1")],
+            )
+
+        session = WorkSession.objects.create(name="S", site="SITE-A")
+        for position, name in [("RIGHT", " r1 "), ("LEFT", "L2"), ("LEFT", "l1")]:
+            SessionArea.objects.create(session=session, position=position, name=name)
+        self.assertEqual(_resolve_session_template_key(session), "Wide")
+
+    def test_editor_save_diffs_items_with_bulk_statements(self):
+        keep = AreaTemplate.objects.create(key="keep", label="Keep")
+        drop = AreaTemplate.objects.create(key="drop", label="Drop")
+        for order, name in enumerate(["A", "B", "C"]):
+            AreaTemplateItem.objects.create(
+                template=keep, position="LEFT", name=name, sort_order=order
+            )
+        original_ids = list(
+            AreaTemplateItem.objects.filter(template=keep).values_list("id", flat=True)
+        )
+
+        payload = {
+            "template_ids": [str(keep.id), str(drop.id)],
+            "template_delete_ids": [str(drop.id)],
+            f"template_key_{keep.id}": "keep",
+            f"template_label_{keep.id}": "Keep 2",
+            f"template_order_{keep.id}": "3",
+            f"template_left_items_{keep.id}": "A\nX",
+            f"template_none_items_{keep.id}": "",
+            f"template_right_items_{keep.id}": "",
+        }
+        payload.update(
+            {
+                "new_template_key": "new",
+                "new_template_label": "New",
+                "new_template_order": "4",
+                "new_template_left_items": "\n".join(f"N{i}" for i in range(40)),
+                "new_template_none_items": "",
+                "new_template_right_items": "",
+            }
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(reverse("manning:template_editor"), payload)
+        self.assertLess(len(ctx.captured_queries), 25)
+
+        keep.refresh_from_db()
+        self.assertEqual((keep.label, keep.sort_order), ("Keep 2", 3))
+        self.assertEqual(
+            list(
+                AreaTemplateItem.objects.filter(template=keep)
+                .order_by("sort_order")
+                .values_list("id", "name")
+            ),
+            [(original_ids[0], "A"), (original_ids[1], "X")],
+        )
+        self.assertFalse(AreaTemplate.objects.filter(key="drop").exists())
+        self.assertEqual(
+            AreaTemplateItem.objects.filter(template__key="new").count(), 40
+        )
+
+    def test_editor_save_reuses_keys_freed_in_same_submission(self):
+        renamed = AreaTemplate.objects.create(key="narrow", label="Narrow")
+        dropped = AreaTemplate.objects.create(key="wide", label="Wide")
+
+        response = self.client.post(
+            reverse("manning:template_editor"),
+            {
+                "template_ids": [str(renamed.id), str(dropped.id)],
+                "template_delete_ids": [str(dropped.id)],
+                f"template_key_{renamed.id}": "narrow-old",
+                f"template_label_{renamed.id}": "Narrow old",
+                "new_template_key": ["narrow", "wide"],
+                "new_template_label": ["Narrow new", "Wide new"],
+                "new_template_order": ["1", "2"],
+                "new_template_left_items": ["L1", "W1"],
+                "new_template_none_items": ["", ""],
+                "new_template_right_items": ["", ""],
+            },
+        )
+
+        self.assertEqual(list(get_messages(response.wsgi_request)), [])
+        self.assertEqual(
+            dict(AreaTemplate.objects.values_list("key", "label")),
+            {"narrow-old": "Narrow old", "narrow": "Narrow new", "wide": "Wide new"},
+        )
+        self.assertEqual(
+            list(
+                AreaTemplateItem.objects.filter(template__key="narrow").values_list(
+                    "position", "name"
+                )
+            ),
+            [("LEFT", "L1")],
+        )
+
+
+class AreaBulkEditTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        self.session = WorkSession.objects.create(name="S", site="SITE-A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def _post(self, areas, new_areas=()):
+        payload = {
+            "area_id": [str(area.id) for area, _, _ in areas],
+            "area_name": [name for _, name, _ in areas],
+            "area_position": ["LEFT" for _ in areas],
+            "area_workers": [workers for _, _, workers in areas],
+            "area_order": [str(idx) for idx, _ in enumerate(areas)],
+            "new_area_name": [name for name, _ in new_areas],
+            "new_area_position": ["RIGHT" for _ in new_areas],
+            "new_area_workers": [workers for _, workers in new_areas],
+        }
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse("manning:area_bulk_edit", args=[self.session.id]), payload
+            )
+        return response, len(ctx.captured_queries)
+
+    def test_board_edit_is_applied_as_a_set_diff(self):
+        area = SessionArea.objects.create(session=self.session, name="A1")
+        Manning.objects.create(area=area, worker_name="Kim")
+        Manning.objects.create(area=area, worker_name="Lee")
+
+        response, _ = self._post(
+            [(area, "A1 renamed", "Lee, Park, Park")], [("N1", "Choi")]
+        )
+
+        self.assertEqual(response.status_code, 302)
+        area.refresh_from_db()
+        self.assertEqual(area.name, "A1 renamed")
+        self.assertEqual(
+            sorted(area.manning_set.values_list("worker_name", flat=True)),
+            ["Lee", "Park"],
+        )
+        new_area = SessionArea.objects.get(session=self.session, name="N1")
+        self.assertEqual(
+            list(new_area.manning_set.values_list("worker_name", flat=True)), ["Choi"]
+        )
+
+    def test_statement_count_does_not_grow_with_board_size(self):
+        areas = [
+            SessionArea.objects.create(session=self.session, name=f"A{i}")
+            for i in range(40)
+        ]
+        self._post([])  # 근무지 레지스트리 등 첫 요청 캐시 적재
+        _, small = self._post(
+            [(area, f"B{i}", "Lee, Park") for i, area in enumerate(areas[:2])],
+            [("N0", "Choi")],
+        )
+        _, large = self._post(
+            [(area, f"C{i}", "Lee, Park") for i, area in enumerate(areas[2:])],
+            [(f"N{i}", "Choi") for i in range(1, 6)],
+        )
+        self.assertEqual(small, large)
+
+    @override_settings(
+        STORAGES={
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {
+                "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+            },
+        }
+    )
+    def test_worker_suggestions_come_from_workplace_directory(self):
+        WorkplaceWorker.objects.create(
+            site="SITE-A", name="Kim", last_seen_at=timezone.now()
+        )
+        WorkplaceWorker.objects.create(
+            site="SITE-B", name="Other", last_seen_at=timezone.now()
+        )
+
+        response = self.client.get(
+            reverse("manning:area_bulk_edit", args=[self.session.id])
+        )
+
+        self.assertEqual(response.context["known_worker_names"], ["Kim"])
+        self.assertContains(response, '<option value="Kim">')
+
+    def test_rejects_area_from_another_session(self):
+        other = WorkSession.objects.create(name="O", site="SITE-A")
+        foreign = SessionArea.objects.create(session=other, name="X")
+
+        response, _ = self._post([(foreign, "Changed", "")])
+
+        self.assertEqual(response.status_code, 404)
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.name, "X")
+
+
+class BatchManningTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        self.session = WorkSession.objects.create(name="S", site="SITE-A")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def _post(self, payload):
+        return self.client.post(
+            reverse("manning:batch_manning"),
+            json.dumps(payload),
+            content_type="application/json",
+        )
+
+    def test_places_team_across_areas_and_reports_inserted_names(self):
+        left = SessionArea.objects.create(session=self.session, name="L")
+        right = SessionArea.objects.create(session=self.session, name="R")
+        Manning.objects.create(area=left, worker_name="Kim")
+
+        response = self._post(
+            {
+                "placements": [
+                    {"area_id": left.id, "worker_names": ["Kim", "Lee", "Lee"]},
+                    {"area_id": right.id, "worker_names": ["Park"]},
+                ]
+            }
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["inserted"],
+            {str(left.id): ["Lee"], str(right.id): ["Park"]},
+        )
+        self.assertEqual(Manning.objects.filter(area=left).count(), 2)
+
+        legacy = self._post({"area_id": right.id, "worker_names": ["Park"]})
+        self.assertEqual(legacy.json()["inserted"], {str(right.id): []})
+
+    def test_rejects_areas_from_another_workplace(self):
+        other = WorkSession.objects.create(name="O", site="SITE-B")
+        foreign = SessionArea.objects.create(session=other, name="X")
+
+        response = self._post({"area_id": foreign.id, "worker_names": ["Kim"]})
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Manning.objects.filter(area=foreign).exists())
+
+
+class ApplyManningMovesTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        self.session = WorkSession.objects.create(name="S", site="SITE-A")
+        self.left = SessionArea.objects.create(session=self.session, name="L")
+        self.right = SessionArea.objects.create(session=self.session, name="R")
+        Manning.objects.create(area=self.left, worker_name="Kim")
+        Manning.objects.create(area=self.right, worker_name="Lee")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def _post(self, version, moves):
+        return self.client.post(
+            reverse("manning:apply_manning_moves", args=[self.session.id]),
+            json.dumps({"version": version, "moves": moves}),
+            content_type="application/json",
+        )
+
+    def test_swap_is_applied_atomically_with_version_check(self):
+        moves = [
+            {"worker_name": "Kim", "from_area": self.left.id, "to_area": self.right.id},
+            {"worker_name": "Lee", "from_area": self.right.id, "to_area": self.left.id},
+        ]
+
+        response = self._post(0, moves)
+
+        self.assertEqual(response.json(), {"status": "success", "moved": 2, "version": 1})
+        self.assertEqual(
+            list(self.right.manning_set.values_list("worker_name", flat=True)), ["Kim"]
+        )
+        self.assertEqual(
+            list(self.left.manning_set.values_list("worker_name", flat=True)), ["Lee"]
+        )
+
+        stale = self._post(0, moves)
+        self.assertEqual(stale.status_code, 409)
+        self.assertEqual(stale.json()["version"], 1)
+
+    @override_settings(
+        STORAGES={
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {
+                "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+            },
+        }
+    )
+    def test_dashboard_exposes_move_targets(self):
+        response = self.client.get(
+            reverse("manning:manning_dashboard", args=[self.session.id])
+        )
+
+        self.assertContains(
+            response,
+            reverse("manning:apply_manning_moves", args=[self.session.id]),
+        )
+        self.assertContains(response, f'data-area-id="{self.left.id}"')
+        self.assertContains(response, 'data-worker-name="Kim"')
+        self.assertContains(response, "js/manning/manning_dashboard.js")
+
+    def test_duplicate_destination_rolls_back(self):
+        Manning.objects.create(area=self.right, worker_name="Kim")
+
+        response = self._post(
+            0,
+            [{"worker_name": "Kim", "from_area": self.left.id, "to_area": self.right.id}],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.board_version, 0)
+        self.assertTrue(self.left.manning_set.filter(worker_name="Kim").exists())
+
+    def test_session_edit_keeps_concurrent_board_version(self):
+        def load_template_during_concurrent_move(key):
+            # 폼 검증 뒤 저장 전에 다른 사용자가 이동을 반영한 상황
+            WorkSession.objects.filter(id=self.session.id).update(board_version=5)
+            return [(SessionArea.POSITION_LEFT, "NEW")]
+
+        with mock.patch(
+            "manning.views._get_area_template_items",
+            side_effect=load_template_during_concurrent_move,
+        ):
+            self.client.post(
+                reverse("manning:update_session", args=[self.session.id]),
+                {
+                    "work_package_name": "A-Check",
+                    "aircraft_reg": "HL1234",
+                    "block_check": WorkSession.BLOCK_CHECK_1A,
+                    "shift_type": WorkSession.SHIFT_1,
+                    "area_template": "standard",
+                },
+            )
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.aircraft_reg, "HL1234")
+        self.assertEqual(self.session.board_version, 6)
+        self.assertEqual(
+            list(self.session.areas.values_list("name", flat=True)), ["NEW"]
+        )
+
+
+class ManhourSessionLinkTests(TestCase):
+    @override_settings(
+        STORAGES={
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {
+                "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+            },
+        }
+    )
+    def test_dashboard_links_matched_session_once(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        manhour_session = ManhourWorkSession.objects.create(
+            name="MH", site="SITE-A", link_key="HL7701"
+        )
+        ManhourGibunPriority.objects.create(
+            session=manhour_session, gibun="HL8802", order=2
+        )
+        session = WorkSession.objects.create(
+            name="S", site="SITE-A", aircraft_reg="HL-8802"
+        )
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+        url = reverse("manning:manning_dashboard", args=[session.id])
+
+        self.client.get(url)
+        session.refresh_from_db()
+        self.assertEqual(session.manhour_session_id, manhour_session.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        self.assertFalse(
+            any(
+                "manhour_gibunpriority" in query["sql"]
+                for query in ctx.captured_queries
+            )
+        )
+
+
+class CloneManningSessionTests(TestCase):
+    def setUp(self):
+        Workplace.objects.create(code="SITE-A", label="Site A")
+        self.manhour_session = ManhourWorkSession.objects.create(
+            name="MH", site="SITE-A", link_key="HL8001"
+        )
+        self.source = WorkSession.objects.create(
+            name="S",
+            site="SITE-A",
+            aircraft_reg="HL-8001",
+            shift_type=WorkSession.SHIFT_1,
+            special_note="견인 주의",
+        )
+        left = SessionArea.objects.create(session=self.source, name="L", ordering=1)
+        right = SessionArea.objects.create(
+            session=self.source, name="R", position=SessionArea.POSITION_RIGHT
+        )
+        Manning.objects.create(area=left, worker_name="Kim", hours=3)
+        Manning.objects.create(area=right, worker_name="Lee")
+        browser_session = self.client.session
+        browser_session["is_authenticated"] = True
+        browser_session["workplace"] = "SITE-A"
+        browser_session.save()
+
+    def test_clone_remaps_areas_and_links_manhour_session(self):
+        response = self.client.post(
+            reverse("manning:clone_session", args=[self.source.id])
+        )
+
+        clone = WorkSession.objects.exclude(id=self.source.id).get()
+        self.assertRedirects(
+            response,
+            reverse("manning:manning_dashboard", args=[clone.id]),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(clone.shift_type, WorkSession.SHIFT_2)
+        self.assertEqual(clone.special_note, "견인 주의")
+        self.assertEqual(clone.manhour_session_id, self.manhour_session.id)
+        self.assertEqual(
+            sorted(
+                Manning.objects.filter(area__session=clone).values_list(
+                    "area__name", "worker_name"
+                )
+            ),
+            [("L", "Kim"), ("R", "Lee")],
+        )
+        self.assertEqual(
+            Manning.objects.get(area__session=clone, worker_name="Kim").hours, 3
+        )
+
+    def test_clone_refuses_duplicate_active_shift(self):
+        self.client.post(reverse("manning:clone_session", args=[self.source.id]))
+        self.client.post(reverse("manning:clone_session", args=[self.source.id]))
+
+        self.assertEqual(WorkSession.objects.count(), 2)
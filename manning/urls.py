@@ -22,6 +22,11 @@ urlpatterns = [
         views.DeleteSessionView.as_view(),
         name="delete_session",
     ),
+    path(
+        "session/<int:session_id>/clone/",
+        views.CloneSessionView.as_view(),
+        name="clone_session",
+    ),
     path(
         "session/<int:session_id>/update/",
         views.UpdateSessionView.as_view(),
@@ -58,6 +63,11 @@ urlpatterns = [
         name="delete_area",
     ),
     path("manning/batch/", views.BatchManningView.as_view(), name="batch_manning"),
+    path(
+        "session/<int:session_id>/manning/moves/",
+        views.ApplyManningMovesView.as_view(),
+        name="apply_manning_moves",
+    ),
     path(
         "manning/<int:manning_id>/update-hours/",
         views.UpdateManningHoursView.as_view(),
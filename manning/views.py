@@ -1,4 +1,5 @@
 import json
+from datetime import timedelta
 
 from django.contrib import messages
 from django.db import transaction
@@ -7,16 +8,22 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views import View
 from django.http import Http404
+from django.utils import timezone
 from django.utils.html import escape
 
 from .forms import SessionAreaForm, WorkSessionCreateForm
-from django.db.models import Case, IntegerField, Sum, When
+from .services import clone_manning_session
+from django.db import IntegrityError
+from django.db.models import Case, F, IntegerField, When
 
+from manhour.caching import VersionedRegistry
 from manhour.models import Assignment as ManhourAssignment
 from manhour.models import DefaultWorkerDirectory
 from manhour.models import WorkSession as ManhourWorkSession
-from manhour.models import Worker as ManhourWorker
+from manhour.models import WorkerHourTotal
 from manhour.models import Workplace
+from manhour.session_links import find_manhour_session
+from manhour.worker_directory import get_workplace_worker_names
 from manhour.workplaces import get_workplace_label, normalize_workplace
 
 from .models import (
@@ -64,6 +71,12 @@ def _get_manning_or_404(request, manning_id):
     )
 
 
+def _bump_board_version(*session_ids):
+    WorkSession.objects.filter(id__in=session_ids).update(
+        board_version=F("board_version") + 1
+    )
+
+
 def ensure_default_areas(session):
     if session.areas.exists():
         return False
@@ -78,25 +91,18 @@ def ensure_default_areas(session):
 
 
 def _find_matching_manhour_session(manning_session, workplace=""):
-    qs = ManhourWorkSession.objects.all()
-    if workplace:
-        qs = qs.filter(site=workplace)
-
-    aircraft_reg = (manning_session.aircraft_reg or "").strip()
-    if aircraft_reg:
-        gibun_match = (
-            qs.filter(gibunpriority__gibun=aircraft_reg, is_active=True)
-            .order_by("-created_at")
-            .first()
-        )
-        if gibun_match:
-            return gibun_match
+    return find_manhour_session(manning_session, workplace=workplace)
+
 
-    if aircraft_reg:
-        qs = qs.filter(name__icontains=aircraft_reg)
-    if manning_session.work_package_name:
-        qs = qs.filter(name__icontains=manning_session.work_package_name)
-    return qs.order_by("-created_at").first()
+def _resolve_manhour_session(manning_session, workplace=""):
+    """연결된 manhour 세션을 돌려주고, 없으면 찾은 세션을 연결해 다음 조회를 줄입니다."""
+    if manning_session.manhour_session:
+        return manning_session.manhour_session
+    target = _find_matching_manhour_session(manning_session, workplace=workplace)
+    if target:
+        manning_session.manhour_session = target
+        manning_session.save(update_fields=["manhour_session"])
+    return target
 
 
 def _get_default_worker_directory(workplace):
@@ -136,49 +142,60 @@ def _resolve_workplace_key(workplace):
     )
 
 
-def _get_area_templates():
+def _normalize_template_items(items):
+    normalized = []
+    for position, name in items:
+        normalized.append(
+            (
+                (position or "").strip().upper(),
+                (name or "").strip().lower(),
+            )
+        )
+    return sorted(normalized)
+
+
+def _load_area_template_registry():
     templates = list(
         AreaTemplate.objects.filter(is_active=True)
         .prefetch_related("items")
         .order_by("sort_order", "id")
     )
-    if templates:
-        return templates
-    return []
+    choices = []
+    items_by_key = {}
+    key_by_signature = {}
+    for template in templates:
+        items = [(item.position, item.name) for item in template.items.all()]
+        choices.append({"key": template.key, "label": template.label})
+        items_by_key.setdefault(template.key.lower(), items)
+        # 정규화한 구역 구성 자체를 키로 써서 세션→템플릿 매칭을 dict 조회로 처리
+        signature = tuple(_normalize_template_items(items))
+        if signature:
+            key_by_signature.setdefault(signature, template.key)
+    return {
+        "choices": choices,
+        "items_by_key": items_by_key,
+        "key_by_signature": key_by_signature,
+    }
+
+
+_area_template_registry = VersionedRegistry(
+    "area_templates", _load_area_template_registry
+)
+
+
+def invalidate_area_templates():
+    _area_template_registry.invalidate()
 
 
 def _get_area_template_choices():
-    db_templates = _get_area_templates()
-    if db_templates:
-        return [
-            {"key": template.key, "label": template.label} for template in db_templates
-        ]
-    return []
+    return [dict(choice) for choice in _area_template_registry.get()["choices"]]
 
 
 def _get_area_template_items(template_key):
     if not template_key:
         return []
-
-    db_templates = _get_area_templates()
-    if db_templates:
-        for template in db_templates:
-            if template.key.lower() == template_key.lower():
-                return [(item.position, item.name) for item in template.items.all()]
-        return []
-    return []
-
-
-def _normalize_template_items(items):
-    normalized = []
-    for position, name in items:
-        normalized.append(
-            (
-                (position or "").strip().upper(),
-                (name or "").strip().lower(),
-            )
-        )
-    return sorted(normalized)
+    items = _area_template_registry.get()["items_by_key"].get(template_key.lower())
+    return list(items or [])
 
 
 def _resolve_session_template_key(session):
@@ -189,13 +206,8 @@ def _resolve_session_template_key(session):
     )
     if not session_items:
         return ""
-    for template in _get_area_templates():
-        template_items = _normalize_template_items(
-            [(item.position, item.name) for item in template.items.all()]
-        )
-        if template_items and template_items == session_items:
-            return template.key
-    return ""
+    key_by_signature = _area_template_registry.get()["key_by_signature"]
+    return key_by_signature.get(tuple(session_items), "")
 
 
 class ManningSessionRequiredMixin:
@@ -437,9 +449,10 @@ class UpdateSessionView(ManningSessionRequiredMixin, View):
         updated = form.save(commit=False)
         if not updated.name:
             updated.name = updated.work_package_name or "Maintenance Session"
-        updated.save()
-        if template_items:
-            with transaction.atomic():
+        with transaction.atomic():
+            # board_version은 _bump_board_version으로만 올리므로 저장 대상에서 제외
+            updated.save(update_fields=[*form._meta.fields, "name"])
+            if template_items:
                 SessionArea.objects.filter(session=session).delete()
                 SessionArea.objects.bulk_create(
                     [
@@ -447,13 +460,11 @@ class UpdateSessionView(ManningSessionRequiredMixin, View):
                         for position, name in template_items
                     ]
                 )
-        matched = _find_matching_manhour_session(updated, workplace=workplace)
-        if matched:
-            updated.manhour_session = matched
-            updated.save(update_fields=["manhour_session"])
-        elif updated.manhour_session_id:
-            updated.manhour_session = None
-            updated.save(update_fields=["manhour_session"])
+                _bump_board_version(session.id)
+            matched = _find_matching_manhour_session(updated, workplace=workplace)
+            if matched or updated.manhour_session_id:
+                updated.manhour_session = matched
+                updated.save(update_fields=["manhour_session"])
         # messages.success(request, "세션 정보가 수정되었습니다.")
         return redirect("manning:manning_list")
 
@@ -571,67 +582,70 @@ class TemplateEditorView(ManningSessionRequiredMixin, View):
                 parsed.append((position, name, idx))
             return parsed
 
+        def to_int(value, default=None):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return default
+
         try:
             with transaction.atomic():
-                for idx, raw_id in enumerate(template_ids):
+                numeric_ids = {
+                    template_id
+                    for template_id in (to_int(raw_id) for raw_id in template_ids)
+                    if template_id is not None
+                }
+                templates_by_id = AreaTemplate.objects.in_bulk(numeric_ids)
+                delete_template_ids = set()
+                updated_templates = {}
+                desired_items = {}
+
+                for raw_id in template_ids:
+                    template = templates_by_id.get(to_int(raw_id))
                     if raw_id in delete_ids:
-                        AreaTemplate.objects.filter(id=raw_id).delete()
+                        if template:
+                            delete_template_ids.add(template.id)
                         continue
 
                     key = (existing_value("template_key", raw_id) or "").strip()
                     label = (
                         existing_value("template_label", raw_id) or ""
                     ).strip() or key
-                    try:
-                        order = int(existing_value("template_order", raw_id, 0))
-                    except (TypeError, ValueError):
-                        order = 0
-                    if not key:
-                        continue
-
-                    template = AreaTemplate.objects.filter(id=raw_id).first()
-                    if not template:
+                    if not key or not template:
                         continue
 
                     template.key = key
                     template.label = label
-                    template.sort_order = order
+                    template.sort_order = to_int(
+                        existing_value("template_order", raw_id, 0), 0
+                    )
                     template.is_active = True
-                    template.save()
-
-                    AreaTemplateItem.objects.filter(template=template).delete()
-                    for position, name, order_idx in parse_items(
-                        left_text=existing_value("template_left_items", raw_id, None),
-                        none_text=existing_value("template_none_items", raw_id, None),
-                        right_text=existing_value("template_right_items", raw_id, None),
-                    ):
-                        AreaTemplateItem.objects.create(
-                            template=template,
-                            position=position,
-                            name=name,
-                            sort_order=order_idx,
-                        )
+                    updated_templates[template.id] = template
+                    desired_items[template.id] = (
+                        template,
+                        parse_items(
+                            left_text=existing_value(
+                                "template_left_items", raw_id, None
+                            ),
+                            none_text=existing_value(
+                                "template_none_items", raw_id, None
+                            ),
+                            right_text=existing_value(
+                                "template_right_items", raw_id, None
+                            ),
+                        ),
+                    )
 
+                new_entries = []
                 for idx, raw_key in enumerate(new_keys):
                     key = (raw_key or "").strip()
                     if not key:
                         continue
                     label = (new_labels[idx] or "").strip() or key
-                    try:
-                        order = int(new_orders[idx])
-                    except (TypeError, ValueError, IndexError):
-                        order = 0
-
-                    template, _ = AreaTemplate.objects.update_or_create(
-                        key=key,
-                        defaults={
-                            "label": label,
-                            "sort_order": order,
-                            "is_active": True,
-                        },
+                    order = to_int(
+                        new_orders[idx] if idx < len(new_orders) else None, 0
                     )
-                    AreaTemplateItem.objects.filter(template=template).delete()
-                    for position, name, order_idx in parse_items(
+                    items = parse_items(
                         left_text=(
                             new_left_items[idx] if idx < len(new_left_items) else None
                         ),
@@ -641,13 +655,90 @@ class TemplateEditorView(ManningSessionRequiredMixin, View):
                         right_text=(
                             new_right_items[idx] if idx < len(new_right_items) else None
                         ),
-                    ):
-                        AreaTemplateItem.objects.create(
+                    )
+                    new_entries.append((key, label, order, items))
+
+                # 새 key가 이미 있으면 기존 템플릿을 갱신 (update_or_create와 동일)
+                # 같은 요청에서 수정된 템플릿은 바뀐 key 기준으로 합치고,
+                # 삭제되거나 key가 다른 값으로 바뀌는 템플릿의 key는 새로 만듦
+                templates_by_key = {
+                    key: template
+                    for key, template in AreaTemplate.objects.in_bulk(
+                        [entry[0] for entry in new_entries], field_name="key"
+                    ).items()
+                    if template.id not in delete_template_ids
+                    and template.id not in updated_templates
+                }
+                templates_by_key.update(
+                    (template.key, template) for template in updated_templates.values()
+                )
+                created_templates = []
+                created_items = []
+                for key, label, order, items in new_entries:
+                    template = templates_by_key.get(key)
+                    if template is None:
+                        template = AreaTemplate(key=key)
+                        created_templates.append(template)
+                        created_items.append((template, items))
+                    else:
+                        updated_templates[template.id] = template
+                        desired_items[template.id] = (template, items)
+                    template.label = label
+                    template.sort_order = order
+                    template.is_active = True
+
+                if delete_template_ids:
+                    AreaTemplate.objects.filter(id__in=delete_template_ids).delete()
+                if updated_templates:
+                    AreaTemplate.objects.bulk_update(
+                        updated_templates.values(),
+                        ["key", "label", "sort_order", "is_active"],
+                    )
+                if created_templates:
+                    AreaTemplate.objects.bulk_create(created_templates)
+
+                # 기존 항목을 순서대로 재사용하고, 남는 항목은 삭제 / 모자란 항목만 추가
+                existing_items = {}
+                for item in AreaTemplateItem.objects.filter(
+                    template_id__in=desired_items
+                ).order_by("template_id", "sort_order", "id"):
+                    existing_items.setdefault(item.template_id, []).append(item)
+
+                items_to_create = []
+                items_to_update = []
+                item_ids_to_delete = []
+                for template, items in [*desired_items.values(), *created_items]:
+                    current = existing_items.get(template.pk, [])
+                    for item, (position, name, order_idx) in zip(current, items):
+                        if (item.position, item.name, item.sort_order) != (
+                            position,
+                            name,
+                            order_idx,
+                        ):
+                            item.position = position
+                            item.name = name
+                            item.sort_order = order_idx
+                            items_to_update.append(item)
+                    item_ids_to_delete.extend(item.id for item in current[len(items) :])
+                    items_to_create.extend(
+                        AreaTemplateItem(
                             template=template,
                             position=position,
                             name=name,
                             sort_order=order_idx,
                         )
+                        for position, name, order_idx in items[len(current) :]
+                    )
+
+                if item_ids_to_delete:
+                    AreaTemplateItem.objects.filter(id__in=item_ids_to_delete).delete()
+                if items_to_update:
+                    AreaTemplateItem.objects.bulk_update(
+                        items_to_update, ["position", "name", "sort_order"]
+                    )
+                if items_to_create:
+                    AreaTemplateItem.objects.bulk_create(items_to_create)
+            invalidate_area_templates()
 
             # messages.success(request, "템플릿이 저장되었습니다.")
             return redirect("manning:template_editor")
@@ -666,6 +757,39 @@ class DeleteSessionView(ManningSessionRequiredMixin, View):
         return redirect("manning:manning_list")
 
 
+class CloneSessionView(ManningSessionRequiredMixin, View):
+    # 교대 인계: 구역/배치 인원/메모를 다음 근무 형태 세션으로 복사
+    http_method_names = ["post"]
+
+    def post(self, request, session_id):
+        source = _get_session_or_404(request, session_id)
+        shift_codes = [code for code, _label in WorkSession.SHIFT_CHOICES]
+        shift_type = (request.POST.get("shift_type") or "").strip()
+        if shift_type not in shift_codes:
+            current = (
+                shift_codes.index(source.shift_type)
+                if source.shift_type in shift_codes
+                else -1
+            )
+            shift_type = shift_codes[(current + 1) % len(shift_codes)]
+
+        if WorkSession.objects.filter(
+            is_active=True,
+            site=source.site,
+            aircraft_reg=source.aircraft_reg,
+            block_check=source.block_check,
+            shift_type=shift_type,
+        ).exists():
+            messages.error(
+                request,
+                "같은 기번/A-Check/Shift로 이미 활성 세션이 있습니다.",
+            )
+            return redirect("manning:manning_list")
+
+        session = clone_manning_session(source, shift_type=shift_type)
+        return redirect("manning:manning_dashboard", session_id=session.id)
+
+
 class ManningDashboardView(ManningSessionRequiredMixin, View):
     def get(self, request, session_id):
         workplace = _get_current_workplace(request)
@@ -689,24 +813,15 @@ class ManningDashboardView(ManningSessionRequiredMixin, View):
         none_names = set()
         right_names = set()
         target_workplace = session.site or workplace
-        manhour_session = session.manhour_session or _find_matching_manhour_session(
-            session,
-            workplace=target_workplace,
-        )
+        manhour_session = _resolve_manhour_session(session, workplace=target_workplace)
         manhour_hours = {}
-        has_assignments = False
         if manhour_session:
-            has_assignments = ManhourAssignment.objects.filter(
-                work_item__session=manhour_session
-            ).exists()
-            manhour_hours = {
-                row["worker__name"]: float(row["total"] or 0)
-                for row in ManhourAssignment.objects.filter(
-                    work_item__session=manhour_session
+            manhour_hours = dict(
+                WorkerHourTotal.objects.filter(session=manhour_session).values_list(
+                    "worker_name", "total_mh"
                 )
-                .values("worker__name")
-                .annotate(total=Sum("allocated_mh"))
-            }
+            )
+        has_assignments = bool(manhour_hours)
 
         for area in session_areas:
             for manning in area.manning_set.all():
@@ -717,12 +832,13 @@ class ManningDashboardView(ManningSessionRequiredMixin, View):
                     right_names.add(manning.worker_name)
                 else:
                     none_names.add(manning.worker_name)
-        worker_names = (
-            ManhourWorker.objects.filter(session__site=target_workplace)
-            .values_list("name", flat=True)
-            .distinct()
-            .order_by("name")
+        worker_days = request.GET.get("worker_days", "")
+        worker_since = (
+            timezone.now() - timedelta(days=int(worker_days))
+            if worker_days.isdigit()
+            else None
         )
+        worker_names = get_workplace_worker_names(target_workplace, since=worker_since)
         all_workers = [{"name": name} for name in worker_names]
         is_same_site = (session.site or workplace) == workplace
         return render(
@@ -747,19 +863,11 @@ class AssignmentRedirectView(ManningSessionRequiredMixin, View):
         workplace = _get_current_workplace(request)
         manning_session = _get_session_or_404(request, session_id)
         target_workplace = manning_session.site or workplace
-        target = manning_session.manhour_session
-        if not target:
-            target = _find_matching_manhour_session(
-                manning_session,
-                workplace=target_workplace,
-            )
-            if target:
-                manning_session.manhour_session = target
-                manning_session.save(update_fields=["manhour_session"])
+        target = _resolve_manhour_session(manning_session, workplace=target_workplace)
         if not target:
             messages.error(
                 request,
-                "manhour 세션을 찾지 못했습니다. 이름에 기번/작업패키지를 포함하세요.",
+                "manhour 세션을 찾지 못했습니다. 등록번호와 같은 기번의 세션을 만드세요.",
             )
             return redirect("manning:manning_dashboard", session_id=session_id)
         if not ManhourAssignment.objects.filter(work_item__session=target).exists():
@@ -774,7 +882,8 @@ class PopulateAreasView(ManningSessionRequiredMixin, View):
 
     def post(self, request, session_id):
         session = _get_session_or_404(request, session_id)
-        ensure_default_areas(session)
+        if ensure_default_areas(session):
+            _bump_board_version(session.id)
         return redirect("manning:manning_dashboard", session_id=session.id)
 
 
@@ -788,6 +897,7 @@ class AddAreaView(ManningSessionRequiredMixin, View):
             area = form.save(commit=False)
             area.session = session
             area.save()
+            _bump_board_version(session.id)
             # messages.success(request, "새 구역이 추가되었습니다.")
         else:
             messages.error(request, "구역 추가에 실패했습니다. 입력값을 확인해주세요.")
@@ -802,6 +912,7 @@ class UpdateAreaView(ManningSessionRequiredMixin, View):
         form = SessionAreaForm(request.POST, instance=area)
         if form.is_valid():
             form.save()
+            _bump_board_version(area.session_id)
             if request.headers.get("x-requested-with") == "XMLHttpRequest":
                 return JsonResponse({"status": "success"})
             # messages.success(request, "구역 정보가 수정되었습니다.")
@@ -821,6 +932,7 @@ class DeleteAreaView(ManningSessionRequiredMixin, View):
         area = _get_area_or_404(request, area_id)
         session_id = area.session_id
         area.delete()
+        _bump_board_version(session_id)
         # messages.success(request, "구역이 삭제되었습니다.")
         return redirect("manning:manning_dashboard", session_id=session_id)
 
@@ -836,28 +948,183 @@ class BatchManningView(ManningSessionRequiredMixin, View):
                 {"status": "error", "message": "Invalid payload"}, status=400
             )
 
-        area_id = payload.get("area_id")
-        worker_names = payload.get("worker_names") or []
-        if not area_id or not isinstance(worker_names, list):
+        # 단일 구역 {"area_id", "worker_names"} 또는
+        # 여러 구역 {"placements": [{"area_id", "worker_names"}, ...]} 형식
+        placements = payload.get("placements")
+        if placements is None:
+            placements = [payload]
+        if not isinstance(placements, list) or not placements:
             return JsonResponse(
                 {"status": "error", "message": "Invalid data"}, status=400
             )
 
-        area = _get_area_or_404(request, area_id)
-        cleaned = [name.strip() for name in worker_names if name and name.strip()]
-
-        if not cleaned:
+        names_by_area = {}
+        for placement in placements:
+            if not isinstance(placement, dict):
+                return JsonResponse(
+                    {"status": "error", "message": "Invalid data"}, status=400
+                )
+            area_id = placement.get("area_id")
+            worker_names = placement.get("worker_names") or []
+            if not area_id or not isinstance(worker_names, list):
+                return JsonResponse(
+                    {"status": "error", "message": "Invalid data"}, status=400
+                )
+            try:
+                area_id = int(area_id)
+            except (TypeError, ValueError):
+                raise Http404
+            names = names_by_area.setdefault(area_id, [])
+            for name in worker_names:
+                name = (name or "").strip() if isinstance(name, str) else ""
+                if name and name not in names:
+                    names.append(name)
+
+        if not any(names_by_area.values()):
             return JsonResponse(
                 {"status": "error", "message": "No workers"}, status=400
             )
 
-        existing = {manning.worker_name: manning for manning in area.manning_set.all()}
-        for name in cleaned:
-            if name in existing:
-                continue
-            Manning.objects.create(area=area, worker_name=name, hours=0)
+        area_ids = set(
+            SessionArea.objects.filter(
+                id__in=names_by_area,
+                session__site=_get_current_workplace(request),
+            ).values_list("id", flat=True)
+        )
+        if area_ids != set(names_by_area):
+            raise Http404
 
-        return JsonResponse({"status": "success"})
+        existing = set(
+            Manning.objects.filter(area_id__in=area_ids).values_list(
+                "area_id", "worker_name"
+            )
+        )
+        inserted = {str(area_id): [] for area_id in names_by_area}
+        new_rows = []
+        for area_id, names in names_by_area.items():
+            for name in names:
+                if (area_id, name) in existing:
+                    continue
+                inserted[str(area_id)].append(name)
+                new_rows.append(Manning(area_id=area_id, worker_name=name, hours=0))
+
+        # 동시에 같은 인원을 끌어다 놓아도 unique 제약 충돌 없이 한 번만 들어가도록
+        Manning.objects.bulk_create(new_rows, ignore_conflicts=True)
+        if new_rows:
+            _bump_board_version(
+                *SessionArea.objects.filter(id__in=area_ids)
+                .values_list("session_id", flat=True)
+                .distinct()
+            )
+
+        return JsonResponse({"status": "success", "inserted": inserted})
+
+
+class ApplyManningMovesView(ManningSessionRequiredMixin, View):
+    """
+    {"version": n, "moves": [{"worker_name", "from_area", "to_area"}, ...]}
+    보드 버전이 일치할 때만 Manning.area_id를 목적지 구역별 UPDATE로 옮깁니다.
+    """
+
+    http_method_names = ["post"]
+
+    @staticmethod
+    def _conflict(current_version):
+        return JsonResponse(
+            {
+                "status": "conflict",
+                "message": "다른 사용자가 보드를 먼저 수정했습니다.",
+                "version": current_version,
+            },
+            status=409,
+        )
+
+    def post(self, request, session_id):
+        session = _get_session_or_404(request, session_id)
+        try:
+            payload = json.loads(request.body.decode("utf-8"))
+        except json.JSONDecodeError:
+            return JsonResponse(
+                {"status": "error", "message": "Invalid payload"}, status=400
+            )
+
+        moves = payload.get("moves") if isinstance(payload, dict) else None
+        version = payload.get("version") if isinstance(payload, dict) else None
+        if not isinstance(moves, list) or not moves or not isinstance(version, int):
+            return JsonResponse(
+                {"status": "error", "message": "Invalid data"}, status=400
+            )
+
+        parsed = []
+        for move in moves:
+            try:
+                name = (move.get("worker_name") or "").strip()
+                from_area = int(move.get("from_area"))
+                to_area = int(move.get("to_area"))
+            except (AttributeError, TypeError, ValueError):
+                return JsonResponse(
+                    {"status": "error", "message": "Invalid move"}, status=400
+                )
+            if not name:
+                return JsonResponse(
+                    {"status": "error", "message": "Invalid move"}, status=400
+                )
+            if from_area != to_area:
+                parsed.append((name, from_area, to_area))
+
+        if session.board_version != version:
+            return self._conflict(session.board_version)
+
+        area_ids = {area_id for _, src, dst in parsed for area_id in (src, dst)}
+        if len(area_ids) != session.areas.filter(id__in=area_ids).count():
+            raise Http404
+
+        rows = {
+            (manning.area_id, manning.worker_name): manning.id
+            for manning in Manning.objects.filter(
+                area_id__in={src for _, src, _ in parsed},
+                worker_name__in={name for name, _, _ in parsed},
+            ).only("id", "area_id", "worker_name")
+        }
+        ids_by_destination = {}
+        for name, src, dst in parsed:
+            manning_id = rows.get((src, name))
+            if manning_id is None:
+                return JsonResponse(
+                    {
+                        "status": "error",
+                        "message": f"{name}: 원래 구역에 배치되어 있지 않습니다.",
+                    },
+                    status=400,
+                )
+            ids_by_destination.setdefault(dst, []).append(manning_id)
+
+        try:
+            with transaction.atomic():
+                claimed = WorkSession.objects.filter(
+                    id=session.id, board_version=version
+                ).update(board_version=F("board_version") + 1)
+                if not claimed:
+                    session.refresh_from_db(fields=["board_version"])
+                    return self._conflict(session.board_version)
+                for dst, manning_ids in ids_by_destination.items():
+                    Manning.objects.filter(id__in=manning_ids).update(area_id=dst)
+        except IntegrityError:
+            return JsonResponse(
+                {
+                    "status": "error",
+                    "message": "이미 목적지 구역에 배치된 인원이 있습니다.",
+                },
+                status=400,
+            )
+
+        return JsonResponse(
+            {
+                "status": "success",
+                "moved": sum(len(ids) for ids in ids_by_destination.values()),
+                "version": version + 1,
+            }
+        )
 
 
 class UpdateManningHoursView(ManningSessionRequiredMixin, View):
@@ -898,6 +1165,7 @@ class AreaBulkEditView(ManningSessionRequiredMixin, View):
         )
         worker_names = _get_worker_directory(session)
         default_worker_names = _get_default_worker_directory(workplace)
+        known_worker_names = get_workplace_worker_names(workplace)
 
         def memo_to_text(value):
             return (
@@ -927,6 +1195,7 @@ class AreaBulkEditView(ManningSessionRequiredMixin, View):
                 "session_areas": session_areas,
                 "worker_names": list(worker_names),
                 "default_worker_names": list(default_worker_names),
+                "known_worker_names": known_worker_names,
                 "memo_values": memo_values,
                 "errors": [],
             },
@@ -1048,10 +1317,29 @@ class AreaBulkEditView(ManningSessionRequiredMixin, View):
                     "special_note",
                 ]
             )
+            # 세션의 구역/배치 인원을 한 번에 읽어 두고 차이만 일괄 반영
+            areas_by_id = {
+                str(area.id): area
+                for area in session.areas.prefetch_related("manning_set")
+            }
+            if any(str(area_id) not in areas_by_id for area_id in area_ids):
+                raise Http404
+
+            def split_names(text):
+                return list(
+                    dict.fromkeys(
+                        name.strip() for name in (text or "").split(",") if name.strip()
+                    )
+                )
+
+            areas_to_delete = set()
+            areas_to_update = {}
+            mannings_to_delete = []
+            mannings_to_create = []
             for idx, area_id in enumerate(area_ids):
-                area = _get_area_or_404(request, area_id, session=session)
+                area = areas_by_id[str(area_id)]
                 if str(area_id) in delete_ids:
-                    area.delete()
+                    areas_to_delete.add(area.id)
                     continue
 
                 area.name = (area_names[idx] or "").strip()
@@ -1066,31 +1354,28 @@ class AreaBulkEditView(ManningSessionRequiredMixin, View):
                 if not area.name:
                     errors.append("구역 이름은 비워둘 수 없습니다.")
                 else:
-                    area.save()
-
-                names = []
-                if idx < len(area_workers):
-                    names = [
-                        name.strip()
-                        for name in area_workers[idx].split(",")
-                        if name.strip()
-                    ]
+                    areas_to_update[area.id] = area
 
+                names = split_names(
+                    area_workers[idx] if idx < len(area_workers) else ""
+                )
                 existing = {
                     manning.worker_name: manning for manning in area.manning_set.all()
                 }
                 desired = set(names)
-                for name, manning_obj in existing.items():
-                    if name not in desired:
-                        manning_obj.delete()
-                for name in names:
-                    if name not in existing:
-                        Manning.objects.create(
-                            area=area,
-                            worker_name=name,
-                            hours=0,
-                        )
+                mannings_to_delete.extend(
+                    manning_obj.id
+                    for name, manning_obj in existing.items()
+                    if name not in desired
+                )
+                mannings_to_create.extend(
+                    Manning(area=area, worker_name=name, hours=0)
+                    for name in names
+                    if name not in existing
+                )
 
+            new_areas = []
+            new_area_workers = []
             for idx, new_name in enumerate(new_names):
                 if not new_name.strip():
                     continue
@@ -1105,18 +1390,45 @@ class AreaBulkEditView(ManningSessionRequiredMixin, View):
                         ordering = int(new_orders[idx])
                     except (TypeError, ValueError):
                         ordering = 0
-                area = SessionArea.objects.create(
-                    session=session,
-                    name=new_name.strip(),
-                    position=position,
-                    ordering=ordering,
+                new_areas.append(
+                    SessionArea(
+                        session=session,
+                        name=new_name.strip(),
+                        position=position,
+                        ordering=ordering,
+                    )
                 )
-                workers_text = new_workers[idx] if idx < len(new_workers) else ""
-                worker_list = [
-                    name.strip() for name in workers_text.split(",") if name.strip()
-                ]
-                for name in worker_list:
-                    Manning.objects.create(area=area, worker_name=name, hours=0)
+                new_area_workers.append(
+                    split_names(new_workers[idx] if idx < len(new_workers) else "")
+                )
+
+            if areas_to_delete:
+                SessionArea.objects.filter(id__in=areas_to_delete).delete()
+            areas_to_update = [
+                area
+                for area_id, area in areas_to_update.items()
+                if area_id not in areas_to_delete
+            ]
+            if areas_to_update:
+                SessionArea.objects.bulk_update(
+                    areas_to_update, ["name", "position", "ordering"]
+                )
+            if mannings_to_delete:
+                Manning.objects.filter(id__in=mannings_to_delete).delete()
+            if new_areas:
+                SessionArea.objects.bulk_create(new_areas)
+                for area, names in zip(new_areas, new_area_workers):
+                    mannings_to_create.extend(
+                        Manning(area=area, worker_name=name, hours=0) for name in names
+                    )
+            mannings_to_create = [
+                manning
+                for manning in mannings_to_create
+                if manning.area.id not in areas_to_delete
+            ]
+            if mannings_to_create:
+                Manning.objects.bulk_create(mannings_to_create)
+            _bump_board_version(session.id)
 
         if errors:
             messages.error(request, "수정 중 일부 문제가 발생했습니다.")
@@ -389,7 +389,8 @@ document.addEventListener("DOMContentLoaded", function () {
         if (!url) return;
 
         try {
-            const response = await fetch(url);
+            // no-cache: 브라우저가 ETag로 재검증해 바뀌지 않았으면 304만 받음
+            const response = await fetch(url, { cache: "no-cache" });
 
             if (!response.ok) {
                 throw new Error("Dashboard API Error");
@@ -614,7 +615,7 @@ document.addEventListener("DOMContentLoaded", function () {
                 method: "GET",
                 headers: { "X-Requested-With": "XMLHttpRequest" },
                 credentials: "same-origin",
-                cache: "no-store",
+                cache: "no-cache",
             });
 
             if (!response.ok) {
@@ -960,7 +961,7 @@ document.addEventListener("DOMContentLoaded", function () {
                     "X-Requested-With": "XMLHttpRequest",
                 },
                 credentials: "same-origin",
-                cache: "no-store",
+                cache: "no-cache",
             });
 
             if (!response.ok) {
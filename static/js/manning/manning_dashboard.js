@@ -0,0 +1,91 @@
+document.addEventListener("DOMContentLoaded", () => {
+    const board = document.querySelector("[data-moves-url]");
+    if (!board || typeof Sortable === "undefined") return;
+
+    const config = window.MANNING_CONFIG || {};
+    const isMobileDevice = () =>
+        window.matchMedia("(max-width: 991.98px)").matches;
+    if (isMobileDevice()) return;
+
+    let saving = false;
+
+    function updateAreaCount(list) {
+        const card = list.closest(".area-card");
+        const badge = card ? card.querySelector(".area-badge") : null;
+        const count = list.querySelectorAll(".manning-row").length;
+        if (badge) badge.textContent = `${count}명`;
+
+        const emptyState = list.querySelector(".empty-state");
+        if (emptyState) emptyState.classList.toggle("d-none", count > 0);
+    }
+
+    async function applyMove(event) {
+        const workerName = event.item.dataset.workerName || "";
+        const response = await fetch(board.dataset.movesUrl, {
+            method: "POST",
+            headers: {
+                "Content-Type": "application/json",
+                "X-CSRFToken": config.csrfToken || "",
+            },
+            credentials: "same-origin",
+            body: JSON.stringify({
+                version: Number(board.dataset.boardVersion),
+                moves: [
+                    {
+                        worker_name: workerName,
+                        from_area: event.from.dataset.areaId,
+                        to_area: event.to.dataset.areaId,
+                    },
+                ],
+            }),
+        });
+
+        let payload = null;
+        try {
+            payload = await response.json();
+        } catch (error) {
+            payload = null;
+        }
+
+        // 다른 사용자가 먼저 보드를 바꿨으면 최신 배치를 다시 불러옴
+        if (response.status === 409) {
+            alert(
+                `${payload?.message || "보드가 변경되었습니다."}\n최신 배치를 다시 불러옵니다.`,
+            );
+            window.location.reload();
+            return;
+        }
+        if (!response.ok || !payload || payload.status !== "success") {
+            throw new Error(
+                payload?.message || `save failed (${response.status})`,
+            );
+        }
+
+        board.dataset.boardVersion = payload.version;
+        updateAreaCount(event.from);
+        updateAreaCount(event.to);
+    }
+
+    board.querySelectorAll(".manning-items[data-area-id]").forEach((list) => {
+        new Sortable(list, {
+            group: "manning",
+            draggable: ".manning-row",
+            filter: "input",
+            preventOnFilter: false,
+            animation: 150,
+            onMove: () => !saving,
+            onEnd: async (event) => {
+                if (event.from === event.to) return;
+                saving = true;
+                try {
+                    await applyMove(event);
+                } catch (error) {
+                    alert(`인원 이동 저장에 실패했습니다.\n${error.message}`);
+                    window.location.reload();
+                } finally {
+                    saving = false;
+                }
+            },
+        });
+    });
+});
@@ -0,0 +1,52 @@
+import os
+import django
+import sys
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# ensure project root is on sys.path when invoked from tools/
+sys.path.insert(0, os.getcwd())
+
+django.setup()
+
+from unittest import mock
+
+from django.test.utils import override_settings
+
+from manhour.indicator_stub import IndicatorStubServer
+from manhour.indicators import indicator_jobs, refresh_due_indicators
+
+# usage: python tools/bench_indicators.py [delay_seconds] [rounds]
+delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.2
+rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+# 운영 캐시(cache.sqlite3)와 IndicatorSample 테이블에 스텁 값이 남지 않도록
+# 벤치마크 동안에는 프로세스 메모리 캐시를 쓰고 시계열 기록은 건너뜁니다.
+BENCH_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bench-indicators',
+    }
+}
+
+with IndicatorStubServer(delay=delay) as stub, override_settings(
+    CACHES=BENCH_CACHES
+), mock.patch('manhour.indicators.record_indicator_samples', return_value=0):
+    with override_settings(**stub.settings_overrides()):
+        jobs = indicator_jobs()
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for fetcher, _interval in jobs.values():
+                fetcher()
+        sequential = (time.perf_counter() - started) / rounds
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            refresh_due_indicators(force=True)
+        parallel = (time.perf_counter() - started) / rounds
+
+print(f"providers={len(jobs)} delay={delay}s rounds={rounds}")
+print(f"sequential: {sequential:.3f}s/round")
+print(f"parallel:   {parallel:.3f}s/round")
+print(f"requests={stub.request_count} connections={stub.connection_count}")